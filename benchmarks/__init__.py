@@ -0,0 +1,5 @@
+"""Performance benchmarks for the engine.
+
+These are *not* unit tests. They measure the pipeline so regressions show up as
+numbers; tests/ wraps the ones that enforce a recorded budget.
+"""
@@ -0,0 +1,60 @@
+"""Microbenchmark: Sutherland-Hodgman vs convex_intersection for convex pairs.
+
+    python -m benchmarks.convex_clip [--sizes 4,8,16,32,64,128] [--repeat 200]
+
+For each size n, clips a regular n-gon subject against a rotated, offset regular
+n-gon clipper (so they overlap partially and every clipper edge cuts) with
+engine.geom.clip_prepared and with convex_intersection, and prints microseconds
+per clip for both plus the n*n product, to place CONVEX_KERNEL_MIN_PRODUCT.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+
+def regular_polygon(n: int, r: float, cx: float = 0.0, cy: float = 0.0, rot: float = 0.0) -> list[tuple[float, float]]:
+    return [(cx + r * math.cos(rot + 2 * math.pi * k / n), cy + r * math.sin(rot + 2 * math.pi * k / n)) for k in range(n)]
+
+
+def measure(n: int, repeat: int = 200) -> dict:
+    from engine.geom import clip_prepared, convex_intersection, prepare_convex_clipper
+
+    subject = regular_polygon(n, 50.0)
+    clipper = regular_polygon(n, 50.0, 20.0, 10.0, math.pi / n / 2)
+    prepared = prepare_convex_clipper(clipper)
+    if convex_intersection(subject, clipper) is None:
+        raise RuntimeError(f"degenerate benchmark pair for n={n}")
+
+    def per_call(fn) -> float:
+        best = math.inf
+        for _ in range(3):
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                fn()
+            best = min(best, (time.perf_counter() - t0) / repeat)
+        return round(best * 1e6, 2)
+
+    return {
+        "n": n,
+        "product": n * n,
+        "sutherland_hodgman_us": per_call(lambda: clip_prepared(subject, prepared)),
+        "convex_intersection_us": per_call(lambda: convex_intersection(subject, clipper)),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.convex_clip", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="4,8,12,16,24,32,64,128")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+    print(f"{'n':>5} {'n*n':>7} {'SH us':>10} {'convex us':>10}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        m = measure(n, args.repeat)
+        print(f"{m['n']:>5} {m['product']:>7} {m['sutherland_hodgman_us']:>10.1f} {m['convex_intersection_us']:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+"""Memory/time benchmark for one large distribute_evenly_between.
+
+    python -m benchmarks.distribution [--count 10000] [--lazy]
+
+Builds (build_scene only) a scene with two posts and one template distributed
+`--count` times, and reports wall time plus, from a separate tracemalloc run, the
+peak traced memory and the blocks/bytes still allocated once the resolved scene
+is built. `--lazy` builds with lazy_arrays=True (see engine.instances).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+
+def distribution_scene(count: int) -> dict:
+    def post(obj_id: str, x: float) -> dict:
+        return {
+            "id": obj_id,
+            "prototype": "poly_extrude",
+            "params": {"footprint": [[x, 0], [x + 2, 0], [x + 2, 2], [x, 2]], "extrusion": {"z_base": 0, "height": 4}},
+        }
+
+    return {
+        "anchor_id": "A",
+        "objects": [
+            post("A", 0.0),
+            post("B", 1000.0),
+            {
+                "id": "T",
+                "role": "template",
+                "prototype": "dim_lumber_member",
+                "params": {
+                    "profile": {"id": "2x4"},
+                    "orientation": {"wide_face": "down"},
+                    "placement": {"direction": "north", "length": 10},
+                    "z_base": 0,
+                },
+            },
+        ],
+        "operators": [
+            {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["A", "B"],
+             "count": count, "id_prefix": "S"},
+        ],
+    }
+
+
+def measure(count: int = 10000, repeat: int = 3, lazy: bool = False) -> dict:
+    from engine.registry import load_registries
+    from engine.run import _bundle_root
+    from engine.scene import build_scene, warm_registries
+
+    registries = load_registries(_bundle_root())
+    warm_registries(registries)
+    scene = distribution_scene(count)
+    build_scene(scene, registries, lazy_arrays=lazy)  # warm caches
+
+    wall = []
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        build_scene(scene, registries, lazy_arrays=lazy)
+        wall.append((time.perf_counter() - t0) * 1000.0)
+
+    tracemalloc.start()
+    try:
+        before_blocks = len(tracemalloc.take_snapshot().traces)
+        before, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        resolved = build_scene(scene, registries, lazy_arrays=lazy)
+        current, peak = tracemalloc.get_traced_memory()
+        after_blocks = len(tracemalloc.take_snapshot().traces)
+    finally:
+        tracemalloc.stop()
+    assert len(resolved["objects"]) == count + 2
+    return {
+        "count": count,
+        "lazy": lazy,
+        "wall_ms": round(min(wall), 3),
+        "peak_kb": round((peak - before) / 1024.0, 1),
+        "retained_kb": round((current - before) / 1024.0, 1),
+        "retained_blocks": after_blocks - before_blocks,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.distribution", description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--lazy", action="store_true", help="Build with lazy_arrays=True")
+    args = parser.parse_args(argv)
+    m = measure(args.count, args.repeat, args.lazy)
+    print(
+        f"count={m['count']}{' lazy' if m['lazy'] else ''} wall={m['wall_ms']:.1f}ms peak={m['peak_kb']:.0f}KiB "
+        f"retained={m['retained_kb']:.0f}KiB in {m['retained_blocks']} blocks"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,197 @@
+"""Seeded synthetic scene generator for scaling benchmarks.
+
+    from benchmarks.generate import generate_scene
+    scene = generate_scene(1000, kind="internal", seed=0)
+
+Scenes are built around one `regular_octagon_boundary` ("Octagon", 167in flat to
+flat) and contain, for size N:
+
+  - N `dim_lumber_member` members inside the octagon
+  - N // array_every `distribute_evenly_between` arrays of `array_count` instances,
+    each spread between two posts
+  - N // clip_every `clip_to_object` operators clipping members against the octagon
+  - N // trim_every `extend_and_trim_to_object` operators trimming an east-running
+    member against a post
+
+`kind="internal"` places members directly (placement.start/direction/length);
+`kind="constraints"` places them with placement_constraints so the constraints
+compiler is exercised too. The same (n, kind, seed, ratios) always produces the
+same scene.
+
+    python -m benchmarks.generate 1000 --kind constraints --seed 1 > scene.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+
+SPAN = 167.0
+# Half the flat-to-flat span; members are kept inside this radius so clips and
+# ray hits against the octagon behave like real layouts.
+_R = SPAN / 2.0
+_WALL = SPAN * math.tan(math.pi / 8.0)
+_DIRECTIONS = ("east", "west", "north", "south", "northeast", "northwest", "southeast", "southwest")
+_PROFILES = ("2x4", "2x6", "2x3", "S4S:5/4x6")
+
+
+def _post(obj_id: str, x: float, y: float, half: float = 1.0) -> dict:
+    return {
+        "id": obj_id,
+        "prototype": "poly_extrude",
+        "params": {
+            "footprint": [[x - half, y - half], [x + half, y - half], [x + half, y + half], [x - half, y + half]],
+            "extrusion": {"z_base": 0, "height": 4},
+        },
+    }
+
+
+def _octagon() -> dict:
+    return {
+        "id": "Octagon",
+        "prototype": "regular_octagon_boundary",
+        "params": {"span_flat_to_flat_in": SPAN, "origin": [0, 0], "north_wall_normal": [0, 1], "wall_height_in": 13.75},
+    }
+
+
+def _internal_member(rng: random.Random, obj_id: str) -> dict:
+    r = rng.uniform(0.0, _R * 0.6)
+    a = rng.uniform(0.0, 2.0 * math.pi)
+    return {
+        "id": obj_id,
+        "prototype": "dim_lumber_member",
+        "params": {
+            "profile": {"id": rng.choice(_PROFILES)},
+            "orientation": {"wide_face": rng.choice(("down", "side"))},
+            "placement": {
+                "start": [round(r * math.cos(a), 3), round(r * math.sin(a), 3)],
+                "direction": rng.choice(_DIRECTIONS),
+                "length": round(rng.uniform(12.0, 60.0), 3),
+            },
+        },
+    }
+
+
+def _constraints_member(rng: random.Random, obj_id: str) -> dict:
+    # Run across the octagon between opposite walls, starting a random distance along
+    # the West (E-W members) or South (N-S members) wall.
+    if rng.random() < 0.5:
+        axis, edge, far = "E-W", "Octagon.wall:West", "Octagon.wall:East"
+    else:
+        axis, edge, far = "N-S", "Octagon.wall:South", "Octagon.wall:North"
+    return {
+        "id": obj_id,
+        "prototype": "dim_lumber_member",
+        "params": {
+            "profile": {"id": rng.choice(_PROFILES)},
+            "orientation": {"wide_face": "down"},
+            "placement_constraints": {
+                "axis": axis,
+                "origin": {
+                    "kind": "point_on_edge_from_vertex",
+                    "edge": edge,
+                    "vertex": "Octagon.vertex:SouthWest",
+                    "distance_in": round(rng.uniform(4.0, _WALL - 4.0), 3),
+                },
+                "extent": {"kind": "span_between_hits", "from": edge, "to": far},
+            },
+        },
+    }
+
+
+def generate_scene(
+    n: int,
+    kind: str = "internal",
+    seed: int = 0,
+    array_every: int = 50,
+    array_count: int = 10,
+    clip_every: int = 20,
+    trim_every: int = 50,
+) -> dict:
+    """Return a scene with `n` members plus proportional arrays, clips and trims."""
+    if kind not in ("internal", "constraints"):
+        raise ValueError(f"kind must be 'internal' or 'constraints', got {kind!r}")
+    rng = random.Random(seed)
+    make_member = _internal_member if kind == "internal" else _constraints_member
+
+    objects = [_octagon()]
+    operators = []
+    member_ids = []
+    for i in range(n):
+        obj = make_member(rng, f"M{i}")
+        objects.append(obj)
+        member_ids.append(obj["id"])
+
+    for k in range(n // array_every if array_every else 0):
+        y = rng.uniform(-_R * 0.5, _R * 0.5)
+        objects.append(_post(f"ArrA{k}", -_R * 0.5, y))
+        objects.append(_post(f"ArrB{k}", _R * 0.5, y))
+        objects.append({
+            "id": f"ArrT{k}",
+            "role": "template",
+            "prototype": "dim_lumber_member",
+            "params": {
+                "profile": {"id": "2x4"},
+                "orientation": {"wide_face": "down"},
+                "placement": {"direction": "north", "length": round(rng.uniform(6.0, 20.0), 3)},
+            },
+        })
+        operators.append({
+            "op": "distribute_evenly_between",
+            "template_object_id": f"ArrT{k}",
+            "between_object_ids": [f"ArrA{k}", f"ArrB{k}"],
+            "count": array_count,
+            "id_prefix": f"Arr{k}_",
+        })
+
+    for k in range(n // clip_every if clip_every else 0):
+        targets = member_ids[k * clip_every:(k + 1) * clip_every]
+        operators.append({"op": "clip_to_object", "clip_object_id": "Octagon", "target_ids": targets})
+
+    for k in range(n // trim_every if trim_every else 0):
+        # An east-running member and a post in its path; the member's start edge
+        # ([0, 1]) is cast east and the member is trimmed at the post.
+        x = rng.uniform(-_R * 0.5, 0.0)
+        y = rng.uniform(-_R * 0.5, _R * 0.5)
+        length = rng.uniform(30.0, 60.0)
+        objects.append({
+            "id": f"TrimSrc{k}",
+            "prototype": "dim_lumber_member",
+            "params": {
+                "profile": {"id": "2x4"},
+                "orientation": {"wide_face": "down"},
+                "placement": {"start": [round(x, 3), round(y, 3)], "direction": "east", "length": round(length, 3)},
+            },
+        })
+        objects.append(_post(f"TrimPost{k}", round(x + length * 0.6, 3), round(y, 3), half=3.0))
+        operators.append({
+            "op": "extend_and_trim_to_object",
+            "source_object_id": f"TrimSrc{k}",
+            "target_object_id": f"TrimPost{k}",
+            "source_edge": [0, 1],
+            "direction": [1, 0],
+        })
+
+    scene = {"anchor_id": "Octagon", "objects": objects, "operators": operators}
+    if kind == "constraints":
+        scene = {"scene_type": "constraints", **scene}
+    else:
+        scene = {"schema_version": "0.2", **scene}
+    return scene
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generate", description="Write a synthetic scene to stdout")
+    parser.add_argument("n", type=int, help="Number of dim_lumber_member members")
+    parser.add_argument("--kind", choices=("internal", "constraints"), default="internal")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    json.dump(generate_scene(args.n, kind=args.kind, seed=args.seed), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
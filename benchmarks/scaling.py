@@ -0,0 +1,101 @@
+"""Scaling benchmark: time each pipeline stage across a ladder of scene sizes.
+
+    python -m benchmarks.scaling                                # internal scenes, 100..3000
+    python -m benchmarks.scaling --kind constraints --sizes 100,300,1000
+    python -m benchmarks.scaling --sizes 1000,10000,100000 --repeat 1 --json out.json
+
+For each size N a scene is generated with benchmarks.generate (fixed seed) and run
+in-process `--repeat` times; the fastest wall time per stage is kept. The scaling
+exponent per stage is the least-squares slope of log(time) against log(N): ~1 means
+linear, ~2 quadratic.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+
+from benchmarks.generate import generate_scene
+
+STAGES = ("compile", "build", "emit", "total")
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float | None:
+    """Least-squares slope of log(times) vs log(sizes); None if fewer than two usable points."""
+    pts = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len(pts) < 2:
+        return None
+    mx = sum(x for x, _y in pts) / len(pts)
+    my = sum(y for _x, y in pts) / len(pts)
+    sxx = sum((x - mx) ** 2 for x, _y in pts)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in pts) / sxx
+
+
+def run_ladder(sizes: list[int], kind: str = "internal", repeat: int = 3, seed: int = 0, registries: dict | None = None) -> dict:
+    """Time every stage for each size; returns {"kind", "sizes", "rows", "exponents"}."""
+    from engine.registry import load_registries
+    from engine.run import _bundle_root, run_scene
+    from engine.scene import warm_registries
+
+    if registries is None:
+        registries = load_registries(_bundle_root())
+    warm_registries(registries)
+
+    rows = []
+    for n in sizes:
+        scene = generate_scene(n, kind=kind, seed=seed)
+        best: dict[str, float] = {}
+        objects = 0
+        for _ in range(max(1, repeat)):
+            timings: dict[str, float] = {}
+            _scad, resolved = run_scene(scene, registries, timings)
+            timings["total"] = sum(timings.values())
+            objects = len(resolved["objects"])
+            for stage in STAGES:
+                best[stage] = min(best.get(stage, math.inf), timings.get(stage, 0.0))
+        rows.append({"n": n, "objects": objects, "operators": len(scene["operators"]),
+                     **{f"{s}_ms": round(best[s], 3) for s in STAGES}})
+
+    exponents = {}
+    for stage in STAGES:
+        slope = fit_exponent([r["n"] for r in rows], [r[f"{stage}_ms"] for r in rows])
+        exponents[stage] = None if slope is None else round(slope, 3)
+    return {"kind": kind, "seed": seed, "repeat": repeat, "sizes": list(sizes), "rows": rows, "exponents": exponents}
+
+
+def format_report(result: dict) -> str:
+    lines = [f"kind={result['kind']} seed={result['seed']} repeat={result['repeat']} (best-of wall ms)"]
+    header = f"{'N':>8} {'objects':>8} {'ops':>6} " + " ".join(f"{s:>11}" for s in STAGES)
+    lines.append(header)
+    for r in result["rows"]:
+        lines.append(f"{r['n']:>8} {r['objects']:>8} {r['operators']:>6} "
+                     + " ".join(f"{r[f'{s}_ms']:>11.1f}" for s in STAGES))
+    exps = " ".join(
+        f"{'n/a' if result['exponents'][s] is None else format(result['exponents'][s], '.2f'):>11}" for s in STAGES
+    )
+    lines.append(f"{'exponent':>24} {exps}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scaling", description="Pipeline scaling benchmark")
+    parser.add_argument("--sizes", default="100,300,1000,3000", help="Comma-separated member counts (default: 100,300,1000,3000)")
+    parser.add_argument("--kind", choices=("internal", "constraints"), default="internal")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the fastest is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the result as JSON to this path")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    result = run_ladder(sizes, kind=args.kind, repeat=args.repeat, seed=args.seed)
+    print(format_report(result))
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,159 @@
+"""CLI startup benchmark.
+
+Measures, for a trivial internal scene:
+
+  - time to first output: launch `python -X importtime -m engine.run scene out.scad`
+    and time until its first stdout line ("Wrote ...")
+  - engine import cost: sum of `-X importtime` self times of engine.* modules
+    (modules loaded via importlib, such as resolvers and operator handlers, are
+    not itemized by -X importtime and are only counted in the total time)
+  - which engine modules were loaded at all (sys.modules at exit)
+
+and compares them to benchmarks/startup_budget.json. Modules listed under
+"forbidden_modules" must not load for this scene (e.g. the constraints compiler).
+
+  python -m benchmarks.startup            # measure and check against the budget
+  python -m benchmarks.startup --record   # re-record the budget on this machine
+  python -m benchmarks.startup --compile  # byte-compile engine/ first (writes .pyc files)
+
+Each run uses a fresh artifact cache directory so the pipeline actually executes.
+Nothing is written to the source tree unless --compile is given; the first CLI
+launch caches bytecode as any normal run would.
+"""
+from __future__ import annotations
+
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+BUDGET_PATH = Path(__file__).resolve().parent / "startup_budget.json"
+
+# Recorded budgets are the measured best-of-N times this factor, to absorb machine noise.
+RECORD_HEADROOM = 2.0
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """Return {module: self_us} from `-X importtime` output."""
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        out[parts[2].strip()] = int(parts[0])
+    return out
+
+
+# Runs `python -m engine.run ...` and reports every engine module loaded on exit:
+# -X importtime does not see modules loaded through importlib.import_module
+# (resolvers, operator handlers, lazy prototype attributes).
+_RUNNER = (
+    "import atexit, runpy, sys\n"
+    "atexit.register(lambda: sys.stderr.write('loaded modules: ' + ' '.join(sorted(sys.modules)) + '\\n'))\n"
+    "sys.argv = ['engine.run'] + sys.argv[1:]\n"
+    "runpy.run_module('engine.run', run_name='__main__', alter_sys=True)\n"
+)
+
+
+def _run_once(scene: Path, out_path: Path, cache_dir: str) -> tuple[float, dict, set]:
+    env = dict(os.environ, AICADDIE_CACHE_DIR=cache_dir)
+    cmd = [sys.executable, "-X", "importtime", "-c", _RUNNER, str(scene), str(out_path)]
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=str(REPO), env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    first = proc.stdout.readline()
+    ttfo_ms = (time.perf_counter() - t0) * 1000.0
+    _rest, stderr = proc.communicate()
+    if proc.returncode != 0 or not first.startswith("Wrote"):
+        raise RuntimeError(f"engine.run failed (rc={proc.returncode})\n{first}\n{stderr}")
+    loaded = set()
+    for line in stderr.splitlines():
+        if line.startswith("loaded modules: "):
+            loaded = set(line[len("loaded modules: "):].split())
+    return ttfo_ms, _parse_importtime(stderr), loaded
+
+
+def measure(scene: str | Path, runs: int = 7, compile: bool = False) -> dict:
+    """Run the CLI `runs` times and return best-of-N timings plus the engine modules imported.
+
+    With `compile`, engine/ is byte-compiled first, for environments that do not
+    cache bytecode on import (e.g. PYTHONDONTWRITEBYTECODE).
+    """
+    scene = Path(scene)
+    if not scene.is_absolute():
+        scene = REPO / scene
+    if compile:
+        compileall.compile_dir(str(REPO / "engine"), quiet=1)
+
+    ttfo, engine_us, modules = [], [], set()
+    with tempfile.TemporaryDirectory() as td:
+        for i in range(runs):
+            ms, imports, loaded = _run_once(scene, Path(td) / "out.scad", str(Path(td) / f"cache{i}"))
+            engine_us.append(sum(us for m, us in imports.items() if m == "engine" or m.startswith("engine.")))
+            ttfo.append(ms)
+            modules.update(m for m in loaded if m == "engine" or m.startswith("engine."))
+    return {
+        "time_to_first_output_ms": min(ttfo),
+        "engine_import_us": min(engine_us),
+        "engine_modules": sorted(modules),
+    }
+
+
+def load_budget() -> dict:
+    return json.loads(BUDGET_PATH.read_text(encoding="utf-8"))
+
+
+def check(budget: dict | None = None, runs: int = 7, compile: bool = False) -> tuple[dict, list[str]]:
+    """Measure and return (measurement, list of budget violations)."""
+    budget = budget or load_budget()
+    m = measure(budget["scene"], runs=runs, compile=compile)
+    problems = []
+    if m["time_to_first_output_ms"] > budget["time_to_first_output_ms"]:
+        problems.append(
+            f"time to first output {m['time_to_first_output_ms']:.1f}ms exceeds budget "
+            f"{budget['time_to_first_output_ms']:.1f}ms"
+        )
+    if m["engine_import_us"] > budget["engine_import_us"]:
+        problems.append(
+            f"engine import time {m['engine_import_us']:.0f}us exceeds budget {budget['engine_import_us']:.0f}us"
+        )
+    loaded = sorted(set(budget.get("forbidden_modules", [])) & set(m["engine_modules"]))
+    if loaded:
+        problems.append(f"modules that should load lazily were imported: {', '.join(loaded)}")
+    return m, problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description="Engine CLI startup benchmark")
+    parser.add_argument("--runs", type=int, default=7, help="Number of CLI launches (the fastest is used)")
+    parser.add_argument("--record", action="store_true", help="Record a new budget from this machine")
+    parser.add_argument("--compile", action="store_true", help="Byte-compile engine/ before measuring (writes .pyc files)")
+    args = parser.parse_args(argv)
+
+    budget = load_budget()
+    if args.record:
+        m = measure(budget["scene"], runs=args.runs, compile=args.compile)
+        budget["time_to_first_output_ms"] = round(m["time_to_first_output_ms"] * RECORD_HEADROOM, 1)
+        budget["engine_import_us"] = round(m["engine_import_us"] * RECORD_HEADROOM)
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n", encoding="utf-8")
+        print(f"Recorded budget: {budget}")
+        return 0
+
+    m, problems = check(budget, runs=args.runs, compile=args.compile)
+    print(f"time to first output: {m['time_to_first_output_ms']:.1f}ms (budget {budget['time_to_first_output_ms']}ms)")
+    print(f"engine import time:   {m['engine_import_us']:.0f}us (budget {budget['engine_import_us']}us)")
+    print(f"engine modules:       {', '.join(m['engine_modules'])}")
+    for p in problems:
+        print(f"[FAIL] {p}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
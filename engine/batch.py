@@ -0,0 +1,203 @@
+"""Batch mode for engine.run.
+
+Runs many scene files through the pipeline without paying interpreter startup,
+imports and registry parsing per file:
+
+  - registries are loaded once per worker process (pool initializer)
+  - scenes fan out over a ProcessPoolExecutor
+  - results come back (and are written/reported) in input order
+  - a failing scene is reported on its own and does not abort the batch
+
+Inputs may be scene directories (all *.json files), glob patterns, or manifest
+files listing one scene path per line (relative to the manifest; '#' comments).
+"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from engine.registry import load_registries
+from engine.scene import warm_registries
+
+
+# Set by _init_worker in each pool process (or by run_batch for in-process runs).
+_WORKER_REGISTRIES: Optional[dict] = None
+_WORKER_CACHE = None
+
+
+def _bundle_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def scene_name(path: str | Path) -> str:
+    """Return the case name for a scene file ('foo.scene.json' -> 'foo')."""
+    name = os.path.basename(str(path))
+    for suf in (".scene.json", ".json"):
+        if name.endswith(suf):
+            return name[: -len(suf)]
+    return name
+
+
+def _read_manifest(path: Path) -> List[str]:
+    out: List[str] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        p = Path(line)
+        if not p.is_absolute():
+            p = path.parent / p
+        out.append(str(p))
+    return out
+
+
+def collect_scene_paths(inputs: Iterable[str]) -> List[str]:
+    """Expand batch inputs into an ordered, de-duplicated list of scene paths.
+
+    - directory: every *.json file in it (sorted)
+    - *.json file: that scene
+    - any other existing file: manifest (one scene path per line)
+    - anything else: glob pattern (sorted; '**' is recursive)
+    """
+    paths: List[str] = []
+    for spec in inputs:
+        p = Path(spec)
+        if p.is_dir():
+            found = sorted(glob.glob(str(p / "*.json")))
+        elif p.is_file() and p.suffix == ".json":
+            found = [str(p)]
+        elif p.is_file():
+            found = _read_manifest(p)
+        else:
+            found = sorted(glob.glob(spec, recursive=True))
+            if not found:
+                raise ValueError(f"Batch input matched no scene files: {spec}")
+        paths.extend(found)
+
+    seen = set()
+    out: List[str] = []
+    for path in paths:
+        key = os.path.abspath(path)
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(path)
+    return out
+
+
+def _plan_jobs(scene_paths: List[str], outdir: Path, write_resolved: bool) -> List[Dict[str, Any]]:
+    jobs: List[Dict[str, Any]] = []
+    by_name: Dict[str, str] = {}
+    for path in scene_paths:
+        name = scene_name(path)
+        if name in by_name:
+            raise ValueError(f"Batch output name collision for '{name}': {by_name[name]} and {path}")
+        by_name[name] = path
+        jobs.append({
+            "scene": str(path),
+            "out": str(outdir / f"{name}.scad"),
+            "resolved": str(outdir / f"{name}.resolved.json") if write_resolved else None,
+        })
+    return jobs
+
+
+def _init_worker(bundle_root: str, cache_dir: Optional[str] = None, cache_max_bytes: int = 0) -> None:
+    """Pool initializer: parse registries and import resolvers/handlers once per worker process.
+
+    If `cache_dir` is given, the worker also opens an engine.cache.ArtifactCache there.
+    """
+    global _WORKER_REGISTRIES, _WORKER_CACHE
+    _WORKER_REGISTRIES = load_registries(Path(bundle_root))
+    warm_registries(_WORKER_REGISTRIES)
+    _WORKER_CACHE = None
+    if cache_dir is not None:
+        from engine.cache import ArtifactCache
+
+        _WORKER_CACHE = ArtifactCache(cache_dir, max_bytes=cache_max_bytes)
+
+
+def _init_pool_worker(*initargs) -> None:
+    """_init_worker for pool processes: scenes already run in parallel, so operators run serially."""
+    os.environ["AICADDIE_OPERATOR_SERIAL"] = "1"
+    _init_worker(*initargs)
+
+
+def _run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    from engine.run import run_file_with_resolved
+
+    result = dict(job)
+    try:
+        run_file_with_resolved(
+            job["scene"], job["out"], job["resolved"], registries=_WORKER_REGISTRIES, cache=_WORKER_CACHE
+        )
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = f"{type(e).__name__}: {e}"
+    else:
+        result["ok"] = True
+        result["error"] = None
+    return result
+
+
+def run_batch(
+    inputs: Iterable[str],
+    outdir: str | Path,
+    jobs: int = 0,
+    write_resolved: bool = False,
+    bundle_root: str | Path | None = None,
+    cache=None,
+) -> List[Dict[str, Any]]:
+    """Run every scene named by `inputs` and return one result record per scene, in input order.
+
+    Each record has: scene, out, resolved (path or None), ok, error.
+    `jobs` <= 0 uses os.cpu_count(); jobs == 1 runs in-process without a pool.
+    `cache` is an optional engine.cache.ArtifactCache; pool workers open the same cache directory.
+    """
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    root = str(Path(bundle_root) if bundle_root is not None else _bundle_root())
+
+    plan = _plan_jobs(collect_scene_paths(inputs), outdir, write_resolved)
+    if not plan:
+        return []
+
+    workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+    workers = min(workers, len(plan))
+    initargs = (root,) if cache is None else (root, str(cache.cache_dir), cache.max_bytes)
+    if workers <= 1:
+        _init_worker(*initargs)
+        return [_run_job(job) for job in plan]
+
+    chunksize = max(1, len(plan) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_pool_worker, initargs=initargs) as pool:
+        return list(pool.map(_run_job, plan, chunksize=chunksize))
+
+
+def main_batch(args) -> int:
+    """CLI entry for `python -m engine.run --batch ...` (args from engine.run's parser)."""
+    try:
+        from engine.run import _cache_from_args
+
+        results = run_batch(
+            args.batch, args.outdir, jobs=args.jobs, write_resolved=args.resolved, cache=_cache_from_args(args)
+        )
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+
+    failed = [r for r in results if not r["ok"]]
+    for r in results:
+        if r["ok"]:
+            print(f"[OK] {r['scene']} -> {r['out']}")
+        else:
+            print(f"[FAIL] {r['scene']}: {r['error']}")
+    print(f"\n{len(results) - len(failed)}/{len(results)} scenes succeeded")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    return 1 if failed else 0
@@ -0,0 +1,269 @@
+"""Content-addressed on-disk artifact cache for the pipeline.
+
+One entry per (scene, registries, engine source) combination holds all three
+pipeline artifacts:
+
+  {"compiled": <internal scene>, "resolved": <resolved scene>, "scad": <SCAD text>}
+
+Key:
+  sha256 over the canonical JSON of the scene document, the canonical JSON of the
+  loaded registries, and a digest of every engine/**/*.py source file. Any edit to
+  a scene, a registry file or the engine itself therefore misses the cache.
+
+Eviction:
+  Entries are files under <cache_dir>/<key[:2]>/<key>.json. A hit bumps the entry's
+  mtime; after each store, least-recently-used entries are deleted until the cache
+  is under `max_bytes`.
+
+Single-flight:
+  Concurrent requests for the same key compute once. Threads in one process wait
+  on a per-key lock; separate processes coordinate through an exclusive
+  <key>.lock file and poll for the finished entry.
+
+Failures:
+  The cache is best effort. If the cache directory cannot be read or written
+  (read-only checkout, unwritable tmp/), one warning goes to stderr and results
+  are computed and returned uncached.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+from collections.abc import Callable
+from pathlib import Path
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# A lock file older than this is assumed to belong to a crashed process.
+_STALE_LOCK_S = 120.0
+_POLL_S = 0.02
+
+
+def _canonical_json(obj) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def engine_source_digest() -> str:
+    """Digest of the engine package source (paths + contents), computed once per process."""
+    root = Path(__file__).resolve().parent
+    h = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        h.update(path.relative_to(root).as_posix().encode("utf-8"))
+        h.update(b"\0")
+        h.update(path.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    env = os.environ.get("AICADDIE_CACHE_DIR")
+    if env:
+        return Path(env)
+    return Path(__file__).resolve().parents[1] / "tmp" / "engine_cache"
+
+
+class ArtifactCache:
+    """Size-bounded LRU cache of pipeline artifacts keyed by content hash."""
+
+    def __init__(self, cache_dir: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._guard = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._registry_digests: dict[int, tuple] = {}
+        self._warned = False
+
+    def _warn(self, exc: OSError) -> None:
+        if not self._warned:
+            self._warned = True
+            print(f"warning: artifact cache unavailable ({exc}); running uncached", file=sys.stderr)
+
+    # --- keys ---
+
+    def _registries_digest(self, registries: dict) -> str:
+        # Registries are loaded once and reused, so memoize by identity (holding a
+        # reference keeps the id from being recycled).
+        hit = self._registry_digests.get(id(registries))
+        if hit is not None and hit[0] is registries:
+            return hit[1]
+        digest = hashlib.sha256(_canonical_json(registries)).hexdigest()
+        self._registry_digests[id(registries)] = (registries, digest)
+        return digest
+
+    def key_for(self, scene: dict, registries: dict, options: dict | None = None) -> str:
+        """Content hash of a run: scene, registries, engine source and run `options`.
+
+        `options` are engine.run.run_scene's build/emit switches; only the ones
+        that are set are hashed, so a default run keeps the key it always had.
+        """
+        h = hashlib.sha256()
+        h.update(_canonical_json(scene))
+        h.update(b"\0")
+        h.update(self._registries_digest(registries).encode("ascii"))
+        h.update(b"\0")
+        h.update(engine_source_digest().encode("ascii"))
+        options = {k: v for k, v in (options or {}).items() if v}
+        if options:
+            h.update(b"\0")
+            h.update(_canonical_json(options))
+        return h.hexdigest()
+
+    # --- storage ---
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            self._warn(exc)
+            return None
+        try:
+            entry = json.loads(data)
+        except json.JSONDecodeError:
+            # Torn or corrupted entry: drop it and recompute.
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        path = self._entry_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(json.dumps(entry).encode("utf-8"))
+            os.replace(tmp, path)
+            self.evict()
+        except OSError as exc:
+            self._warn(exc)
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*/*.json"):
+            path.unlink(missing_ok=True)
+
+    # --- single-flight ---
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._guard:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _acquire_file_lock(self, key: str) -> dict | None:
+        """Take the cross-process lock for `key`, or return the entry another process produced.
+
+        Raises OSError if the lock file cannot be created.
+        """
+        lock_path = self._entry_path(key).with_suffix(".lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                entry = self.get(key)
+                if entry is not None:
+                    return entry
+                try:
+                    if time.time() - lock_path.stat().st_mtime > _STALE_LOCK_S:
+                        lock_path.unlink(missing_ok=True)
+                except FileNotFoundError:
+                    pass
+                time.sleep(_POLL_S)
+                continue
+            os.close(fd)
+            # The previous holder may have stored the entry and released the lock
+            # between our last check and the exclusive create.
+            entry = self.get(key)
+            if entry is not None:
+                lock_path.unlink(missing_ok=True)
+            return entry
+
+    def get_or_compute(self, key: str, compute: Callable[[], dict]) -> tuple[dict, bool]:
+        """Return (entry, hit). On a miss, `compute` runs at most once across concurrent callers."""
+        entry = self.get(key)
+        if entry is not None:
+            with self._guard:
+                self.hits += 1
+            return entry, True
+
+        key_lock = self._key_lock(key)
+        try:
+            with key_lock:
+                entry = self.get(key)
+                if entry is None:
+                    try:
+                        entry = self._acquire_file_lock(key)
+                    except OSError as exc:
+                        self._warn(exc)
+                        entry = compute()
+                        with self._guard:
+                            self.misses += 1
+                        return entry, False
+                if entry is not None:
+                    with self._guard:
+                        self.hits += 1
+                    return entry, True
+
+                lock_path = self._entry_path(key).with_suffix(".lock")
+                try:
+                    entry = compute()
+                    self.put(key, entry)
+                finally:
+                    try:
+                        lock_path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                with self._guard:
+                    self.misses += 1
+                return entry, False
+        finally:
+            # Waiters already hold a reference; later callers find the entry on
+            # disk (or recompute after a failure) under a fresh lock.
+            with self._guard:
+                if self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
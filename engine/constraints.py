@@ -29,8 +29,9 @@ COMPILER_SUPPORTED_PROTOTYPES = {
 from typing import Dict, Any, Tuple, Optional
 import copy
 
-from engine.prototypes import poly_extrude, regular_octagon_boundary, dim_lumber_member, rect_solid
-from engine.geom import clip_halfplane, ray_segment_intersection
+# Prototype modules are imported inside the functions that use them so that only the
+# prototypes a scene actually references are loaded.
+from engine.geom import Polygon, get_backend
 
 from engine.features import (
     build_feature_catalog,
@@ -53,6 +54,8 @@ def _member_half_width_on_floor(params: Dict[str, Any], registries: Dict[str, An
     Matches dim_lumber_member.resolve: if wide_face is down/up/flat => width_on_floor = w,
     if side/edge => width_on_floor = t.
     """
+    from engine.prototypes import dim_lumber_member
+
     t, w = dim_lumber_member._resolve_profile(params, registries)  # type: ignore[attr-defined]
     orient = params.get("orientation", {}) or {}
     wide_face = str(orient.get("wide_face", "down")).strip().lower()
@@ -67,6 +70,8 @@ def _member_half_width_on_floor(params: Dict[str, Any], registries: Dict[str, An
 
 def _member_width_and_height(params: Dict[str, Any], registries: Dict[str, Any] | None) -> Tuple[float, float]:
     """Return (width_on_floor, height) in inches for a dim_lumber_member."""
+    from engine.prototypes import dim_lumber_member
+
     t, w = dim_lumber_member._resolve_profile(params, registries)  # type: ignore[attr-defined]
     orient = params.get("orientation", {}) or {}
     wide_face = str(orient.get("wide_face", "down")).strip().lower()
@@ -81,25 +86,11 @@ def _first_ray_hit_on_polygon_with_edge(
     origin: Point, dir_u: Point, poly: list[Point]
 ) -> Tuple[Optional[Point], Optional[Tuple[Point, Point]]]:
     """Return (hit_point, hit_edge_segment) for the closest ray hit on polygon boundary."""
-    best_t = None
-    best_pt: Optional[Point] = None
-    best_edge: Optional[Tuple[Point, Point]] = None
-    n = len(poly)
-    if n < 2:
+    (hit,) = get_backend().ray_hits([origin], [dir_u], [poly])
+    if hit is None:
         return (None, None)
-    for i in range(n):
-        a = tuple(poly[i])
-        b = tuple(poly[(i + 1) % n])
-        hit, t, p = ray_segment_intersection(origin, dir_u, a, b)
-        if not hit:
-            continue
-        if t < 1e-9:
-            continue
-        if best_t is None or t < best_t:
-            best_t = t
-            best_pt = p
-            best_edge = (a, b)
-    return (best_pt, best_edge)
+    _t, pt, _poly, i = hit
+    return (pt, (tuple(poly[i]), tuple(poly[(i + 1) % len(poly)])))
 
 
 def _rect_footprint_from_start_dir_len(start: Point, dir_u: Point, length: float, width_on_floor: float) -> list[Point]:
@@ -148,7 +139,10 @@ def _clip_polygon_to_edge_halfplane(
         ax -= ux * float(overlap_eps)
         ay -= uy * float(overlap_eps)
 
-    return clip_halfplane([tuple(p) for p in poly], (ax, ay), (nx, ny), keep_leq=True)
+    (clipped,) = get_backend().clip_halfplane([[tuple(p) for p in poly]], (ax, ay), (nx, ny), keep_leq=True)
+    return clipped
+
+
 def _shift_origin_for_reference_edge(
     origin_pt: Point,
     axis_unit: Point,
@@ -239,15 +233,23 @@ def _resolve_support_objects(scene_constraints: dict, *, registries: Optional[di
         params = o.get("params", {})
         geom = None
         if proto == "poly_extrude":
+            from engine.prototypes import poly_extrude
+
             geom = poly_extrude.resolve(params)
         elif proto == "regular_octagon_boundary":
+            from engine.prototypes import regular_octagon_boundary
+
             geom = regular_octagon_boundary.resolve(params)
         elif proto == "dim_lumber_member" and isinstance(params.get("placement"), dict):
             # Only resolve members that are already fully placed (template objects may omit start).
             placement = params.get("placement") or {}
             if "start" in placement and "length" in placement:
+                from engine.prototypes import dim_lumber_member
+
                 geom = dim_lumber_member.resolve(params, registries=registries)
         elif proto == "rect_solid":
+            from engine.prototypes import rect_solid
+
             geom = rect_solid.resolve(params, registries=registries)
         oo = copy.deepcopy(o)
         if geom is not None:
@@ -260,6 +262,19 @@ def _index_objects(scene: dict) -> Dict[str, dict]:
     return {o["id"]: o for o in scene.get("objects", [])}
 
 
+def _lookup_view(obj: dict) -> dict:
+    """`obj` with its footprint wrapped in a Polygon, for repeated feature lookups.
+
+    Feature handles are resolved once per constraint, so the same footprint is
+    queried many times; the Polygon computes its bbox once. The compiled scene
+    keeps the plain lists.
+    """
+    fp = obj.get("geom", {}).get("footprint")
+    if not fp:
+        return obj
+    return {**obj, "geom": {**obj["geom"], "footprint": Polygon(fp)}}
+
+
 def _parse_handle(handle: str) -> Tuple[str, str]:
     if "." not in handle:
         raise ValueError(f"Invalid feature handle '{handle}'. Expected 'ObjectId.<feature>'")
@@ -283,6 +298,14 @@ def compile_scene_constraints(scene_constraints: dict, registries: Optional[dict
 
     support = _resolve_support_objects(scene, registries=registries)
     obj_index = _index_objects(support)
+    views: Dict[str, Tuple[dict, dict]] = {}  # id -> (indexed object, its lookup view)
+
+    def lookup(oid: str) -> dict:
+        obj = obj_index[oid]
+        hit = views.get(oid)
+        if hit is None or hit[0] is not obj:
+            hit = views[oid] = (obj, _lookup_view(obj))
+        return hit[1]
 
     # Build feature catalog from currently-known geometry.
     catalog = build_feature_catalog(support)
@@ -300,7 +323,7 @@ def compile_scene_constraints(scene_constraints: dict, registries: Optional[dict
     def resolve_seg(handle: str):
         require_handle(handle)
         oid, feat = _parse_handle(handle)
-        return resolve_feature_segment(obj_index[oid], feat)
+        return resolve_feature_segment(lookup(oid), feat)
 
     # compile objects in order; when registries provided, we can resolve dim_lumber as we go to
     # support later ray hits against previous members' footprints.
@@ -331,7 +354,7 @@ def compile_scene_constraints(scene_constraints: dict, registries: Optional[dict
             feature_h = origin["feature"]
             require_handle(feature_h)
             oid, feat = _parse_handle(feature_h)
-            seg = resolve_feature_segment(obj_index[oid], feat)
+            seg = resolve_feature_segment(lookup(oid), feat)
             a, b = seg
 
             dir_tok = str(origin.get("dir", "S"))
@@ -384,7 +407,7 @@ def compile_scene_constraints(scene_constraints: dict, registries: Optional[dict
 
             require_handle(vertex_h)
             vo, vf = _parse_handle(vertex_h)
-            vpt = resolve_feature_point(obj_index[vo], vf)
+            vpt = resolve_feature_point(lookup(vo), vf)
 
             a, b = edge_seg
             da = (a[0] - vpt[0]) ** 2 + (a[1] - vpt[1]) ** 2
@@ -439,7 +462,7 @@ def compile_scene_constraints(scene_constraints: dict, registries: Optional[dict
             until_h = extent["until"]
             require_handle(until_h)
             uoid, ufeat = _parse_handle(until_h)
-            target_obj = obj_index[uoid]
+            target_obj = lookup(uoid)
 
             # try segment first, then polygon (keeping track of the boundary edge we hit)
             pt: Optional[Point] = None
@@ -486,6 +509,8 @@ def compile_scene_constraints(scene_constraints: dict, registries: Optional[dict
 
                 # Make this new geometry available for any subsequent constraints.
                 try:
+                    from engine.prototypes import poly_extrude
+
                     new_obj["geom"] = poly_extrude.resolve(params_poly)
                     obj_index[new_obj["id"]] = new_obj
                     support.setdefault("objects", []).append(new_obj)
@@ -528,6 +553,8 @@ def compile_scene_constraints(scene_constraints: dict, registries: Optional[dict
         # If registries supplied, resolve now so later features can reference this member's footprint
         if registries is not None:
             try:
+                from engine.prototypes import dim_lumber_member
+
                 geom = dim_lumber_member.resolve(params, registries)
                 new_obj["geom"] = geom
                 # update support index + catalog to allow later handle validation/hits
@@ -12,6 +12,8 @@ from __future__ import annotations
 from typing import Dict, List, Tuple, Optional, Any
 import math
 
+from engine.geom import Polygon, get_backend
+
 Point = Tuple[float, float]
 Segment = Tuple[Point, Point]
 Poly = List[Point]
@@ -20,6 +22,8 @@ CARDINAL_WALLS_CW = ["North","NorthEast","East","SouthEast","South","SouthWest",
 CARDINAL_VERTS_CW = ["North","NorthEast","East","SouthEast","South","SouthWest","West","NorthWest"]
 
 def _bbox(poly: Poly) -> Tuple[float,float,float,float]:
+    if isinstance(poly, Polygon):
+        return poly.bbox
     xs = [p[0] for p in poly]
     ys = [p[1] for p in poly]
     return min(xs), min(ys), max(xs), max(ys)
@@ -251,21 +255,5 @@ def ray_segment_first_hit(origin: Point, dir_u: Point, seg: Tuple[Point,Point])
 
 def ray_polygon_first_hit(origin: Point, dir_u: Point, poly: list[Point]) -> Optional[Point]:
     """Return closest intersection point of ray with polygon boundary, or None."""
-    best_t = None
-    best_pt = None
-    n = len(poly)
-    if n < 2:
-        return None
-    for i in range(n):
-        a = poly[i]
-        b = poly[(i+1)%n]
-        hit = _ray_intersect_segment(origin, dir_u, a, b)
-        if hit is None:
-            continue
-        t, pt = hit
-        if t < 1e-9:
-            continue
-        if best_t is None or t < best_t:
-            best_t = t
-            best_pt = pt
-    return best_pt
\ No newline at end of file
+    (hit,) = get_backend().ray_hits([origin], [dir_u], [poly])
+    return None if hit is None else hit[1]
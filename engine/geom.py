@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import List, Tuple
-
-Point = Tuple[float, float]
-Poly = List[Point]
+import math
+import os
+import sys
+# Builtin generics (not typing.List/Tuple) keep `typing` off the CLI startup path.
+Point = tuple[float, float]
+Poly = list[Point]
 
 EPS = 1e-9
 
@@ -51,7 +53,7 @@ def clip_halfplane(subject: Poly, p0: Point, n: Point, keep_leq: bool = True) ->
         prev, prev_in = cur, cur_in
     return out
 
-def ray_segment_intersection(ro: Point, rd: Point, a: Point, b: Point) -> Tuple[bool, float, Point]:
+def ray_segment_intersection(ro: Point, rd: Point, a: Point, b: Point) -> tuple[bool, float, Point]:
     """Intersect ray (ro + t*rd, t>=0) with segment a->b.
 
     Returns (hit, t_ray, point). If no hit, hit=False.
@@ -75,7 +77,7 @@ def ray_segment_intersection(ro: Point, rd: Point, a: Point, b: Point) -> Tuple[
         return (True, t, (px, py))
     return (False, 0.0, ro)
 
-def first_ray_polygon_hit(ro: Point, rd: Point, poly: Poly) -> Tuple[bool, float, Point]:
+def first_ray_polygon_hit(ro: Point, rd: Point, poly: Poly) -> tuple[bool, float, Point]:
     """Return the first intersection of a ray with a polygon boundary."""
     best_t = None
     best_p: Point = ro
@@ -98,6 +100,11 @@ def first_ray_polygon_hit(ro: Point, rd: Point, poly: Poly) -> Tuple[bool, float
     return (True, float(best_t), best_p)
 
 def signed_area(poly: Poly) -> float:
+    if isinstance(poly, Polygon):
+        return poly.area
+    return _signed_area(poly)
+
+def _signed_area(poly: Poly) -> float:
     if not poly:
         return 0.0
     a = 0.0
@@ -136,39 +143,506 @@ def clip_convex(subject: Poly, clipper: Poly) -> Poly:
 
     - `clipper` must be convex.
     - Works for either winding direction of `clipper`.
+    - A convex subject with len(subject) * len(clipper) >= CONVEX_KERNEL_MIN_PRODUCT
+      is intersected with convex_intersection instead (same polygon, linear time).
     """
     if not subject or not clipper:
         return []
+    return _clip_one(subject, prepare_convex_clipper(clipper))
+
+
+# A prepared clipper is (edges, keep_left, bbox, margin, inner). Each edge (ax, ay,
+# bx-ax, by-ay, ax-bx, ay-by, ax*by-ay*bx) holds the terms _inside and
+# _line_intersection compute from a clipper edge a->b, so prepared clipping
+# returns exactly what clip_convex did. bbox is the clipper's (min_x, min_y,
+# max_x, max_y); a subject whose bbox is more than `margin` away from it cannot
+# keep any vertex (the EPS inside-tolerance reaches at most ~EPS/edge length
+# outside the clipper). inner is a box inside the clipper, at least `margin` from
+# every edge, or None; a subject within it is inside by a wide margin.
+PreparedClipper = tuple[
+    tuple[tuple[float, ...], ...], bool, tuple[float, float, float, float], float,
+    "tuple[float, float, float, float] | None",
+]
+
 
+def prepare_convex_clipper(clipper: Poly) -> PreparedClipper:
+    """Check `clipper` is convex and precompute its edges and boxes once for clip_prepared / clip_convex_many.
+
+    A Polygon clipper is prepared once and the result cached with its other derived data.
+    """
+    if isinstance(clipper, Polygon):
+        return clipper.prepared
     # Defensive contract: this routine is only correct for convex clippers.
     # Several operators (e.g., clip_to_object) depend on this guarantee.
     if not _is_convex_polygon(clipper):
         raise ValueError("clip_convex: clipper polygon must be convex")
-    keep_left = is_ccw(clipper)  # CCW => inside is left of each directed edge
-    out = list(subject)
+    return _prepare(clipper, is_ccw(clipper))
+
+
+def _prepare(clipper: Poly, keep_left: bool) -> PreparedClipper:
+    # keep_left: CCW => inside is left of each directed edge
     m = len(clipper)
+    edges = []
+    min_len = math.inf
     for i in range(m):
-        a = clipper[i]
-        b = clipper[(i+1) % m]
+        ax, ay = clipper[i]
+        bx, by = clipper[(i+1) % m]
+        edges.append((ax, ay, bx - ax, by - ay, ax - bx, ay - by, ax*by - ay*bx))
+        length = math.hypot(bx - ax, by - ay)
+        if length > 0.0:
+            min_len = min(min_len, length)
+    xs = [p[0] for p in clipper]
+    ys = [p[1] for p in clipper]
+    bbox = (min(xs), min(ys), max(xs), max(ys))
+    margin = 1e-6 + 100.0 * EPS / min_len
+    return tuple(edges), keep_left, bbox, margin, _inner_box(edges, keep_left, xs, ys, bbox, margin)
+
+
+def _inner_box(edges, keep_left: bool, xs: list[float], ys: list[float], bbox, margin: float):
+    """The clipper's bbox shrunk about the vertex mean until it fits `margin` inside every edge."""
+    cx, cy = sum(xs) / len(xs), sum(ys) / len(ys)
+    hx, hy = (bbox[2] - bbox[0]) / 2.0, (bbox[3] - bbox[1]) / 2.0
+    k = 1.0
+    for ax, ay, ex, ey, _dx, _dy, _c in edges:
+        length = math.hypot(ex, ey)
+        if length == 0.0:
+            continue
+        # Unit normal pointing into the clipper, and the center's distance past the margin.
+        nx, ny = (-ey / length, ex / length) if keep_left else (ey / length, -ex / length)
+        room = (cx - ax) * nx + (cy - ay) * ny - margin
+        reach = abs(nx) * hx + abs(ny) * hy  # how far the box's worst corner moves per unit k
+        if room <= 0.0:
+            return None
+        if reach > 0.0:
+            k = min(k, room / reach)
+    k *= 0.999  # keep clear of rounding at the boundary
+    return (cx - k * hx, cy - k * hy, cx + k * hx, cy + k * hy)
+
+
+def clip_prepared(subject: Poly, prepared: PreparedClipper) -> Poly:
+    """Sutherland–Hodgman clipping against a clipper from prepare_convex_clipper."""
+    edges, keep_left = prepared[0], prepared[1]
+    out = list(subject)
+    for ax, ay, ex, ey, dx34, dy34, c34 in edges:
         if not out:
             return []
         inp = out
         out = []
-        prev = inp[-1]
-        prev_in = _inside(prev, a, b, keep_left)
+        x1, y1 = inp[-1]
+        cross = ex*(y1 - ay) - ey*(x1 - ax)
+        prev_in = cross >= -EPS if keep_left else cross <= EPS
         for cur in inp:
-            cur_in = _inside(cur, a, b, keep_left)
+            x2, y2 = cur
+            cross = ex*(y2 - ay) - ey*(x2 - ax)
+            cur_in = cross >= -EPS if keep_left else cross <= EPS
+            if cur_in != prev_in:
+                # Same arithmetic as _line_intersection((x1, y1), cur, a, b).
+                den = (x1-x2)*dy34 - (y1-y2)*dx34
+                if abs(den) < EPS:
+                    out.append(cur)
+                else:
+                    c12 = x1*y2 - y1*x2
+                    out.append(((c12*dx34 - (x1-x2)*c34) / den, (c12*dy34 - (y1-y2)*c34) / den))
             if cur_in:
-                if not prev_in:
-                    out.append(_line_intersection(prev, cur, a, b))
                 out.append(cur)
-            else:
-                if prev_in:
-                    out.append(_line_intersection(prev, cur, a, b))
-            prev, prev_in = cur, cur_in
+            x1, y1, prev_in = x2, y2, cur_in
+    return out
+
+
+# At or above this many subject x clipper vertices, clip_convex / clip_convex_many
+# clip a convex subject with convex_intersection instead of Sutherland-Hodgman
+# (see benchmarks/convex_clip.py for the crossover).
+CONVEX_KERNEL_MIN_PRODUCT = 256
+
+
+def _clipper_ccw(prepared: PreparedClipper) -> Poly:
+    pts = [(e[0], e[1]) for e in prepared[0]]
+    return pts if prepared[1] else pts[::-1]
+
+
+def convex_intersection(subject: Poly, clipper: Poly) -> Poly | None:
+    """Intersection of two convex polygons in O(n + m) (O'Rourke's edge chasing).
+
+    Either winding works; the result has the subject's winding. Returns None when
+    a vertex lies within EPS of the other polygon's edge line where the chase
+    looks at it (which includes shared edges); callers then clip with
+    Sutherland-Hodgman, which handles those contacts. Otherwise the result is the
+    polygon Sutherland-Hodgman returns, up to its starting vertex and the rounding
+    of crossing points: both intersect the same two edge lines, but
+    Sutherland-Hodgman takes the subject's line from an already clipped edge.
+    """
+    ccw = is_ccw(subject)
+    P = subject if ccw else subject[::-1]
+    Q = clipper if is_ccw(clipper) else clipper[::-1]
+    out = _intersect_ccw(P, Q)
+    if out is None or ccw:
+        return out
+    return out[::-1]
+
+
+def _side(o: Point, d: Point, p: Point) -> int:
+    """1 / -1 if p is left / right of the line o->d by more than EPS (the _inside band), else 0."""
+    v = (d[0]-o[0])*(p[1]-o[1]) - (d[1]-o[1])*(p[0]-o[0])
+    return 1 if v > EPS else (-1 if v < -EPS else 0)
+
+
+def _intersect_ccw(P: Poly, Q: Poly) -> Poly | None:
+    n, m = len(P), len(Q)
+    if n < 3 or m < 3:
+        return None
+    out: Poly = []
+    a = b = aa = ba = 0
+    inflag = 0  # 1: P's boundary is inside Q, 2: Q's inside P, 0: no crossing yet
+    while (aa < n or ba < m) and aa < 2*n and ba < 2*m:
+        pa1, pa = P[a-1], P[a]
+        qb1, qb = Q[b-1], Q[b]
+        px1, py1 = pa1
+        px, py = pa
+        qx1, qy1 = qb1
+        qx, qy = qb
+        ax, ay = px - px1, py - py1
+        bx, by = qx - qx1, qy - qy1
+        # Cross products for the sides of pa, pa1 of edge b and of qb, qb1 of edge a.
+        a_hb = bx*(py - qy1) - by*(px - qx1)
+        a1_hb = bx*(py1 - qy1) - by*(px1 - qx1)
+        b_ha = ax*(qy - py1) - ay*(qx - px1)
+        b1_ha = ax*(qy1 - py1) - ay*(qx1 - px1)
+        if -EPS <= a_hb <= EPS or -EPS <= a1_hb <= EPS or -EPS <= b_ha <= EPS or -EPS <= b1_ha <= EPS:
+            return None
+        if (a1_hb > 0) != (a_hb > 0) and (b1_ha > 0) != (b_ha > 0):
+            if inflag == 0:
+                aa = ba = 0
+            out.append(_line_intersection(pa1, pa, qb1, qb))
+            inflag = 1 if a_hb > 0 else 2
+        cross = ax*by - ay*bx
+        if cross == 0.0 and a_hb < 0 and b_ha < 0:
+            return []  # parallel edges facing away: separated
+        if (b_ha > 0) if cross >= 0.0 else (a_hb < 0):
+            if inflag == 1:
+                out.append(pa)
+            a = (a+1) % n
+            aa += 1
+        else:
+            if inflag == 2:
+                out.append(qb)
+            b = (b+1) % m
+            ba += 1
+
+    if inflag == 0:
+        # No edges cross: one polygon contains the other, or they are disjoint.
+        sides = [_side(Q[j-1], Q[j], P[0]) for j in range(m)]
+        if 0 in sides:
+            return None
+        if all(v > 0 for v in sides):
+            return list(P)
+        sides = [_side(P[i-1], P[i], Q[0]) for i in range(n)]
+        if 0 in sides:
+            return None
+        return list(Q) if all(v > 0 for v in sides) else []
+    # The chase comes back to its first crossing; drop the repeat.
+    while len(out) > 1 and out[-1] == out[0]:
+        out.pop()
+    return [p for i, p in enumerate(out) if i == 0 or p != out[i-1]]
+
+
+def _kernel_clip(subject: Poly, prepared: PreparedClipper) -> Poly | None:
+    """convex_intersection's result if `subject` is large enough and convex, else None."""
+    if len(subject) * len(prepared[0]) >= CONVEX_KERNEL_MIN_PRODUCT and _is_convex_polygon(subject):
+        return convex_intersection(subject, _clipper_ccw(prepared))
+    return None
+
+
+def _clip_one(subject: Poly, prepared: PreparedClipper) -> Poly:
+    out = _kernel_clip(subject, prepared)
+    return clip_prepared(subject, prepared) if out is None else out
+
+
+# Below this many subject vertices in total, clip_convex_many's NumPy path costs
+# more in array setup than it saves.
+NUMPY_MIN_VERTICES = 512
+
+
+def _load_numpy(required: bool):
+    """The numpy module: imported if `required`, else only if something already imported it.
+
+    Importing NumPy takes ~100ms, far more than it saves on any one clip, so the
+    automatic path only uses it once it is loaded anyway.
+    """
+    np = sys.modules.get("numpy")
+    if np is None and required:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ValueError("use_numpy=True but NumPy is not installed") from None
+    return np
+
+
+# The ContextVar behind counting(), created by its first call so that contextvars
+# stays off the CLI startup path; dict.setdefault keeps that creation atomic.
+_COUNTERS: dict = {}
+
+
+def counting() -> _Counting:
+    """Collect this context's operation counts: `with counting() as counts: ...`.
+
+    counts["clip_paths"] holds clip_convex_many's prefilter decisions: subjects
+    returned unchanged because every vertex is inside, returned empty because
+    their bbox misses the clipper's, and actually clipped. counts["simplify"]
+    holds simplify_polygon's removals. Counts go to the innermost block of the
+    calling thread (or task) only, so concurrent builds never mix; outside a
+    block nothing is counted. engine.scene uses this for profiled builds.
+    """
+    var = _COUNTERS.get("var")
+    if var is None:
+        from contextvars import ContextVar
+
+        var = _COUNTERS.setdefault("var", ContextVar("engine.geom counts", default=None))
+    return _Counting(var)
+
+
+class _Counting:
+    def __init__(self, var):
+        self.var = var
+        self.counts = {"clip_paths": {"inside": 0, "outside": 0, "clipped": 0},
+                       "simplify": {"vertices_removed": 0, "slivers_removed": 0}}
+
+    def __enter__(self) -> dict:
+        self.token = self.var.set(self.counts)
+        return self.counts
+
+    def __exit__(self, *exc) -> None:
+        self.var.reset(self.token)
+
+
+def _counts(group: str):
+    """The counts dict for `group` in the active counting() block, or None."""
+    var = _COUNTERS.get("var")
+    counts = var.get() if var is not None else None
+    return counts[group] if counts is not None else None
+
+
+def classify_against_clipper(subject: Poly, prepared: PreparedClipper, bbox=None) -> int:
+    """1 if clipping `subject` would return it unchanged, -1 if it would return [], 0 otherwise.
+
+    The bbox tests run first: against the clipper's bbox (disjoint: -1) and its
+    inner box (contained: 1). Otherwise the containment test is point_in_convex for
+    every vertex, with the prepared edges and the exact inside test clip_prepared
+    uses, so "inside" subjects come back from clipping unchanged. `bbox` is the
+    subject's (min_x, min_y, max_x, max_y) if the caller has it cached.
+    """
+    if not subject:
+        return -1
+    edges, keep_left, (cx0, cy0, cx1, cy1), margin, inner = prepared
+    if bbox is None:
+        xs = [p[0] for p in subject]
+        ys = [p[1] for p in subject]
+        bbox = min(xs), min(ys), max(xs), max(ys)
+    sx0, sy0, sx1, sy1 = bbox
+    if sx0 > cx1 + margin or sx1 < cx0 - margin or sy0 > cy1 + margin or sy1 < cy0 - margin:
+        return -1
+    if inner is not None and sx0 >= inner[0] and sy0 >= inner[1] and sx1 <= inner[2] and sy1 <= inner[3]:
+        return 1
+    if sx0 < cx0 or sx1 > cx1 or sy0 < cy0 or sy1 > cy1:
+        return 0
+    for ax, ay, ex, ey, _dx, _dy, _c in edges:
+        for x, y in subject:
+            cross = ex*(y - ay) - ey*(x - ax)
+            if not (cross >= -EPS if keep_left else cross <= EPS):
+                return 0
+    return 1
+
+
+def clip_convex_many(
+    subjects: list[Poly], prepared: PreparedClipper, use_numpy: bool | None = None, bboxes: list | None = None
+) -> list[Poly]:
+    """Clip every subject against one prepared convex clipper; returns one polygon per subject.
+
+    Subjects fully inside the clipper come back as copies of themselves and
+    subjects whose bbox misses the clipper come back empty (see
+    classify_against_clipper); only the rest are clipped. With `use_numpy=True`,
+    or by default when NumPy is already imported and those subjects have at least
+    NUMPY_MIN_VERTICES vertices in total, those clip_convex would not hand to
+    convex_intersection are clipped together in one vectorized pass per clipper
+    edge; otherwise each goes through clip_prepared. Every path returns exactly
+    what clip_convex would. `bboxes`, if given, holds
+    each subject's bbox (e.g. from engine.spatial).
+    """
+    out: list[Poly] = []
+    straddling: list[int] = []
+    inside = 0
+    for i, subject in enumerate(subjects):
+        where = classify_against_clipper(subject, prepared, bboxes[i] if bboxes is not None else None)
+        if where > 0:
+            inside += 1
+            out.append(list(subject))
+        elif where < 0:
+            out.append([])
+        else:
+            straddling.append(i)
+            out.append(subject)  # replaced below
+    paths = _counts("clip_paths")
+    if paths is not None:
+        paths["inside"] += inside
+        paths["outside"] += len(subjects) - inside - len(straddling)
+        paths["clipped"] += len(straddling)
+    if not straddling:
+        return out
+
+    kernel = [_kernel_clip(subjects[i], prepared) for i in straddling]
+    todo = [subjects[i] for i, k in zip(straddling, kernel) if k is None]
+    np = None
+    if use_numpy or (use_numpy is None and sum(len(s) for s in todo) >= NUMPY_MIN_VERTICES):
+        np = _load_numpy(required=bool(use_numpy))
+    if np is None:
+        rest = iter([clip_prepared(s, prepared) for s in todo])
+    else:
+        from engine.geom_numpy import clip_prepared_many
+
+        rest = iter(clip_prepared_many(np, todo, prepared) if todo else [])
+    clipped = [next(rest) if k is None else k for k in kernel]
+    for i, poly in zip(straddling, clipped):
+        out[i] = poly
+    return out
+
+
+# (t, hit point, polygon index, edge index); edge i runs from vertex i to i+1.
+RayHit = tuple[float, Point, int, int]
+
+# Below this many ray-edge tests, cast_rays' NumPy path costs more in array setup
+# than it saves.
+NUMPY_MIN_RAY_EDGES = 1024
+
+# Ray-edge tests per NumPy chunk, bounding the temporary arrays.
+_RAY_CHUNK = 1 << 18
+
+
+def cast_rays(
+    origins: list[Point], directions: list[Point], polygons: list[Poly], use_numpy: bool | None = None
+) -> list[RayHit | None]:
+    """First boundary hit of each ray origins[k] + t*directions[k] over a set of polygons.
+
+    Every ray is tested against every edge of every polygon. Returns one entry per
+    ray: the nearest hit with t > EPS as a RayHit, or None. Each edge test is
+    ray_segment_intersection's arithmetic, so for a single polygon t and the point
+    equal first_ray_polygon_hit's; among equal t the first polygon, then the first
+    edge, wins. With `use_numpy=True`, or by default when NumPy is already imported
+    and there are at least NUMPY_MIN_RAY_EDGES ray-edge tests, all rays are tested
+    in one vectorized pass; the result is the same.
+    """
+    if len(origins) != len(directions):
+        raise ValueError("cast_rays needs one direction per origin")
+    edges = []
+    for pi, poly in enumerate(polygons):
+        n = len(poly)
+        if n < 2:
+            continue
+        for i in range(n):
+            ax, ay = poly[i]
+            bx, by = poly[(i+1) % n]
+            edges.append((ax, ay, bx-ax, by-ay, pi, i))
+    if not edges or not origins:
+        return [None] * len(origins)
+    np = None
+    if use_numpy or (use_numpy is None and len(origins) * len(edges) >= NUMPY_MIN_RAY_EDGES):
+        np = _load_numpy(required=bool(use_numpy))
+    if np is not None:
+        return _cast_rays_numpy(np, origins, directions, edges)
+
+    out: list[RayHit | None] = []
+    for (rx, ry), (rdx, rdy) in zip(origins, directions):
+        best = None
+        for ax, ay, sx, sy, pi, i in edges:
+            den = rdx*sy - rdy*sx
+            if abs(den) < EPS:
+                continue
+            qx, qy = ax-rx, ay-ry
+            t = (qx*sy - qy*sx) / den
+            if t < EPS:
+                continue
+            u = (qx*rdy - qy*rdx) / den
+            if u >= -EPS and u <= 1.0 + EPS and (best is None or t < best[0]):
+                best = (t, pi, i)
+        if best is None:
+            out.append(None)
+        else:
+            t, pi, i = best
+            out.append((float(t), (rx + t*rdx, ry + t*rdy), pi, i))
+    return out
+
+
+def _cast_rays_numpy(np, origins, directions, edges) -> list[RayHit | None]:
+    ax, ay, sx, sy, poly_ids, edge_ids = (np.array(col) for col in zip(*edges))
+    ax, ay, sx, sy = (a.astype(np.float64) for a in (ax, ay, sx, sy))
+    rays = np.array([(o[0], o[1], d[0], d[1]) for o, d in zip(origins, directions)], dtype=np.float64)
+    out: list[RayHit | None] = []
+    step = max(1, _RAY_CHUNK // len(edges))
+    for at in range(0, len(rays), step):
+        rx, ry, rdx, rdy = (c[:, None] for c in rays[at:at + step].T)
+        den = rdx*sy - rdy*sx
+        qx, qy = ax - rx, ay - ry
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (qx*sy - qy*sx) / den
+            u = (qx*rdy - qy*rdx) / den
+        valid = (np.abs(den) >= EPS) & (t >= EPS) & (u >= -EPS) & (u <= 1.0 + EPS)
+        t = np.where(valid, t, np.inf)
+        best = t.argmin(axis=1)  # first minimum: same tie-break as the loop
+        rows = np.arange(len(best))
+        hit = valid[rows, best]
+        bt = np.where(hit, t[rows, best], 0.0)  # no inf*0 for rays that miss
+        px = rx[:, 0] + bt*rdx[:, 0]
+        py = ry[:, 0] + bt*rdy[:, 0]
+        for k, h in enumerate(hit.tolist()):
+            if not h:
+                out.append(None)
+                continue
+            e = int(best[k])
+            out.append((float(bt[k]), (float(px[k]), float(py[k])), int(poly_ids[e]), int(edge_ids[e])))
     return out
 
 
+# simplify_polygon's default tolerance: footprints are written with 6 decimals, so
+# a vertex closer than this to its neighbours' line does not change the output.
+SIMPLIFY_TOLERANCE = 1e-6
+
+def simplify_polygon(poly: Poly, tol: float = SIMPLIFY_TOLERANCE) -> Poly:
+    """Drop duplicate and collinear vertices; returns [] for a zero-area sliver.
+
+    A vertex goes when it lies within `tol` of the line through its neighbours
+    (or its neighbours coincide within `tol`), which covers repeated points,
+    points along an edge and the tips of zero-width spikes. Passes repeat until
+    nothing changes. Fewer than three vertices left means the polygon had no
+    area wider than `tol`, and the result is []. The vertices kept are unchanged.
+    """
+    pts = list(poly)
+    n0 = len(pts)
+    if n0 < 3:
+        return pts
+    changed = True
+    while changed and len(pts) >= 3:
+        changed = False
+        out: Poly = []
+        n = len(pts)
+        for i in range(n):
+            ax, ay = out[-1] if out else pts[-1]
+            bx, by = pts[i]
+            cx, cy = pts[(i+1) % n] if i+1 < n or not out else out[0]
+            dx, dy = cx - ax, cy - ay
+            length = math.hypot(dx, dy)
+            if length <= tol or abs(dx*(by - ay) - dy*(bx - ax)) <= tol*length:
+                changed = True
+                continue
+            out.append(pts[i])
+        pts = out
+    removed = _counts("simplify")
+    if len(pts) < 3:
+        pts = []
+        if removed is not None:
+            removed["slivers_removed"] += 1
+    if removed is not None:
+        removed["vertices_removed"] += n0 - len(pts)
+    return pts
+
+
 def _is_convex_polygon(poly: Poly) -> bool:
     """Return True iff `poly` is convex in 2D.
 
@@ -176,6 +650,11 @@ def _is_convex_polygon(poly: Poly) -> bool:
     - Allows collinear consecutive edges
     - Rejects degenerate (all-collinear) polygons
     """
+    if isinstance(poly, Polygon):
+        return poly.is_convex
+    return _convex(poly)
+
+def _convex(poly: Poly) -> bool:
     n = len(poly)
     if n < 3:
         return False
@@ -210,3 +689,259 @@ def point_in_convex(p: Point, poly: Poly) -> bool:
         if not _inside(p, a, b, keep_left=ccw):
             return False
     return True
+
+
+class Polygon:
+    """A polygon stored as one flat array('d') [x0, y0, x1, y1, ...], with cached derived data.
+
+    It is a sequence of (x, y) tuples, so every function here (and in
+    engine.features) that takes a Poly takes a Polygon as is. signed_area, is_ccw,
+    _is_convex_polygon and features._bbox return its cached value instead of
+    walking the vertices again, and prepare_convex_clipper / clip_convex return
+    its cached `prepared` clipper. The area, bbox, convexity, edge normals and
+    prepared clipper are computed on first use with the same arithmetic as the
+    list versions; any mutation (item assignment, del, append, insert, extend,
+    reverse) drops them. Scene footprints stay plain lists, since they are
+    serialized; wrap one to query it repeatedly (engine.spatial's index caches
+    one per object for operators, the constraints compiler one per looked-up
+    object).
+    """
+
+    __slots__ = ("_xy", "_area", "_bbox", "_convex", "_normals", "_prepared")
+
+    def __init__(self, points=()):
+        from array import array  # imports collections; kept off the CLI startup path
+
+        self._xy = array("d", [c for p in points for c in (p[0], p[1])])
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._area = self._bbox = self._convex = self._normals = self._prepared = None
+
+    # -- sequence of points -------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._xy) // 2
+
+    def __iter__(self):
+        it = iter(self._xy)
+        return zip(it, it)
+
+    def _index(self, i: int) -> int:
+        n = len(self._xy) // 2
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("polygon index out of range")
+        return 2 * i
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            pts = list(self)
+            return Polygon(pts[i])
+        k = self._index(i)
+        xy = self._xy
+        return (xy[k], xy[k + 1])
+
+    def __setitem__(self, i: int, p: Point) -> None:
+        k = self._index(i)
+        self._xy[k] = p[0]
+        self._xy[k + 1] = p[1]
+        self._invalidate()
+
+    def __delitem__(self, i: int) -> None:
+        k = self._index(i)
+        del self._xy[k:k + 2]
+        self._invalidate()
+
+    def append(self, p: Point) -> None:
+        self._xy.extend((p[0], p[1]))
+        self._invalidate()
+
+    def insert(self, i: int, p: Point) -> None:
+        n = len(self)
+        i = max(0, min(n, i + n if i < 0 else i))
+        self._xy[2 * i:2 * i] = type(self._xy)("d", (p[0], p[1]))
+        self._invalidate()
+
+    def extend(self, points) -> None:
+        self._xy.extend(c for p in points for c in (p[0], p[1]))
+        self._invalidate()
+
+    def reverse(self) -> None:
+        pts = list(self)
+        pts.reverse()
+        self._xy = type(self._xy)("d", [c for p in pts for c in p])
+        self._invalidate()
+
+    def __eq__(self, other):
+        if isinstance(other, Polygon):
+            return self._xy == other._xy
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Polygon({list(self)!r})"
+
+    # -- derived data -------------------------------------------------------
+
+    @property
+    def area(self) -> float:
+        """Signed area (positive when counter-clockwise)."""
+        if self._area is None:
+            self._area = _signed_area(self)
+        return self._area
+
+    @property
+    def is_ccw(self) -> bool:
+        return self.area > 0
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float] | None:
+        """(min_x, min_y, max_x, max_y), or None for an empty polygon."""
+        if self._bbox is None and self._xy:
+            xs, ys = self._xy[0::2], self._xy[1::2]
+            self._bbox = (min(xs), min(ys), max(xs), max(ys))
+        return self._bbox
+
+    @property
+    def is_convex(self) -> bool:
+        if self._convex is None:
+            self._convex = _convex(self)
+        return self._convex
+
+    @property
+    def normals(self) -> tuple[Point, ...]:
+        """Outward unit normal of each edge i -> i+1 ((0.0, 0.0) for a zero-length edge)."""
+        if self._normals is None:
+            pts = list(self)
+            ccw = self.is_ccw
+            out = []
+            for (x1, y1), (x2, y2) in zip(pts, pts[1:] + pts[:1]):
+                dx, dy = x2 - x1, y2 - y1
+                length = math.hypot(dx, dy)
+                if length == 0.0:
+                    out.append((0.0, 0.0))
+                else:
+                    out.append((dy / length, -dx / length) if ccw else (-dy / length, dx / length))
+            self._normals = tuple(out)
+        return self._normals
+
+    @property
+    def prepared(self) -> PreparedClipper:
+        """prepare_convex_clipper's result for this polygon (ValueError if it is not convex)."""
+        if self._prepared is None:
+            if not self.is_convex:
+                raise ValueError("clip_convex: clipper polygon must be convex")
+            self._prepared = _prepare(list(self), self.is_ccw)
+        return self._prepared
+
+
+# -- Geometry backends ----------------------------------------------------------
+#
+# The batch geometry operations operators use, behind one interface:
+#
+#     geo = get_backend()
+#     geo.clip(subjects, prepared)                   # clip_convex of each subject
+#     geo.clip_halfplane(subjects, p0, n)            # clip_halfplane of each subject
+#     geo.ray_hits(origins, directions, polygons)    # cast_rays
+#     geo.points_in_convex(points, poly)             # point_in_convex of each point
+#     geo.areas(polys), geo.bboxes(polys)            # signed_area / bbox of each polygon
+#
+# $AICADDIE_GEOM_BACKEND, or set_backend(name), picks the backend: "auto" (default:
+# pure Python, NumPy for large batches once something imported it), "python" or
+# "numpy" (ValueError if NumPy is not installed). The NumPy code (here and in
+# engine.geom_numpy) does the scalar arithmetic elementwise, so every backend
+# returns the same values bit for bit; tests/test_geom_backend.py checks that on
+# random inputs.
+
+BACKENDS = {"auto": None, "python": False, "numpy": True}
+
+# Below this many vertices (or points) in a batch, "auto" stays in pure Python.
+NUMPY_MIN_BATCH = 512
+
+
+class GeometryBackend:
+    """The geometry interface; `use_numpy` is None (auto), False or True, as in clip_convex_many."""
+
+    def __init__(self, name: str):
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown geometry backend {name!r} (expected one of {', '.join(BACKENDS)})")
+        self.name = name
+        self.use_numpy = BACKENDS[name]
+        if self.use_numpy:
+            _load_numpy(required=True)
+
+    def __repr__(self) -> str:
+        return f"GeometryBackend({self.name!r})"
+
+    def _numpy(self, size: int):
+        if self.use_numpy is None:
+            return _load_numpy(required=False) if size >= NUMPY_MIN_BATCH else None
+        return _load_numpy(required=True) if self.use_numpy else None
+
+    def clip(self, subjects: list[Poly], prepared, bboxes: list | None = None) -> list[Poly]:
+        return clip_convex_many(subjects, prepared, use_numpy=self.use_numpy, bboxes=bboxes)
+
+    def clip_halfplane(self, subjects: list[Poly], p0, n, keep_leq: bool = True) -> list[Poly]:
+        np = self._numpy(sum(len(s) for s in subjects))
+        if np is None:
+            return [clip_halfplane(s, p0, n, keep_leq) for s in subjects]
+        from engine.geom_numpy import clip_halfplane_many
+
+        return clip_halfplane_many(np, subjects, p0, n, keep_leq)
+
+    def ray_hits(self, origins, directions, polygons: list[Poly]) -> list:
+        return cast_rays(origins, directions, polygons, use_numpy=self.use_numpy)
+
+    def points_in_convex(self, points, poly: Poly) -> list[bool]:
+        np = self._numpy(len(points))
+        if np is None or not poly:
+            return [point_in_convex(p, poly) for p in points]
+        from engine.geom_numpy import points_in_convex
+
+        return points_in_convex(np, points, poly)
+
+    def areas(self, polys: list[Poly]) -> list[float]:
+        np = self._numpy(sum(len(p) for p in polys))
+        if np is None:
+            return [signed_area(p) for p in polys]
+        from engine.geom_numpy import areas
+
+        return areas(np, polys)
+
+    def bboxes(self, polys: list[Poly]) -> list:
+        """(min_x, min_y, max_x, max_y) of each polygon, None for an empty one."""
+        np = self._numpy(sum(len(p) for p in polys))
+        if np is None:
+            out = []
+            for poly in polys:
+                if not poly:
+                    out.append(None)
+                    continue
+                xs = [p[0] for p in poly]
+                ys = [p[1] for p in poly]
+                out.append((min(xs), min(ys), max(xs), max(ys)))
+            return out
+        from engine.geom_numpy import bboxes
+
+        return bboxes(np, polys)
+
+
+_current: GeometryBackend | None = None
+
+
+def get_backend() -> GeometryBackend:
+    """The backend set with set_backend, else the one $AICADDIE_GEOM_BACKEND names (default auto)."""
+    global _current
+    if _current is None:
+        _current = GeometryBackend(os.environ.get("AICADDIE_GEOM_BACKEND", "auto").strip().lower() or "auto")
+    return _current
+
+
+def set_backend(name: str | None) -> GeometryBackend | None:
+    """Select the backend by name; None goes back to $AICADDIE_GEOM_BACKEND on next use."""
+    global _current
+    _current = None if name is None else GeometryBackend(name)
+    return _current
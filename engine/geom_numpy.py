@@ -0,0 +1,153 @@
+"""NumPy implementations behind engine.geom's GeometryBackend (imported only when a NumPy path runs).
+
+Each function takes the numpy module first and returns exactly what the scalar
+engine.geom code returns for the same input.
+"""
+from __future__ import annotations
+
+from engine.geom import EPS, Poly, signed_area
+
+
+def _flatten(np, polys: list[Poly]):
+    """(counts, xs, ys, prev) for all vertices; prev[i] is the index of i's previous vertex in its polygon."""
+    counts = np.fromiter((len(p) for p in polys), dtype=np.intp, count=len(polys))
+    xs = np.fromiter((float(q[0]) for p in polys for q in p), dtype=np.float64)
+    ys = np.fromiter((float(q[1]) for p in polys for q in p), dtype=np.float64)
+    return counts, xs, ys, _prev_index(np, counts, xs.size)
+
+
+def _prev_index(np, counts, size):
+    """Index of each vertex's previous vertex, wrapping to the last one of its polygon."""
+    starts = np.cumsum(counts) - counts
+    live = counts > 0
+    prev = np.arange(-1, size - 1)
+    prev[starts[live]] = starts[live] + counts[live] - 1
+    return prev
+
+
+def _emit(np, xs, ys, inside, crossing, ix, iy):
+    """One clipping pass: each vertex emits [intersection if its edge crosses] then [itself if inside].
+
+    Returns the new (xs, ys) and how many vertices each old vertex emitted.
+    """
+    emitted = crossing.astype(np.intp) + inside
+    pos = np.cumsum(emitted) - emitted
+    out_x = np.empty(int(emitted.sum()))
+    out_y = np.empty_like(out_x)
+    at = pos[crossing]
+    out_x[at] = ix[crossing]
+    out_y[at] = iy[crossing]
+    at = pos[inside] + crossing[inside]
+    out_x[at] = xs[inside]
+    out_y[at] = ys[inside]
+    return out_x, out_y, emitted
+
+
+def _split(xs, ys, counts) -> list[Poly]:
+    pts = list(zip(xs.tolist(), ys.tolist()))
+    out: list[Poly] = []
+    at = 0
+    for n in counts.tolist():
+        out.append(pts[at:at + n])
+        at += n
+    return out
+
+
+def clip_halfplane_many(np, subjects, p0, n, keep_leq) -> list[Poly]:
+    counts, xs, ys, prev = _flatten(np, subjects)
+    nx, ny = float(n[0]), float(n[1])
+    x0, y0 = float(p0[0]), float(p0[1])
+    v = (xs - x0)*nx + (ys - y0)*ny
+    inside = v <= EPS if keep_leq else v >= -EPS
+    crossing = inside != inside[prev]
+
+    # clip_halfplane's intersect(prev, cur), with its parallel fallback and clamp.
+    ax, ay = xs[prev], ys[prev]
+    dax, day = xs - ax, ys - ay
+    denom = dax*nx + day*ny
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = -((ax - x0)*nx + (ay - y0)*ny) / denom
+    t = np.where(t < 0.0, 0.0, np.where(t > 1.0, 1.0, t))
+    parallel = np.abs(denom) < EPS
+    ix = np.where(parallel, xs, ax + t*dax)
+    iy = np.where(parallel, ys, ay + t*day)
+
+    out_x, out_y, emitted = _emit(np, xs, ys, inside, crossing, ix, iy)
+    poly_ids = np.repeat(np.repeat(np.arange(len(subjects)), counts), emitted)
+    return _split(out_x, out_y, np.bincount(poly_ids, minlength=len(subjects)))
+
+
+def clip_prepared_many(np, subjects, prepared) -> list[Poly]:
+    """clip_prepared for every subject: one vectorized pass per clipper edge."""
+    edges, keep_left = prepared[0], prepared[1]
+    counts, xs, ys, prev = _flatten(np, subjects)
+    poly_ids = np.repeat(np.arange(len(subjects)), counts)
+    for i, (ax, ay, ex, ey, dx34, dy34, c34) in enumerate(edges):
+        if not xs.size:
+            break
+        if i:
+            prev = _prev_index(np, counts, xs.size)
+        cross = ex*(ys - ay) - ey*(xs - ax)
+        inside = cross >= -EPS if keep_left else cross <= EPS
+        crossing = inside != inside[prev]
+
+        # clip_prepared's line-line intersection of edge prev->cur with the clipper edge.
+        x1, y1 = xs[prev], ys[prev]
+        den = (x1-xs)*dy34 - (y1-ys)*dx34
+        c12 = x1*ys - y1*xs
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ix = (c12*dx34 - (x1-xs)*c34) / den
+            iy = (c12*dy34 - (y1-ys)*c34) / den
+        parallel = np.abs(den) < EPS
+        ix = np.where(parallel, xs, ix)
+        iy = np.where(parallel, ys, iy)
+
+        xs, ys, emitted = _emit(np, xs, ys, inside, crossing, ix, iy)
+        poly_ids = np.repeat(poly_ids, emitted)
+        counts = np.bincount(poly_ids, minlength=len(subjects))
+    return _split(xs, ys, counts)
+
+
+def points_in_convex(np, points, poly) -> list[bool]:
+    px = np.fromiter((float(p[0]) for p in points), dtype=np.float64, count=len(points))
+    py = np.fromiter((float(p[1]) for p in points), dtype=np.float64, count=len(points))
+    keep_left = signed_area(poly) > 0
+    inside = np.ones(len(points), dtype=bool)
+    m = len(poly)
+    for i in range(m):
+        ax, ay = poly[i]
+        bx, by = poly[(i+1) % m]
+        cross = (bx-ax)*(py-ay) - (by-ay)*(px-ax)
+        inside &= cross >= -EPS if keep_left else cross <= EPS
+    return inside.tolist()
+
+
+def areas(np, polys) -> list[float]:
+    counts, xs, ys, prev = _flatten(np, polys)
+    # signed_area adds x1*y2 - y1*x2 for each edge 1->2 in vertex order; the terms
+    # are vectorized, the sum stays sequential so it rounds the same way.
+    nxt = np.empty_like(prev)
+    nxt[prev] = np.arange(xs.size)
+    terms = (xs*ys[nxt] - ys*xs[nxt]).tolist()
+    out = []
+    at = 0
+    for n in counts.tolist():
+        a = 0.0
+        for term in terms[at:at + n]:
+            a += term
+        out.append(0.5*a)
+        at += n
+    return out
+
+
+def bboxes(np, polys) -> list:
+    counts, xs, ys, _prev = _flatten(np, polys)
+    live = counts > 0
+    starts = (np.cumsum(counts) - counts)[live]
+    boxes = zip(
+        np.minimum.reduceat(xs, starts).tolist() if xs.size else [],
+        np.minimum.reduceat(ys, starts).tolist() if xs.size else [],
+        np.maximum.reduceat(xs, starts).tolist() if xs.size else [],
+        np.maximum.reduceat(ys, starts).tolist() if xs.size else [],
+    )
+    return [next(boxes) if n else None for n in live.tolist()]
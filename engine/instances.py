@@ -0,0 +1,164 @@
+"""Lazy instance arrays for build_scene(..., lazy_arrays=True).
+
+In lazy mode the objects map is a LazyObjects mapping, and
+distribute_evenly_between adds one InstanceArray to it instead of resolving
+`count` objects. The array stores the template, the two anchor points and the
+count, and resolves instance i when something reads it. Nothing keeps read
+instances; only an instance a later operator replaces (objects[id] = ...) is
+stored. Memory for a large array is therefore the array record plus whatever
+operators changed.
+
+Instances come out exactly as the eager operator builds them: same start-point
+arithmetic, same params sharing, same resolver. Iterating the mapping yields ids
+in the order a serial eager build inserts them.
+"""
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+
+
+class InstanceArray:
+    """`count` instances of a template spaced evenly between two anchor points."""
+
+    __slots__ = ("base", "params", "placement", "id_prefix", "count", "a", "b", "resolve_fn")
+
+    def __init__(self, template: dict, id_prefix: str, count: int, a: tuple, b: tuple, resolve_fn):
+        self.base = {k: v for k, v in template.items() if k != "role"}
+        self.params = template.get("params", {})
+        self.placement = self.params.get("placement", {})
+        self.id_prefix = id_prefix
+        self.count = count
+        self.a = a
+        self.b = b
+        self.resolve_fn = resolve_fn
+
+    def ids(self):
+        prefix = self.id_prefix
+        return (f"{prefix}{i}" for i in range(1, self.count + 1))
+
+    def index(self, oid: str) -> int | None:
+        """1-based instance number of `oid`, or None if the id is not one of this array's."""
+        if not oid.startswith(self.id_prefix):
+            return None
+        suffix = oid[len(self.id_prefix):]
+        if not suffix.isdigit() or suffix[0] == "0":
+            return None
+        i = int(suffix)
+        return i if i <= self.count else None
+
+    def start(self, i: int) -> list[float]:
+        # Same arithmetic as distribute_evenly_between.apply.
+        ax, ay = self.a
+        bx, by = self.b
+        t = i / (self.count + 1.0)
+        return [ax + (bx - ax) * t, ay + (by - ay) * t]
+
+    def source(self, i: int) -> dict:
+        """The unresolved instance object (what the eager operator passes to resolve_fn)."""
+        inst = dict(self.base)
+        inst["id"] = f"{self.id_prefix}{i}"
+        inst["params"] = {**self.params, "placement": {**self.placement, "start": self.start(i)}}
+        return inst
+
+    def resolve(self, i: int) -> dict:
+        return self.resolve_fn(self.source(i))
+
+
+class LazyObjects(MutableMapping):
+    """An objects map holding plain objects plus InstanceArrays; see the module docstring."""
+
+    def __init__(self, objects: dict):
+        self._objects = dict(objects)          # plain objects and replaced instances
+        self._arrays: list[InstanceArray] = []
+        self._order: list = list(objects)      # ids and arrays, in insertion order
+        self._deleted: set[str] = set()        # removed array instances
+        self._spatial = None
+
+    def add_array(self, array: InstanceArray) -> bool:
+        """Add `array`'s instances after everything in the map.
+
+        Returns False (and adds nothing) if any of its ids is already taken; the
+        caller then creates the instances eagerly, which replaces objects in place.
+        """
+        related = [a for a in self._arrays
+                   if a.id_prefix.startswith(array.id_prefix) or array.id_prefix.startswith(a.id_prefix)]
+        for oid in array.ids():
+            if oid in self._objects or (related and any(a.index(oid) is not None for a in related)):
+                return False
+        self._arrays.append(array)
+        self._order.append(array)
+        if self._spatial is not None:
+            for oid in array.ids():
+                self._spatial.invalidate(oid)
+        return True
+
+    def _find(self, oid: str):
+        for array in self._arrays:
+            i = array.index(oid)
+            if i is not None:
+                return array, i
+        return None, None
+
+    def _is_instance(self, oid) -> bool:
+        """True if `oid` is a (not deleted) array instance, replaced or not."""
+        return isinstance(oid, str) and oid not in self._deleted and self._find(oid)[0] is not None
+
+    def __getitem__(self, oid: str) -> dict:
+        try:
+            return self._objects[oid]
+        except KeyError:
+            pass
+        if oid not in self._deleted:
+            array, i = self._find(oid)
+            if array is not None:
+                return array.resolve(i)
+        raise KeyError(oid)
+
+    def __contains__(self, oid) -> bool:
+        return oid in self._objects or self._is_instance(oid)
+
+    def __setitem__(self, oid: str, obj: dict) -> None:
+        # A replaced instance keeps its place in the array; a new id goes last.
+        if oid not in self._objects and not self._is_instance(oid):
+            self._order.append(oid)
+        self._objects[oid] = obj
+        if self._spatial is not None:
+            self._spatial.invalidate(oid)
+
+    def __delitem__(self, oid: str) -> None:
+        if self._is_instance(oid):
+            self._deleted.add(oid)
+            self._objects.pop(oid, None)
+        elif oid in self._objects:
+            del self._objects[oid]
+            self._order.remove(oid)
+        else:
+            raise KeyError(oid)
+        if self._spatial is not None:
+            self._spatial.invalidate(oid)
+
+    def __iter__(self):
+        deleted = self._deleted
+        for entry in self._order:
+            if isinstance(entry, InstanceArray):
+                for oid in entry.ids():
+                    if oid not in deleted:
+                        yield oid
+            else:
+                yield entry
+
+    def __len__(self) -> int:
+        return len(self._order) - len(self._arrays) + sum(a.count for a in self._arrays) - len(self._deleted)
+
+    def items(self):
+        # Without the per-id __contains__ / _find of the generic ItemsView.
+        for oid in self:
+            yield oid, self[oid]
+
+    @property
+    def spatial(self):
+        if self._spatial is None:
+            from engine.spatial import SpatialIndex
+
+            self._spatial = SpatialIndex(self)
+        return self._spatial
@@ -0,0 +1,14 @@
+"""Operator handlers (see registry/operators.json).
+
+Resolved objects are shared, not copied: an object's params may be the scene
+document's own dicts, and instances of a template share its unchanged parts. A
+handler must therefore never mutate an object, its params or its geom in place;
+it replaces the object in the `objects` map with an updated copy (see with_geom).
+"""
+
+
+def with_geom(obj: dict, **changes) -> dict:
+    """Return a copy of resolved `obj` whose geom has `changes` applied (one level deep)."""
+    out = dict(obj)
+    out["geom"] = {**obj["geom"], **changes}
+    return out
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from engine.geom import get_backend, prepare_convex_clipper
+from engine.operators import with_geom
 
-from engine.geom import clip_convex
+
+def validate(op: dict, known_ids: set, templates: dict) -> None:
+    """Check object references before any operator runs (same errors as apply)."""
+    if op["clip_object_id"] not in known_ids:
+        raise ValueError(f"clip_object_id not found: {op['clip_object_id']}")
+    for tid in op.get("target_ids", []):
+        if tid not in known_ids:
+            raise ValueError(f"target_id not found: {tid}")
+
+
+def access(op: dict) -> tuple[list[str], list[str]]:
+    """Object ids read and written (see engine.scene.plan_operator_waves)."""
+    targets = list(op.get("target_ids", []))
+    return [op["clip_object_id"], *targets], targets
 
 
 def apply(
-    objects: Dict[str, Dict[str, Any]],
-    templates: Dict[str, Dict[str, Any]],
-    op: Dict[str, Any],
+    objects: dict[str, dict],
+    templates: dict[str, dict],
+    op: dict,
     resolve_fn,
-) -> Dict[str, Dict[str, Any]]:
+) -> dict[str, dict]:
     """Clip target solid footprints by the clip object's footprint.
 
     Signature matches the operator registry contract.
@@ -27,6 +41,16 @@ def apply(
     if not clip_fp:
         return objects
 
+    # The clipper is split into edges once, from the index's cached Polygon (whose
+    # convexity and orientation carry over to later clips by the same object); all
+    # targets are then clipped in one batch, prefiltered with their indexed bboxes.
+    from engine.spatial import index_of
+
+    index = index_of(objects)
+    prepared = None
+    clipped_ids = []
+    subjects = []
+    bboxes = []
     for tid in target_ids:
         if tid not in objects:
             raise ValueError(f"target_id not found: {tid}")
@@ -35,10 +59,28 @@ def apply(
             # Only solids are clipped
             continue
         subj = tgeom.get("footprint", [])
-        clipped = clip_convex(
-            [(float(x), float(y)) for x, y in subj],
-            [(float(x), float(y)) for x, y in clip_fp],
-        )
-        tgeom["footprint"] = [[p[0], p[1]] for p in clipped]
+        if subj and prepared is None:
+            prepared = prepare_convex_clipper(index.polygon(clip_id))
+        clipped_ids.append(tid)
+        subjects.append([(float(x), float(y)) for x, y in subj])
+        bboxes.append(index.bbox(tid))
+
+    if prepared is None:
+        # No target has a footprint; every one clips to empty.
+        results = [[] for _ in subjects]
+    else:
+        results = get_backend().clip(subjects, prepared, bboxes=bboxes)
+    for tid, subj, clipped in zip(clipped_ids, subjects, results):
+        if clipped == subj and _holds_floats(objects[tid]["geom"]["footprint"]):
+            # Fully inside (or clipped to itself) and already written as floats: the
+            # target is left untouched, so its object, and everything cached for it,
+            # stay as they are.
+            continue
+        objects[tid] = with_geom(objects[tid], footprint=[[p[0], p[1]] for p in clipped])
 
     return objects
+
+
+def _holds_floats(footprint) -> bool:
+    """True if every coordinate is already a float (clipped footprints are written as floats)."""
+    return all(type(x) is float and type(y) is float for x, y in footprint)
@@ -1,12 +1,28 @@
 from __future__ import annotations
-from copy import deepcopy
-from typing import Any, Dict, Tuple
+def validate(op: dict, known_ids: set, templates: dict) -> list[str]:
+    """Check references before any operator runs (same errors as apply); returns the ids it will create."""
+    template_id = op["template_object_id"]
+    between = op["between_object_ids"]
+    count = int(op["count"])
+    id_prefix = op.get("id_prefix", f"{template_id}_")
+    if template_id not in templates:
+        raise ValueError(f"template_object_id not found (role=template): {template_id}")
+    if not (isinstance(between, list) and len(between) == 2):
+        raise ValueError("between_object_ids must be [id_a, id_b]")
+    if between[0] not in known_ids or between[1] not in known_ids:
+        raise ValueError("between_object_ids must reference concrete objects already in scene")
+    return [f"{id_prefix}{i}" for i in range(1, count+1)]
+
+def access(op: dict) -> tuple[list[str], list[str]]:
+    """Object ids read and written (see engine.scene.plan_operator_waves); writes are the created instances."""
+    template_id = op["template_object_id"]
+    id_prefix = op.get("id_prefix", f"{template_id}_")
+    return list(op["between_object_ids"]), [f"{id_prefix}{i}" for i in range(1, int(op["count"]) + 1)]
 
-def apply(objects: Dict[str, Dict[str, Any]], templates: Dict[str, Dict[str, Any]], op: Dict[str, Any], resolve_fn) -> Dict[str, Dict[str, Any]]:
+def apply(objects: dict[str, dict], templates: dict[str, dict], op: dict, resolve_fn) -> dict[str, dict]:
     """Apply distribute_evenly_between to the objects map.
 
-    This module isn't currently used by the bootstrap runner (engine.scene has an inlined implementation),
-    but it exists to match the registry contract and enable future refactors.
+    `resolve_fn(obj)` resolves one instance (engine.scene binds it to the prototype registry).
     """
     template_id = op["template_object_id"]
     between = op["between_object_ids"]
@@ -21,7 +37,7 @@ def apply(objects: Dict[str, Dict[str, Any]], templates: Dict[str, Dict[str, Any
     if a_id not in objects or b_id not in objects:
         raise ValueError("between_object_ids must reference concrete objects already in scene")
 
-    def _anchor_pt(obj) -> Tuple[float,float]:
+    def _anchor_pt(obj) -> tuple[float,float]:
         params = obj.get("params", {})
         plc = params.get("placement", {})
         start = plc.get("start")
@@ -36,17 +52,30 @@ def apply(objects: Dict[str, Dict[str, Any]], templates: Dict[str, Dict[str, Any
     ax, ay = _anchor_pt(objects[a_id])
     bx, by = _anchor_pt(objects[b_id])
 
+    # Lazy objects maps (build_scene(..., lazy_arrays=True)) take the whole array
+    # as one record and resolve instances when they are read.
+    add_array = getattr(objects, "add_array", None)
+    if add_array is not None:
+        from engine.instances import InstanceArray
+
+        if add_array(InstanceArray(templates[template_id], id_prefix, count, (ax, ay), (bx, by), resolve_fn)):
+            return objects
+
+    # Instances share everything with the template except the path down to
+    # params.placement.start (see engine.operators on copy-on-write objects).
+    template = templates[template_id]
+    base = {k: v for k, v in template.items() if k != "role"}
+    params = template.get("params", {})
+    placement = params.get("placement", {})
+
     for i in range(1, count+1):
         t = i / (count + 1.0)
         sx = ax + (bx - ax) * t
         sy = ay + (by - ay) * t
 
-        inst = deepcopy(templates[template_id])
-        inst.pop("role", None)
+        inst = dict(base)
         inst["id"] = f"{id_prefix}{i}"
-        inst.setdefault("params", {})
-        inst["params"].setdefault("placement", {})
-        inst["params"]["placement"]["start"] = [sx, sy]
+        inst["params"] = {**params, "placement": {**placement, "start": [sx, sy]}}
         objects[inst["id"]] = resolve_fn(inst)
 
     return objects
@@ -1,23 +1,35 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple
+from engine.geom import get_backend
+from engine.operators import with_geom
 
-from engine.geom import clip_halfplane, first_ray_polygon_hit
 
-
-def _unit(vx: float, vy: float) -> Tuple[float, float]:
+def _unit(vx: float, vy: float) -> tuple[float, float]:
     mag = (vx * vx + vy * vy) ** 0.5
     if mag == 0:
         raise ValueError("Zero-length direction vector")
     return vx / mag, vy / mag
 
 
+def validate(op: dict, known_ids: set, templates: dict) -> None:
+    """Check object references before any operator runs (same errors as apply)."""
+    if op["source_object_id"] not in known_ids:
+        raise ValueError(f"source_object_id not found: {op['source_object_id']}")
+    if op["target_object_id"] not in known_ids:
+        raise ValueError(f"target_object_id not found: {op['target_object_id']}")
+
+
+def access(op: dict) -> tuple[list[str], list[str]]:
+    """Object ids read and written (see engine.scene.plan_operator_waves)."""
+    return [op["source_object_id"], op["target_object_id"]], [op["source_object_id"]]
+
+
 def apply(
-    objects: Dict[str, Dict[str, Any]],
-    templates: Dict[str, Dict[str, Any]],
-    op: Dict[str, Any],
+    objects: dict[str, dict],
+    templates: dict[str, dict],
+    op: dict,
     resolve_fn,
-) -> Dict[str, Dict[str, Any]]:
+) -> dict[str, dict]:
     """Trim a source solid footprint by raycasting toward a target footprint.
 
     This v0.2 implementation trims only (it does not extend).
@@ -56,10 +68,12 @@ def apply(
     dx, dy = float(direction[0]), float(direction[1])
     udx, udy = _unit(dx, dy)
 
-    hit, _t_hit, p_hit = first_ray_polygon_hit((mx, my), (udx, udy), tfp)
-    if not hit:
+    geo = get_backend()
+    (hit,) = geo.ray_hits([(mx, my)], [(udx, udy)], [tfp])
+    if hit is None:
         return objects
+    p_hit = hit[1]
 
-    trimmed = clip_halfplane(sfp, p_hit, (udx, udy), keep_leq=True)
-    sgeom["footprint"] = [[p[0], p[1]] for p in trimmed]
+    (trimmed,) = geo.clip_halfplane([sfp], p_hit, (udx, udy), keep_leq=True)
+    objects[src_id] = with_geom(objects[src_id], footprint=[[p[0], p[1]] for p in trimmed])
     return objects
@@ -0,0 +1,245 @@
+"""Pipeline profiler.
+
+Collects wall and CPU time for each pipeline stage (compile, build, emit), each
+operator invocation and each prototype resolver call:
+
+    from engine.profile import Profiler
+    profiler = Profiler()
+    scad, resolved = run_scene(scene, registries, profiler=profiler)
+    report = profiler.report(top_n=10)
+
+or from the CLI:
+
+    python -m engine.run scene.json out.scad --profile report.json [--profile-top 10]
+
+Operators are identified by type and "op#<index>" (their position in the scene's
+operator list); resolver calls by prototype name and object id. Resolver time for
+instances created by an operator (distribute_evenly_between) is counted both under
+that operator and under the resolver, so the per-section totals can overlap.
+Caches report their hits, misses and entry count under "caches", and geometry
+fast paths how often each was taken under "counters" (e.g. clip_paths).
+
+`Profiler(memory=True)` (CLI: `--profile-memory`) also traces allocations with
+tracemalloc and reports, per stage and per operator, the peak allocated above the
+section's starting point and the bytes still retained at its end, plus the source
+lines that retained the most memory over the whole run. Tracing slows the pipeline
+down several-fold, so timings from a memory run are not comparable to plain ones.
+report() stops tracing if the profiler started it.
+"""
+from __future__ import annotations
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+# Stack depth kept per allocation, enough to reach the engine frame behind a deepcopy.
+_TRACE_FRAMES = 32
+_ENGINE_DIR = str(Path(__file__).resolve().parent)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
+
+
+def _kb(nbytes: int) -> float:
+    return round(nbytes / 1024.0, 3)
+
+
+class Profiler:
+    """Accumulates timings; pass one to run_scene / build_scene to enable profiling."""
+
+    def __init__(self, memory: bool = False, top_sites: int = 10):
+        self.stages: dict[str, list[float]] = {}       # stage -> [wall_s, cpu_s]
+        self.operators: list[dict] = []                # one record per invocation, in order
+        self.resolvers: dict[str, list[float]] = {}    # prototype -> [calls, wall_s, cpu_s]
+        self.objects: dict[str, list] = {}             # object id -> [prototype, wall_s, cpu_s]
+        self.caches: dict[str, dict] = {}              # cache name -> {"hits", "misses", "entries"}
+        self.counters: dict[str, dict] = {}            # counter group -> {name: count}
+
+        self.memory = memory
+        self.top_sites = top_sites
+        self.memory_stages: dict[str, list[int]] = {}  # stage -> [peak_bytes, retained_bytes]
+        self._mem_stack: list[list[int]] = []          # open sections: [start_bytes, peak_so_far]
+        self._sites: list[dict] | None = None
+        self._owns_tracing = False
+        if memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(_TRACE_FRAMES)
+                self._owns_tracing = True
+            self._baseline = tracemalloc.take_snapshot()
+
+    @staticmethod
+    def start() -> tuple[float, float]:
+        return time.perf_counter(), time.process_time()
+
+    @staticmethod
+    def _elapsed(started: tuple[float, float]) -> tuple[float, float]:
+        return time.perf_counter() - started[0], time.process_time() - started[1]
+
+    def _mem_enter(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._mem_stack:
+            # The enclosing section's peak so far must survive the reset below.
+            outer = self._mem_stack[-1]
+            outer[1] = max(outer[1], peak)
+        tracemalloc.reset_peak()
+        self._mem_stack.append([current, current])
+
+    def _mem_exit(self) -> tuple[int, int]:
+        """Close the innermost section; returns (peak above its start, bytes retained)."""
+        current, peak = tracemalloc.get_traced_memory()
+        start, peak_so_far = self._mem_stack.pop()
+        peak = max(peak, peak_so_far)
+        if self._mem_stack:
+            outer = self._mem_stack[-1]
+            outer[1] = max(outer[1], peak)
+        return peak - start, current - start
+
+    @contextmanager
+    def stage(self, name: str):
+        depth = len(self._mem_stack)
+        if self.memory:
+            self._mem_enter()
+        started = self.start()
+        try:
+            yield
+        finally:
+            wall, cpu = self._elapsed(started)
+            acc = self.stages.setdefault(name, [0.0, 0.0])
+            acc[0] += wall
+            acc[1] += cpu
+            if self.memory:
+                # Drop sections left open by an operator that raised.
+                del self._mem_stack[depth + 1:]
+                peak, retained = self._mem_exit()
+                mem = self.memory_stages.setdefault(name, [0, 0])
+                mem[0] = max(mem[0], peak)
+                mem[1] += retained
+
+    def start_operator(self) -> tuple[float, float]:
+        if self.memory:
+            self._mem_enter()
+        return self.start()
+
+    def add_operator(self, index: int, op: dict, started: tuple[float, float]) -> None:
+        wall, cpu = self._elapsed(started)
+        rec = {
+            "index": index,
+            "id": op.get("id", f"op#{index}"),
+            "op": op.get("op"),
+            "wall_s": wall,
+            "cpu_s": cpu,
+        }
+        if self.memory:
+            rec["peak_bytes"], rec["retained_bytes"] = self._mem_exit()
+        self.operators.append(rec)
+
+    def add_resolver(self, obj_id: str, prototype: str, started: tuple[float, float]) -> None:
+        wall, cpu = self._elapsed(started)
+        acc = self.resolvers.setdefault(prototype, [0, 0.0, 0.0])
+        acc[0] += 1
+        acc[1] += wall
+        acc[2] += cpu
+        obj = self.objects.setdefault(obj_id, [prototype, 0.0, 0.0])
+        obj[1] += wall
+        obj[2] += cpu
+
+    def add_cache(self, name: str, hits: int, misses: int, entries: int) -> None:
+        acc = self.caches.setdefault(name, {"hits": 0, "misses": 0, "entries": 0})
+        acc["hits"] += hits
+        acc["misses"] += misses
+        acc["entries"] = max(acc["entries"], entries)
+
+    def add_counters(self, group: str, counts: dict[str, int]) -> None:
+        acc = self.counters.setdefault(group, {})
+        for name, n in counts.items():
+            acc[name] = acc.get(name, 0) + n
+
+    def _allocation_sites(self) -> list[dict]:
+        """Engine source lines that retained the most memory since the profiler was created.
+
+        Each allocation is attributed to its innermost frame inside engine/ (so a
+        deepcopy shows up at the engine line that called it), or to its innermost
+        frame if no engine code is on the stack.
+        """
+        if self._sites is None:
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ))
+            sites: dict[str, list[int]] = {}
+            for st in snapshot.compare_to(self._baseline, "traceback"):
+                if st.size_diff <= 0:
+                    continue
+                frame = next((f for f in reversed(st.traceback) if f.filename.startswith(_ENGINE_DIR)), None)
+                frame = frame or st.traceback[-1]
+                acc = sites.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+                acc[0] += st.size_diff
+                acc[1] += st.count_diff
+            top = sorted(sites.items(), key=lambda kv: (-kv[1][0], kv[0]))[: self.top_sites]
+            self._sites = [{"site": site, "retained_kb": _kb(size), "count": count} for site, (size, count) in top]
+            if self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+        return self._sites
+
+    def report(self, top_n: int = 10) -> dict:
+        """Return the collected data as a JSON-serializable dict (times in ms, memory in KiB)."""
+        by_type: dict[str, list[float]] = {}
+        for rec in self.operators:
+            acc = by_type.setdefault(rec["op"], [0, 0.0, 0.0])
+            acc[0] += 1
+            acc[1] += rec["wall_s"]
+            acc[2] += rec["cpu_s"]
+
+        def op_record(rec: dict) -> dict:
+            out = {
+                "index": rec["index"], "id": rec["id"], "op": rec["op"],
+                "wall_ms": _ms(rec["wall_s"]), "cpu_ms": _ms(rec["cpu_s"]),
+            }
+            if "peak_bytes" in rec:
+                out["peak_kb"] = _kb(rec["peak_bytes"])
+                out["retained_kb"] = _kb(rec["retained_bytes"])
+            return out
+
+        slowest_objects = sorted(self.objects.items(), key=lambda kv: (-kv[1][1], kv[0]))[:top_n]
+        slowest_ops = sorted(self.operators, key=lambda r: (-r["wall_s"], r["index"]))[:top_n]
+        report = {
+            "stages": {
+                name: {"wall_ms": _ms(wall), "cpu_ms": _ms(cpu)} for name, (wall, cpu) in self.stages.items()
+            },
+            "total": {
+                "wall_ms": _ms(sum(w for w, _c in self.stages.values())),
+                "cpu_ms": _ms(sum(c for _w, c in self.stages.values())),
+            },
+            "operators": [op_record(r) for r in self.operators],
+            "operators_by_type": {
+                name: {"calls": calls, "wall_ms": _ms(wall), "cpu_ms": _ms(cpu)}
+                for name, (calls, wall, cpu) in sorted(by_type.items())
+            },
+            "resolvers": {
+                name: {"calls": calls, "wall_ms": _ms(wall), "cpu_ms": _ms(cpu)}
+                for name, (calls, wall, cpu) in sorted(self.resolvers.items())
+            },
+            "top_operators": [op_record(r) for r in slowest_ops],
+            "top_objects": [
+                {"id": obj_id, "prototype": proto, "wall_ms": _ms(wall), "cpu_ms": _ms(cpu)}
+                for obj_id, (proto, wall, cpu) in slowest_objects
+            ],
+            "caches": {name: dict(stats) for name, stats in sorted(self.caches.items())},
+            "counters": {group: dict(counts) for group, counts in sorted(self.counters.items())},
+        }
+        if self.memory:
+            report["memory"] = {
+                "stages": {
+                    name: {"peak_kb": _kb(peak), "retained_kb": _kb(retained)}
+                    for name, (peak, retained) in self.memory_stages.items()
+                },
+                "peak_kb": _kb(max((peak for peak, _r in self.memory_stages.values()), default=0)),
+                "top_operators": [
+                    op_record(r) for r in sorted(self.operators, key=lambda r: (-r["peak_bytes"], r["index"]))[:top_n]
+                ],
+                "top_allocation_sites": self._allocation_sites(),
+            }
+        return report
@@ -1,4 +1,16 @@
 
-# Re-export prototype modules used via "from engine.prototypes import <name>".
-# Keep this list minimal and aligned with callers.
-from . import rect_solid  # noqa: F401
+# Prototype modules are imported on first use, not when the package is imported:
+# "from engine.prototypes import <name>" imports just that submodule, and attribute
+# access (engine.prototypes.<name>) is resolved lazily below.
+import importlib
+
+
+def __getattr__(name: str):
+    if name.startswith("_"):
+        raise AttributeError(name)
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
@@ -18,6 +18,18 @@ def _unit_from_direction(d: str) -> Tuple[float, float]:
         raise ValueError(f"Unsupported direction: {d}")
     return dirs[d]
 
+def _canonical_profile_id(pid: str, table: Dict[str, Any], aliases: Dict[str, str] | None) -> str:
+    """Map a profile id to its lumber_profiles key (unknown ids are returned unchanged)."""
+    if aliases is not None:
+        # Precomputed by engine.registry (see lumber_profile_aliases).
+        return aliases.get(pid, pid)
+    # Backwards-compatible shorthand: allow id like "2x6" and interpret as "S4S:2x6"
+    if pid not in table and ":" not in pid:
+        alt = f"S4S:{pid}"
+        if alt in table:
+            return alt
+    return pid
+
 def _resolve_profile(params: Dict[str, Any], registries: Dict[str, Any] | None) -> Tuple[float, float]:
     profile = params.get("profile", {})
     if "actual" in profile:
@@ -39,11 +51,7 @@ def _resolve_profile(params: Dict[str, Any], registries: Dict[str, Any] | None)
     if not registries:
         raise ValueError("Registries required to resolve profile.id/nominal")
     table = registries.get("lumber_profiles", {})
-    # Backwards-compatible shorthand: allow id like "2x6" and interpret as "S4S:2x6"
-    if pid not in table and ":" not in pid:
-        alt = f"S4S:{pid}"
-        if alt in table:
-            pid = alt
+    pid = _canonical_profile_id(pid, table, registries.get("lumber_profile_aliases"))
 
     if pid not in table:
         raise ValueError(f"Unknown lumber profile id: {pid}")
@@ -75,11 +83,7 @@ def _resolve_profile_entry(params: Dict[str, Any], registries: Dict[str, Any] |
     if not registries:
         return None
     table = registries.get("lumber_profiles", {})
-    # Backwards-compatible shorthand: allow id like "2x6" and interpret as "S4S:2x6"
-    if pid not in table and ":" not in pid:
-        alt = f"S4S:{pid}"
-        if alt in table:
-            pid = alt
+    pid = _canonical_profile_id(pid, table, registries.get("lumber_profile_aliases"))
 
     entry = table.get(pid)
     return entry if isinstance(entry, dict) else None
@@ -97,13 +101,28 @@ def resolve(params: Dict[str, Any], registries: Dict[str, Any] | None = None) ->
         2) registry profile default_orientation.wide_face if present
         3) fallback to 'down'
     """
-    t, w = _resolve_profile(params, registries)
+    return place_shape(resolve_shape(params, registries), params)
 
-    placement = params.get("placement", {})
-    start = placement.get("start")
+
+def _placement_start(params: Dict[str, Any]) -> Tuple[float, float]:
+    start = params.get("placement", {}).get("start")
     if not (isinstance(start, list) and len(start) == 2):
         raise ValueError("placement.start must be [x,y]")
-    sx, sy = float(start[0]), float(start[1])
+    return float(start[0]), float(start[1])
+
+
+def resolve_shape(params: Dict[str, Any], registries: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """The part of resolve() that does not depend on placement.start.
+
+    Returns the footprint's offsets from the start point plus the extrusion and
+    faces. engine.scene caches this per distinct params (ignoring start), so
+    instances of a template only pay for place_shape().
+    """
+    t, w = _resolve_profile(params, registries)
+
+    placement = params.get("placement", {})
+    # Validated here as well so errors surface in the same order as before the split.
+    _placement_start(params)
 
     direction = placement.get("direction", "east")
     ux, uy = _unit_from_direction(direction)
@@ -135,25 +154,45 @@ def resolve(params: Dict[str, Any], registries: Dict[str, Any] | None = None) ->
 
     z_base = float(params.get("z_base", 0.0))
 
-    # Construct footprint (CCW) as rectangle with one end centered at start.
-    # Start end center at (sx,sy); end center at (sx,sy) + length*u
-    ex, ey = sx + length*ux, sy + length*uy
-
     # Perpendicular (left) unit vector
     vx, vy = -uy, ux
     hw = width_on_floor / 2.0
 
-    p1 = (sx + hw*vx, sy + hw*vy)
-    p2 = (sx - hw*vx, sy - hw*vy)
-    p3 = (ex - hw*vx, ey - hw*vy)
-    p4 = (ex + hw*vx, ey + hw*vy)
+    return {
+        # Added to the start point exactly as resolve() always has, so a placed
+        # shape is bit-identical to a direct resolve.
+        "offsets": (hw*vx, hw*vy, length*ux, length*uy),
+        "extrusion": {"z_base": z_base, "height": height},
+        "faces": {
+            "bottom": {"type": "plane", "z": z_base},
+            "top": {"type": "plane", "z": z_base + height},
+        },
+    }
+
+
+def place_shape(shape: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the resolved geometry for `shape` (from resolve_shape) at params' placement.start.
+
+    The returned geometry shares `extrusion` and `faces` with `shape`.
+    """
+    sx, sy = _placement_start(params)
+    hvx, hvy, lux, luy = shape["offsets"]
+
+    # Construct footprint (CCW) as rectangle with one end centered at start.
+    # Start end center at (sx,sy); end center at (sx,sy) + length*u
+    ex, ey = sx + lux, sy + luy
+
+    p1 = (sx + hvx, sy + hvy)
+    p2 = (sx - hvx, sy - hvy)
+    p3 = (ex - hvx, ey - hvy)
+    p4 = (ex + hvx, ey + hvy)
 
     footprint = [[p1[0], p1[1]], [p2[0], p2[1]], [p3[0], p3[1]], [p4[0], p4[1]]]
 
     return {
         "kind": "solid",
         "footprint": footprint,
-        "extrusion": {"z_base": z_base, "height": height},
+        "extrusion": shape["extrusion"],
         "features": {
             "edges": {
                 "start": {"type": "segment", "a": [p1[0], p1[1]], "b": [p2[0], p2[1]]},
@@ -161,9 +200,6 @@ def resolve(params: Dict[str, Any], registries: Dict[str, Any] | None = None) ->
                 "left":  {"type": "segment", "a": [p1[0], p1[1]], "b": [p4[0], p4[1]]},
                 "right": {"type": "segment", "a": [p2[0], p2[1]], "b": [p3[0], p3[1]]},
             },
-            "faces": {
-                "bottom": {"type": "plane", "z": z_base},
-                "top": {"type": "plane", "z": z_base + height},
-            }
+            "faces": shape["faces"],
         }
     }
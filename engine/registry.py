@@ -1,8 +1,65 @@
+"""Registry loading.
+
+`load_registries(bundle_root)` returns
+
+  {"prototypes": {name: entry}, "operators": {name: entry},
+   "lumber_profiles": {id: entry}, "lumber_profile_aliases": {alias: id}}
+
+parsed from registry/*.json. The normalized form is kept in a compiled snapshot
+(tmp/registry_snapshot.marshal under the bundle root) so later runs load every
+table in one read instead of parsing and normalizing each JSON file.
+"lumber_profile_aliases" maps every accepted profile id, including the bare
+"2x6" shorthand for "S4S:2x6", to its canonical table key.
+
+Nothing derived from Python sources is stored: resolvers are imported and their
+signatures read on first use (engine.scene), so editing a prototype module never
+leaves the snapshot stale.
+
+The snapshot records mtime, size and sha256 for each source file. It is reused
+when mtime and size match, or when they differ but the content hash does not;
+otherwise it is rebuilt. The snapshot is best effort: if it cannot be read or
+written, the JSON files are parsed directly.
+"""
 import json
+import marshal
+import os
+import sys
 from pathlib import Path
 
-def load_registries(bundle_root: Path) -> dict:
-    reg_dir = bundle_root / "registry"
+REGISTRY_FILES = ("prototypes.json", "operators.json", "lumber_profiles.json")
+
+# Bump when the normalized layout changes. marshal output is only readable by the
+# Python version that wrote it, so that is part of the stamp too.
+SNAPSHOT_VERSION = 2
+SNAPSHOT_RELPATH = Path("tmp") / "registry_snapshot.marshal"
+
+
+def load_registries(bundle_root: Path, use_snapshot: bool = True) -> dict:
+    reg_dir = Path(bundle_root) / "registry"
+    if not use_snapshot:
+        return _compile_registries(reg_dir)
+
+    snapshot_path = Path(bundle_root) / SNAPSHOT_RELPATH
+    stats = {name: _stat(reg_dir / name) for name in REGISTRY_FILES}
+    snapshot = _read_snapshot(snapshot_path)
+    if snapshot is not None:
+        sources = snapshot["sources"]
+        if all(sources[name][:2] == stats[name] for name in REGISTRY_FILES):
+            return snapshot["registries"]
+        digests = {name: _sha256(reg_dir / name) for name in REGISTRY_FILES}
+        if all(sources[name][2] == digests[name] for name in REGISTRY_FILES):
+            # Touched but unchanged: keep the tables, refresh the stamps.
+            _write_snapshot(snapshot_path, snapshot["registries"], stats, digests)
+            return snapshot["registries"]
+    else:
+        digests = {name: _sha256(reg_dir / name) for name in REGISTRY_FILES}
+
+    registries = _compile_registries(reg_dir)
+    _write_snapshot(snapshot_path, registries, stats, digests)
+    return registries
+
+
+def _compile_registries(reg_dir: Path) -> dict:
     prototypes = json.loads((reg_dir / "prototypes.json").read_text(encoding="utf-8"))
     operators  = json.loads((reg_dir / "operators.json").read_text(encoding="utf-8"))
     lumber_profiles = json.loads((reg_dir / "lumber_profiles.json").read_text(encoding="utf-8"))
@@ -10,4 +67,60 @@ def load_registries(bundle_root: Path) -> dict:
         "prototypes": {p["name"]: p for p in prototypes},
         "operators":  {o["name"]: o for o in operators},
         "lumber_profiles": lumber_profiles,
+        "lumber_profile_aliases": lumber_profile_aliases(lumber_profiles),
+    }
+
+
+def lumber_profile_aliases(table: dict) -> dict:
+    """Map every accepted lumber profile id to its key in `table`.
+
+    Canonical ids map to themselves; "S4S:<nominal>" is also reachable as the bare
+    "<nominal>" shorthand unless the table has an entry under that exact key.
+    """
+    aliases = {pid: pid for pid in table}
+    for pid in table:
+        system, sep, nominal = pid.partition(":")
+        if sep and system == "S4S" and nominal not in table:
+            aliases[nominal] = pid
+    return aliases
+
+
+def _stat(path: Path) -> list:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _sha256(path: Path) -> str:
+    import hashlib
+
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _read_snapshot(path: Path) -> dict | None:
+    try:
+        data = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != [SNAPSHOT_VERSION, list(sys.version_info[:2])]:
+        return None
+    if set(data.get("sources", {})) != set(REGISTRY_FILES):
+        return None
+    return data
+
+
+def _write_snapshot(path: Path, registries: dict, stats: dict, digests: dict) -> None:
+    data = {
+        "version": [SNAPSHOT_VERSION, list(sys.version_info[:2])],
+        "sources": {name: stats[name] + [digests[name]] for name in REGISTRY_FILES},
+        "registries": registries,
     }
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(marshal.dumps(data))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
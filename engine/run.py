@@ -1,38 +1,167 @@
 #!/usr/bin/env python3
-import json, sys
+import json, sys, time
 from pathlib import Path
 
 # Allow running as `python engine/run.py` as well as `python -m engine.run`
 if __package__ is None or __package__ == "":
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+# Startup budget (see benchmarks/startup.py): keep this import list to what every run needs.
+# The constraints compiler, argparse and the batch/stream/watch/cache modules are
+# imported only when a run actually uses them.
 from engine.registry import load_registries
 from engine.scene import build_scene
-from engine.constraints import compile_scene_constraints
 from engine.scad import emit_scad
 
 
-def _load_and_resolve_scene(scene_path: Path, registries: dict) -> dict:
-    """Load a scene file, compile constraints (if applicable), and build the resolved scene."""
-    scene = json.loads(scene_path.read_text(encoding="utf-8"))
+def _bundle_root() -> Path:
+    # engine/run.py -> repo root
+    return Path(__file__).resolve().parents[1]
 
-    # If constraints-authored, compile to internal schema (registries allow resolving lumber dims during compile).
-    if scene.get("scene_type") == "constraints" or any(
+
+def _needs_compile(scene: dict) -> bool:
+    return scene.get("scene_type") == "constraints" or any(
         (
             o.get("prototype") == "dim_lumber_member"
             and isinstance(o.get("params", {}).get("placement_constraints"), dict)
         )
         for o in scene.get("objects", [])
-    ):
-        scene = compile_scene_constraints(scene, registries=registries)
+    )
+
+
+def _compile_scene(scene: dict, registries: dict) -> dict:
+    # If constraints-authored, compile to internal schema (registries allow resolving lumber dims during compile).
+    if _needs_compile(scene):
+        from engine.constraints import compile_scene_constraints
+
+        return compile_scene_constraints(scene, registries=registries)
+    return scene
+
+
+def _resolve_scene(scene: dict, registries: dict, timings: dict | None = None) -> dict:
+    """Compile constraints (if applicable) and build the resolved scene.
+
+    If `timings` is given, per-stage wall times (ms) are recorded under "compile" and "build".
+    """
+    return _run_stages(scene, registries, timings, emit=False)["resolved"]
+
+
+def _run_stages(
+    scene: dict,
+    registries: dict,
+    timings: dict | None,
+    emit: bool = True,
+    profiler=None,
+    lazy_arrays: bool = False,
+    instancing: bool = False,
+    simplify: bool = False,
+) -> dict:
+    """Run compile -> build (-> emit) and return {"compiled", "resolved"[, "scad"]}."""
+    if profiler is not None:
+        return _run_stages_profiled(scene, registries, timings, emit, profiler, lazy_arrays, instancing, simplify)
+    t0 = time.perf_counter()
+    compiled = _compile_scene(scene, registries)
+    t1 = time.perf_counter()
+    resolved = build_scene(compiled, registries, lazy_arrays=lazy_arrays, simplify=simplify)
+    t2 = time.perf_counter()
+    out = {"compiled": compiled, "resolved": resolved}
+    if emit:
+        out["scad"] = emit_scad(resolved, instancing=instancing)
+    if timings is not None:
+        timings["compile"] = (t1 - t0) * 1000.0
+        timings["build"] = (t2 - t1) * 1000.0
+        if emit:
+            timings["emit"] = (time.perf_counter() - t2) * 1000.0
+    return out
+
+
+def _run_stages_profiled(
+    scene: dict,
+    registries: dict,
+    timings: dict | None,
+    emit: bool,
+    profiler,
+    lazy_arrays: bool = False,
+    instancing: bool = False,
+    simplify: bool = False,
+) -> dict:
+    with profiler.stage("compile"):
+        compiled = _compile_scene(scene, registries)
+    with profiler.stage("build"):
+        resolved = build_scene(compiled, registries, profiler, lazy_arrays=lazy_arrays, simplify=simplify)
+    out = {"compiled": compiled, "resolved": resolved}
+    if emit:
+        with profiler.stage("emit"):
+            out["scad"] = emit_scad(resolved, instancing=instancing)
+    if timings is not None:
+        for stage, (wall_s, _cpu_s) in profiler.stages.items():
+            timings[stage] = wall_s * 1000.0
+    return out
+
+
+def plain_resolved(resolved: dict) -> dict:
+    """`resolved` with a lazy_arrays build's objects map turned into a plain dict, e.g. to write it as JSON."""
+    objects = resolved["objects"]
+    return resolved if type(objects) is dict else dict(resolved, objects=dict(objects))
+
+
+def _load_and_resolve_scene(scene_path: Path, registries: dict) -> dict:
+    """Load a scene file, compile constraints (if applicable), and build the resolved scene."""
+    scene = json.loads(scene_path.read_text(encoding="utf-8"))
+    return _resolve_scene(scene, registries)
+
+
+def run_scene(
+    scene: dict,
+    registries: dict,
+    timings: dict | None = None,
+    cache=None,
+    profiler=None,
+    lazy_arrays: bool = False,
+    instancing: bool = False,
+    simplify: bool = False,
+) -> tuple[str, dict]:
+    """Run the pipeline on an in-memory scene document and return (scad_text, resolved_scene).
+
+    If `timings` is given, per-stage wall times (ms) are recorded under "compile", "build" and "emit"
+    (or "cache" on a cache hit). If `cache` is given (engine.cache.ArtifactCache), artifacts are
+    looked up by content hash and stored on a miss. If `profiler` is given (engine.profile.Profiler),
+    the cache is bypassed and per-stage, per-operator and per-resolver timings are collected.
+
+    `lazy_arrays` builds with engine.scene.build_scene(lazy_arrays=True), so SCAD is
+    emitted without keeping every array instance; the resolved scene's "objects" is
+    then a LazyObjects map (see plain_resolved), except on the cached path, which
+    stores and returns a plain one. `instancing` emits SCAD with
+    engine.scad.emit_scad(instancing=True), and `simplify` builds with
+    build_scene(simplify=True). All three options are part of the cache key.
+    """
+    options = {"lazy_arrays": lazy_arrays, "instancing": instancing, "simplify": simplify}
+    if cache is None or profiler is not None:
+        out = _run_stages(scene, registries, timings, profiler=profiler, **options)
+        return out["scad"], out["resolved"]
 
-    return build_scene(scene, registries)
+    def compute() -> dict:
+        out = _run_stages(scene, registries, timings, **options)
+        return dict(out, resolved=plain_resolved(out["resolved"]))
+
+    t0 = time.perf_counter()
+    key = cache.key_for(scene, registries, options)
+    out, hit = cache.get_or_compute(key, compute)
+    if hit and timings is not None:
+        timings["cache"] = (time.perf_counter() - t0) * 1000.0
+    return out["scad"], out["resolved"]
 
 
 def run_file_with_resolved(
     scene_path: str | Path,
     out_path: str | Path,
     out_scene_json_path: str | Path | None = None,
+    registries: dict | None = None,
+    cache=None,
+    profiler=None,
+    lazy_arrays: bool = False,
+    instancing: bool = False,
+    simplify: bool = False,
 ) -> tuple[Path, dict]:
     """Run the pipeline for a single scene file and write artifacts.
 
@@ -40,6 +169,11 @@ def run_file_with_resolved(
       - SCAD output to out_path
       - (optional) resolved scene JSON to out_scene_json_path
 
+    `registries` may be passed in by callers that run many scenes (e.g. engine.batch)
+    so the registry files are parsed once rather than once per scene. `cache` is an
+    optional engine.cache.ArtifactCache and `profiler` an optional engine.profile.Profiler;
+    `lazy_arrays`, `instancing` and `simplify` are run_scene's. The resolved JSON is written fully materialized.
+
     Returns:
       (out_path, resolved_scene_dict)
     """
@@ -47,33 +181,238 @@ def run_file_with_resolved(
     out_path = Path(out_path)
     out_scene_json_path = Path(out_scene_json_path) if out_scene_json_path else None
 
-    registries = load_registries(Path(__file__).resolve().parents[1])
-    resolved = _load_and_resolve_scene(scene_path, registries)
+    if registries is None:
+        registries = load_registries(_bundle_root())
+    scene = json.loads(scene_path.read_text(encoding="utf-8"))
+    scad, resolved = run_scene(
+        scene,
+        registries,
+        cache=cache,
+        profiler=profiler,
+        lazy_arrays=lazy_arrays,
+        instancing=instancing,
+        simplify=simplify,
+    )
 
-    out_path.write_text(emit_scad(resolved), encoding="utf-8")
+    out_path.write_text(scad, encoding="utf-8")
     if out_scene_json_path is not None:
         out_scene_json_path.parent.mkdir(parents=True, exist_ok=True)
         out_scene_json_path.write_text(
-            json.dumps(resolved, indent=2, sort_keys=True) + "\n",
+            json.dumps(plain_resolved(resolved), indent=2, sort_keys=True) + "\n",
             encoding="utf-8",
         )
     return out_path, resolved
 
 
-def run_file(scene_path: str | Path, out_path: str | Path) -> Path:
+def run_file(
+    scene_path: str | Path,
+    out_path: str | Path,
+    cache=None,
+    lazy_arrays: bool = False,
+    instancing: bool = False,
+    simplify: bool = False,
+) -> Path:
     """Run the pipeline for a single scene file and write a .scad output."""
-    out_path, _resolved = run_file_with_resolved(scene_path, out_path, out_scene_json_path=None)
+    out_path, _resolved = run_file_with_resolved(
+        scene_path,
+        out_path,
+        out_scene_json_path=None,
+        cache=cache,
+        lazy_arrays=lazy_arrays,
+        instancing=instancing,
+        simplify=simplify,
+    )
     return out_path
 
 
-def main():
-    if len(sys.argv) != 3:
+def _build_arg_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m engine.run",
+        description="Run the pipeline (constraints compile -> build -> SCAD emit) for one scene or a batch of scenes.",
+    )
+    parser.add_argument("scene", nargs="?", help="Scene JSON (constraints or internal)")
+    parser.add_argument("out", nargs="?", help="Output .scad path")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Rebuild out.scad whenever the scene file or registry/*.json content changes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.25,
+        help="Watch mode: mtime polling interval in seconds (default: 0.25)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        help="Watch mode: quiet period after the last change before rebuilding (default: 0.3)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Streaming mode: read one scene JSON per line on stdin, write one result record per line on stdout",
+    )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="INPUT",
+        help="Batch mode: scene directories, glob patterns and/or manifest files (one scene path per line)",
+    )
+    parser.add_argument(
+        "--outdir",
+        help="Batch mode: directory for generated <name>.scad files",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Batch mode: worker processes (default: CPU count; 1 runs in-process)",
+    )
+    parser.add_argument(
+        "--resolved",
+        action="store_true",
+        help="Batch mode: also write <name>.resolved.json next to each SCAD",
+    )
+    parser.add_argument(
+        "--report",
+        help="Batch mode: write a JSON report with one record per scene",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT_JSON",
+        help="Write a JSON timing report (stages, operators, resolvers, slowest objects); bypasses the cache",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        help="Number of slowest operators/objects listed in the --profile report (default: 10)",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="With --profile: also trace allocations (peak/retained per stage and operator, top allocation sites)",
+    )
+    parser.add_argument(
+        "--lazy-arrays",
+        action="store_true",
+        help="Keep distribute_evenly_between instances unresolved until emitted (same output, less memory)",
+    )
+    parser.add_argument(
+        "--instanced-scad",
+        action="store_true",
+        help="Emit each repeated solid shape once as a module plus one translate() call per object",
+    )
+    parser.add_argument(
+        "--simplify",
+        action="store_true",
+        help="Drop duplicate and collinear footprint vertices (and zero-area slivers) after each operator",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always recompute; do not read or write the artifact cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Artifact cache directory (default: $AICADDIE_CACHE_DIR or ./tmp/engine_cache)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=256.0,
+        help="Artifact cache size bound in MB; least-recently-used entries are evicted (default: 256)",
+    )
+    return parser
+
+
+def _cache_from_args(args):
+    """Return the engine.cache.ArtifactCache selected by the CLI flags, or None for --no-cache."""
+    if args.no_cache:
+        return None
+    from engine.cache import ArtifactCache
+
+    return ArtifactCache(args.cache_dir, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+
+
+_OPTION_FLAGS = {"lazy_arrays": "--lazy-arrays", "instancing": "--instanced-scad", "simplify": "--simplify"}
+
+
+def _run_options(args) -> dict:
+    """run_scene's build/emit options from the CLI flags (single-scene and --profile runs)."""
+    return {"lazy_arrays": args.lazy_arrays, "instancing": args.instanced_scad, "simplify": args.simplify}
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 2 and not any(a.startswith("-") for a in argv):
+        # Fast path for the plain `scene.json out.scad` form: argparse (and the shutil/gettext
+        # imports it pulls in) is a large share of CLI startup, so skip it here.
+        from engine.cache import ArtifactCache
+
+        run_file(Path(argv[0]), Path(argv[1]), cache=ArtifactCache())
+        print(f"Wrote {argv[1]}")
+        return
+
+    parser = _build_arg_parser()
+    args = parser.parse_args(argv)
+    options = _run_options(args)
+    if (args.jsonl or args.batch or args.watch) and any(options.values()):
+        flags = ", ".join(_OPTION_FLAGS[k] for k, v in options.items() if v)
+        parser.error(f"{flags}: only single-scene and --profile runs take build options")
+
+    if args.jsonl:
+        from engine.stream import main_stream
+
+        raise SystemExit(main_stream(args))
+
+    if args.batch:
+        if not args.outdir:
+            parser.error("--batch requires --outdir")
+        from engine.batch import main_batch
+
+        raise SystemExit(main_batch(args))
+
+    if not args.scene or not args.out:
         print("Usage: python -m engine.run scene.json out.scad")
         raise SystemExit(2)
-    scene_path = Path(sys.argv[1])
-    out_path = Path(sys.argv[2])
 
-    run_file(scene_path, out_path)
+    if args.watch:
+        from engine.watch import main_watch
+
+        raise SystemExit(main_watch(args))
+
+    scene_path = Path(args.scene)
+    out_path = Path(args.out)
+
+    if args.profile_memory and not args.profile:
+        parser.error("--profile-memory requires --profile REPORT_JSON")
+
+    if args.profile:
+        import engine.constraints  # noqa: F401
+        from engine.profile import Profiler
+        from engine.scene import warm_registries
+
+        # Import everything up front so module loading does not show up as stage time/memory.
+        registries = load_registries(_bundle_root())
+        warm_registries(registries)
+        profiler = Profiler(memory=args.profile_memory, top_sites=args.profile_top)
+        run_file_with_resolved(scene_path, out_path, registries=registries, profiler=profiler, **options)
+        report = profiler.report(top_n=args.profile_top)
+        report["scene"] = str(scene_path)
+        Path(args.profile).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {out_path}")
+        summary = f"total {report['total']['wall_ms']:.1f} ms"
+        if "memory" in report:
+            summary += f", peak {report['memory']['peak_kb']:.0f} KiB"
+        print(f"Wrote profile {args.profile} ({summary})")
+        return
+
+    run_file(scene_path, out_path, cache=_cache_from_args(args), **options)
     print(f"Wrote {out_path}")
 
 
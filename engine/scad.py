@@ -46,9 +46,16 @@ def _emit_wall_panel(lines: list[str], p0: list[float], p1: list[float], wall_h:
     ]
     lines.append(f"  polyhedron(points=[{pts_s}], faces={faces});")
 
-def emit_scad(resolved: dict) -> str:
+def emit_scad(resolved: dict, instancing: bool = False) -> str:
+    """Return OpenSCAD source for a resolved scene.
+
+    With `instancing`, solids that have the same footprint up to a translation
+    (e.g. distribute_evenly_between instances) are emitted as one `module` per
+    shape plus a `translate` call per object; see _solid_instances.
+    """
     lines = []
     lines.append("// Generated by DescriptiveCAD bootstrap v0.2")
+    instances = _solid_instances(resolved["objects"], lines) if instancing else {}
     for obj_id, obj in resolved["objects"].items():
         geom = obj["geom"]
         style = obj.get("style", {})
@@ -56,10 +63,14 @@ def emit_scad(resolved: dict) -> str:
         if color:
             lines.append(f"color([{color[0]}, {color[1]}, {color[2]}, {color[3]}]) {{")
         if geom["kind"] == "solid":
-            fp = ", ".join(_fmt_pt(p) for p in geom["footprint"])
-            z0 = geom["extrusion"]["z_base"]
-            h  = geom["extrusion"]["height"]
-            lines.append(f"  translate([0,0,{z0}]) linear_extrude(height={h}) polygon(points=[{fp}]);")
+            use = instances.get(obj_id)
+            if use is not None:
+                lines.append(use)
+            else:
+                fp = ", ".join(_fmt_pt(p) for p in geom["footprint"])
+                z0 = geom["extrusion"]["z_base"]
+                h  = geom["extrusion"]["height"]
+                lines.append(f"  translate([0,0,{z0}]) linear_extrude(height={h}) polygon(points=[{fp}]);")
         elif geom["kind"] == "boundary":
             wh = geom.get("wall_height", 1.0)
             lines.append("  // boundary visualization")
@@ -74,3 +85,50 @@ def emit_scad(resolved: dict) -> str:
         if color:
             lines.append("}")
     return "\n".join(lines) + "\n"
+
+
+def _micros(v) -> int:
+    """`v` as printed by _fmt_pt, in integer millionths."""
+    return int(f"{v:.6f}".replace(".", ""))
+
+
+def _fmt_micros(m: int) -> str:
+    """Inverse of _micros, in _fmt_pt's format."""
+    return f"{'-' if m < 0 else ''}{abs(m) // 1_000_000}.{abs(m) % 1_000_000:06d}"
+
+
+def _solid_instances(objects, lines: list[str]) -> dict[str, str]:
+    """Append one module per repeated solid shape to `lines`; return {obj_id: instance line}.
+
+    Two solids share a module when their extrusions match and their printed
+    footprints differ by one offset exactly, in the printed 6-decimal digits
+    (compared as integers). The module holds the first solid's footprint moved
+    so its first vertex is at the origin; each object becomes
+    `translate([dx, dy, 0]) name();` with dx, dy that offset. Vertex coordinates
+    are therefore the same decimals as the literal output. A solid an operator
+    reshaped (a clip, a trim) no longer matches its siblings and is written
+    literally, as is any shape that occurs only once.
+    """
+    groups: dict[tuple, list] = {}
+    for obj_id, obj in objects.items():
+        geom = obj["geom"]
+        if geom["kind"] != "solid" or not geom["footprint"]:
+            continue
+        pts = [(_micros(p[0]), _micros(p[1])) for p in geom["footprint"]]
+        x0, y0 = pts[0]
+        shape = tuple([(x - x0, y - y0) for x, y in pts])
+        key = (shape, str(geom["extrusion"]["z_base"]), str(geom["extrusion"]["height"]))
+        groups.setdefault(key, []).append((obj_id, x0, y0))
+
+    uses: dict[str, str] = {}
+    modules = 0
+    for (shape, z0, h), members in groups.items():
+        if len(members) < 2:
+            continue
+        name = f"solid_{modules}"
+        modules += 1
+        fp = ", ".join(f"[{_fmt_micros(x)}, {_fmt_micros(y)}]" for x, y in shape)
+        lines.append(f"module {name}() translate([0,0,{z0}]) linear_extrude(height={h}) polygon(points=[{fp}]);")
+        for obj_id, x0, y0 in members:
+            uses[obj_id] = f"  translate([{_fmt_micros(x0)}, {_fmt_micros(y0)}, 0]) {name}();"
+    return uses
@@ -1,8 +1,8 @@
-from copy import deepcopy
 from functools import lru_cache
 import importlib
-import inspect
-from engine.geom import clip_convex, clip_halfplane, first_ray_polygon_hit, dot
+from itertools import islice
+import os
+from types import FunctionType
 
 
 # Contract: the scene executor supports *exactly* the operator set declared in registry/operators.json.
@@ -13,20 +13,23 @@ SUPPORTED_OPERATORS = {
     "extend_and_trim_to_object",
 }
 
-def _unit(vx: float, vy: float):
-    mag = (vx*vx + vy*vy) ** 0.5
-    if mag == 0:
-        raise ValueError("Zero-length direction vector")
-    return vx/mag, vy/mag
-
-def _resolve_object(obj, registries):
+def _resolve_object(obj, registries, profiler=None, shapes=None):
     proto = obj["prototype"]
     params = obj.get("params", {})
+    started = profiler.start() if profiler is not None else None
 
     resolver_fn = _get_prototype_resolver_fn(proto, registries)
-    geom = _call_resolver(resolver_fn, params, registries)
-    out = deepcopy(obj)
+    shape_fns = _shape_fns(resolver_fn) if shapes is not None else None
+    if shape_fns is not None:
+        geom = shapes.resolve(proto, params, registries, *shape_fns)
+    else:
+        geom = _call_resolver(resolver_fn, params, registries)
+    # Shallow: the resolved object shares params with its source (copy-on-write,
+    # see engine.operators), only "geom" is new.
+    out = dict(obj)
     out["geom"] = geom
+    if profiler is not None:
+        profiler.add_resolver(obj["id"], proto, started)
     return out
 
 
@@ -37,13 +40,31 @@ def _call_resolver(resolver_fn, params: dict, registries: dict):
       - Some resolvers accept (params)
       - Others accept (params, registries)
     """
-    sig = inspect.signature(resolver_fn)
+    arity = _resolver_arity(resolver_fn)
     # Prefer the richer signature if supported.
-    if len(sig.parameters) >= 2:
+    if arity >= 2:
         return resolver_fn(params, registries)
     return resolver_fn(params)
 
 
+# Same values as inspect.CO_VARARGS / inspect.CO_VARKEYWORDS.
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+
+
+@lru_cache(maxsize=128)
+def _resolver_arity(resolver_fn) -> int:
+    if isinstance(resolver_fn, FunctionType) and not hasattr(resolver_fn, "__wrapped__"):
+        # Plain functions: read the parameter count from the code object. inspect is
+        # expensive to import and would dominate CLI startup for small scenes.
+        code = resolver_fn.__code__
+        varargs = bool(code.co_flags & _CO_VARARGS) + bool(code.co_flags & _CO_VARKEYWORDS)
+        return code.co_argcount + code.co_kwonlyargcount + varargs
+    import inspect
+
+    return len(inspect.signature(resolver_fn).parameters)
+
+
 @lru_cache(maxsize=128)
 def _import_attr(path: str):
     """Import and return an attribute given a dotted path like 'pkg.mod.func'."""
@@ -57,6 +78,69 @@ def _import_attr(path: str):
         raise ValueError(f"Resolver '{path}' not found") from e
 
 
+@lru_cache(maxsize=128)
+def _shape_fns(resolver_fn):
+    """(resolve_shape, place_shape) defined next to `resolver_fn`, or None.
+
+    A prototype whose geometry depends on placement.start only by translation can
+    define resolve_shape(params, registries) -> shape and place_shape(shape, params)
+    -> geom, with place_shape(resolve_shape(p), p) identical to resolve(p).
+    """
+    module = importlib.import_module(resolver_fn.__module__)
+    shape_fn = getattr(module, "resolve_shape", None)
+    place_fn = getattr(module, "place_shape", None)
+    if shape_fn is None or place_fn is None:
+        return None
+    return shape_fn, place_fn
+
+
+class ShapeCache:
+    """Bounded LRU of translation-invariant resolver shapes for one build_scene call.
+
+    Instances created by an operator share their template's params values (see
+    section 12.14 of docs/design.md), so entries are keyed on the identity of every
+    params value except placement.start. Each entry keeps those values alive so an
+    id cannot be reused while it is cached; equal but distinct values simply miss.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict = {}  # key -> (shape, values the key refers to)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(proto: str, params: dict) -> tuple[tuple, list]:
+        ids = [proto]
+        values = []
+        for k, v in params.items():
+            if k == "placement" and isinstance(v, dict):
+                for pk, pv in v.items():
+                    if pk != "start":
+                        ids.append(("placement", pk, id(pv)))
+                        values.append(pv)
+            else:
+                ids.append((k, id(v)))
+                values.append(v)
+        return tuple(ids), values
+
+    def resolve(self, proto: str, params: dict, registries: dict, shape_fn, place_fn) -> dict:
+        key, values = self._key(proto, params)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            entry = (shape_fn(params, registries), values)
+            if len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+        else:
+            self.hits += 1
+        self._entries[key] = entry  # (re)insert as most recently used
+        return place_fn(entry[0], params)
+
+
 def _get_prototype_resolver_fn(proto_name: str, registries: dict):
     protos = (registries or {}).get("prototypes", {})
     if proto_name not in protos:
@@ -66,132 +150,362 @@ def _get_prototype_resolver_fn(proto_name: str, registries: dict):
         raise ValueError(f"Prototype '{proto_name}' is missing 'resolver' in registry/prototypes.json")
     return _import_attr(resolver_path)
 
-def build_scene(scene: dict, registries: dict) -> dict:
+def warm_registries(registries: dict) -> None:
+    """Import every registered prototype resolver and operator handler up front.
+
+    Long-lived processes (engine.server, engine.batch workers) call this once so the
+    first scene they run does not pay module import / attribute lookup cost.
+    """
+    for name in (registries or {}).get("prototypes", {}):
+        _get_prototype_resolver_fn(name, registries)
+    _operator_dispatch(registries)
+
+def build_scene(
+    scene: dict,
+    registries: dict,
+    profiler=None,
+    lazy_arrays: bool = False,
+    simplify: bool = False,
+    serial: bool = False,
+) -> dict:
+    """Resolve prototypes and apply operators; returns {"anchor_id", "objects"}.
+
+    `profiler` (engine.profile.Profiler) records per-resolver and per-operator timings.
+
+    Operators are grouped into waves of independent operators (plan_operator_waves);
+    a wave large enough to pay for shipping its objects (see PARALLEL_MIN_OPERATORS)
+    runs on a pool of worker processes, and the results are merged back in operator
+    order, so the resolved scene is identical to running the list in order.
+    `serial=True` (or $AICADDIE_OPERATOR_SERIAL=1) runs every operator in this
+    process, in list order; profiled and lazy builds always do.
+
+    With `lazy_arrays`, "objects" is an engine.instances.LazyObjects mapping in which
+    each distribute_evenly_between array is one record whose instances are resolved
+    when read. Iterating it yields the same ids and objects
+    as the default dict; call dict() on it for a plain, fully resolved map.
+
+    With `simplify`, every solid an operator replaces has its footprint passed
+    through engine.geom.simplify_polygon before the next operator runs (see
+    _simplifying). Off by default, since it changes the emitted vertices.
+    """
     # Split objects into concrete objects vs operator-generated templates.
-    templates = {o["id"]: deepcopy(o) for o in scene.get("objects", []) if str(o.get("role","")).lower() == "template"}
+    templates = {o["id"]: o for o in scene.get("objects", []) if str(o.get("role","")).lower() == "template"}
     concrete_list = [o for o in scene.get("objects", []) if str(o.get("role","")).lower() != "template"]
 
     # Resolve prototypes into explicit geometry (concrete objects only)
-    objects = {o["id"]: _resolve_object(o, registries) for o in concrete_list}
-
-    # Execute operators on resolved geometry
-    for op in scene.get("operators", []):
-        if op.get("op") == "distribute_evenly_between":
-            template_id = op["template_object_id"]
-            between = op["between_object_ids"]
-            count = int(op["count"])
-            id_prefix = op.get("id_prefix", f"{template_id}_")
-            if template_id not in templates:
-                raise ValueError(f"template_object_id not found (role=template): {template_id}")
-            if not (isinstance(between, list) and len(between) == 2):
-                raise ValueError("between_object_ids must be [id_a, id_b]")
-            a_id, b_id = between[0], between[1]
-            if a_id not in objects or b_id not in objects:
-                raise ValueError("between_object_ids must reference concrete objects already in scene")
-
-            # Anchor points: prefer placement.start from source params, else centroid of footprint.
-            def _anchor_pt(obj):
-                params = obj.get("params", {})
-                plc = params.get("placement", {})
-                start = plc.get("start")
-                if isinstance(start, list) and len(start) == 2:
-                    return float(start[0]), float(start[1])
-                fp = obj.get("geom", {}).get("footprint") or []
-                if fp:
-                    xs = [p[0] for p in fp]; ys = [p[1] for p in fp]
-                    return sum(xs)/len(xs), sum(ys)/len(ys)
-                raise ValueError("Cannot determine anchor point for distribute_evenly_between")
-
-            ax, ay = _anchor_pt(objects[a_id])
-            bx, by = _anchor_pt(objects[b_id])
-
-            # Generate count objects at equally spaced points between A and B (excluding endpoints).
-            for i in range(1, count+1):
-                t = i / (count + 1.0)
-                sx = ax + (bx - ax) * t
-                sy = ay + (by - ay) * t
-
-                inst = deepcopy(templates[template_id])
-                inst.pop("role", None)
-                inst["id"] = f"{id_prefix}{i}"
-                inst.setdefault("params", {})
-                inst["params"].setdefault("placement", {})
-
-                # placement.start may be omitted in template; it is provided by this operator.
-                inst["params"]["placement"]["start"] = [sx, sy]
-
-                # Resolve and insert
-                objects[inst["id"]] = _resolve_object(inst, registries)
-            continue
-
-        if op.get("op") == "clip_to_object":
-            clip_id = op["clip_object_id"]
-            target_ids = op.get("target_ids", [])
-            if clip_id not in objects:
-                raise ValueError(f"clip_object_id not found: {clip_id}")
-            clip_geom = objects[clip_id]["geom"]
-            if clip_geom.get("kind") not in ("boundary","solid"):
-                raise ValueError("clip_to_object expects clip object to have footprint geometry")
-            clip_fp = clip_geom.get("footprint")
-            if not clip_fp:
+    objects = IndexedObjects((o["id"], _resolve_object(o, registries, profiler)) for o in concrete_list)
+    if lazy_arrays:
+        from engine.instances import LazyObjects
+
+        objects = LazyObjects(objects)
+
+    # Bind every operator to its registry handler and check its object references
+    # before anything runs; the loop below then only executes handlers.
+    operators = scene.get("operators", [])
+    dispatch = _operator_dispatch(registries, {op.get("op") for op in operators})
+    handlers = _bind_operators(operators, dispatch, objects, templates)
+    if simplify:
+        handlers = [_simplifying(apply, dispatch[op.get("op")][2]) for op, apply in zip(operators, handlers)]
+    shapes = ShapeCache()
+    resolve_fn = lambda inst: _resolve_object(inst, registries, profiler, shapes)  # noqa: E731
+
+    if profiler is not None:
+        from engine.geom import counting
+
+        with counting() as counts:
+            for op_index, (op, apply) in enumerate(zip(operators, handlers)):
+                started = profiler.start_operator()
+                apply(objects, templates, op, resolve_fn)
+                profiler.add_operator(op_index, op, started)
+        profiler.add_cache("resolver_shapes", shapes.hits, shapes.misses, len(shapes))
+        profiler.add_counters("clip_paths", counts["clip_paths"])
+        if simplify:
+            profiler.add_counters("simplify", counts["simplify"])
+    elif serial or lazy_arrays or operator_serial() or len(operators) < PARALLEL_MIN_OPERATORS:
+        for op, apply in zip(operators, handlers):
+            apply(objects, templates, op, resolve_fn)
+    else:
+        objects = _run_waves(operators, handlers, dispatch, objects, templates, resolve_fn)
+
+    return {"anchor_id": scene["anchor_id"], "objects": objects if lazy_arrays else dict(objects)}
+
+
+def _simplifying(apply, access):
+    """Wrap an operator handler so the solids it replaces come out simplified.
+
+    Only objects the operator wrote (per its `access`, or every object if it has
+    none) that existed before it ran and were replaced are simplified; objects it
+    creates come straight from prototype resolvers.
+    """
+    from engine.geom import simplify_polygon
+    from engine.operators import with_geom
+
+    def run(objects, templates, op, resolve_fn):
+        writes = access(op)[1] if access is not None else list(objects)
+        before = {oid: objects[oid] for oid in writes if oid in objects}
+        apply(objects, templates, op, resolve_fn)
+        for oid, old in before.items():
+            obj = objects.get(oid)
+            if obj is None or obj is old or obj["geom"].get("kind") != "solid":
                 continue
+            fp = obj["geom"].get("footprint") or []
+            simple = simplify_polygon(fp)
+            if len(simple) != len(fp):
+                objects[oid] = with_geom(obj, footprint=[[p[0], p[1]] for p in simple])
+        return objects
 
-            for tid in target_ids:
-                if tid not in objects:
-                    raise ValueError(f"target_id not found: {tid}")
-                tgeom = objects[tid]["geom"]
-                if tgeom.get("kind") != "solid":
-                    # Only solids are clipped
-                    continue
-                subj = tgeom.get("footprint", [])
-                clipped = clip_convex([(float(x),float(y)) for x,y in subj],
-                                      [(float(x),float(y)) for x,y in clip_fp])
-                tgeom["footprint"] = [[p[0], p[1]] for p in clipped]
-
-        elif op.get("op") == "extend_and_trim_to_object":
-            src_id = op["source_object_id"]
-            tgt_id = op["target_object_id"]
-            edge = op["source_edge"]  # [i, j] indices into footprint
-            direction = op["direction"]  # [dx, dy]
-
-            if src_id not in objects:
-                raise ValueError(f"source_object_id not found: {src_id}")
-            if tgt_id not in objects:
-                raise ValueError(f"target_object_id not found: {tgt_id}")
-
-            sgeom = objects[src_id]["geom"]
-            tgeom = objects[tgt_id]["geom"]
-            if sgeom.get("kind") != "solid":
-                raise ValueError("extend_and_trim_to_object expects source kind=solid")
-            if tgeom.get("kind") not in ("solid", "boundary"):
-                raise ValueError("extend_and_trim_to_object expects target to have a footprint")
-
-            sfp = [(float(x), float(y)) for x, y in sgeom.get("footprint", [])]
-            tfp = [(float(x), float(y)) for x, y in tgeom.get("footprint", [])]
-            if len(sfp) < 3 or len(tfp) < 3:
-                continue
+    return run
 
-            i, j = int(edge[0]), int(edge[1])
-            if i < 0 or j < 0 or i >= len(sfp) or j >= len(sfp):
-                raise ValueError("source_edge indices out of range")
 
-            ex1, ey1 = sfp[i]
-            ex2, ey2 = sfp[j]
-            mx, my = (ex1 + ex2) / 2.0, (ey1 + ey2) / 2.0
+class IndexedObjects(dict):
+    """The objects map build_scene passes to operators.
 
-            dx, dy = float(direction[0]), float(direction[1])
-            udx, udy = _unit(dx, dy)
+    `spatial` is an engine.spatial.SpatialIndex over the footprints, created on
+    first use and kept current through item assignment and deletion.
+    """
 
-            hit, t_hit, p_hit = first_ray_polygon_hit((mx, my), (udx, udy), tfp)
-            if not hit:
-                continue
+    __slots__ = ("_spatial",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._spatial = None
+
+    @property
+    def spatial(self):
+        if self._spatial is None:
+            from engine.spatial import SpatialIndex
+
+            self._spatial = SpatialIndex(self)
+        return self._spatial
+
+    def __setitem__(self, key, value) -> None:
+        dict.__setitem__(self, key, value)
+        if self._spatial is not None:
+            self._spatial.invalidate(key)
 
-            # Trim: keep the half-plane behind the contact point.
-            # NOTE: This v0.2 implementation does not attempt to *extend* a member if it is too short.
-            trimmed = clip_halfplane(sfp, p_hit, (udx, udy), keep_leq=True)
-            sgeom["footprint"] = [[p[0], p[1]] for p in trimmed]
+    def __delitem__(self, key) -> None:
+        dict.__delitem__(self, key)
+        if self._spatial is not None:
+            self._spatial.invalidate(key)
 
+
+def plan_operator_waves(operators: list, dispatch: dict) -> list[list[int]]:
+    """Group operator indices into waves of mutually independent operators.
+
+    Each operator's handler module declares `access(op) -> (reads, writes)` object
+    ids. An operator goes in the wave after the latest earlier operator it conflicts
+    with (one writes an id the other reads or writes), so running the waves in order
+    sees the same objects as running the list serially. An operator without
+    `access` is a barrier: it runs alone, after everything before it.
+    """
+    level_of_op: list[int] = []
+    last_write: dict = {}  # id -> level of the latest operator writing it
+    last_read: dict = {}   # id -> highest level reading it since that write
+    floor = 0              # every later operator runs after this level (barriers)
+    top = -1
+    for op in operators:
+        access = dispatch[op.get("op")][2]
+        if access is None:
+            level = top + 1
+            floor = level + 1
         else:
-            raise ValueError(f"Unknown operator: {op.get('op')}")
+            reads, writes = access(op)
+            level = floor
+            for oid in reads:
+                level = max(level, last_write.get(oid, -1) + 1)
+            for oid in writes:
+                level = max(level, last_write.get(oid, -1) + 1, last_read.get(oid, -1) + 1)
+            for oid in reads:
+                last_read[oid] = max(last_read.get(oid, -1), level)
+            for oid in writes:
+                last_write[oid] = level
+                last_read.pop(oid, None)
+        level_of_op.append(level)
+        top = max(top, level)
+
+    waves: list[list[int]] = [[] for _ in range(top + 1)]
+    for index, level in enumerate(level_of_op):
+        waves[level].append(index)
+    return waves
+
+
+# A wave runs on worker processes only if it has at least PARALLEL_MIN_OPERATORS
+# operators touching at least PARALLEL_MIN_OBJECTS object ids between them (per their
+# access sets). Smaller waves run in-process: forking the workers and shipping their
+# results back costs more than the handlers take.
+PARALLEL_MIN_OPERATORS = 4
+PARALLEL_MIN_OBJECTS = 2000
+
+# What forked wave workers run on: (operators, handlers, dispatch, objects, templates,
+# resolve_fn). Set only while a parallel wave runs; the workers inherit it instead
+# of unpickling the objects map.
+_WAVE = None
+
+
+def operator_serial() -> bool:
+    """True if $AICADDIE_OPERATOR_SERIAL forces serial operator execution."""
+    return os.environ.get("AICADDIE_OPERATOR_SERIAL", "").strip() not in ("", "0")
+
+
+def _wave_workers() -> int:
+    """Worker processes for a parallel wave; 1 if there is one CPU or fork is unavailable."""
+    import multiprocessing
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1
+    return os.cpu_count() or 1
+
+
+def _run_waves(operators, handlers, dispatch, objects, templates, resolve_fn) -> dict:
+    """Run operators wave by wave and return the objects map; large waves run on forked workers.
+
+    Each worker inherits the objects map as it was before the wave, runs one
+    contiguous chunk of the wave's operators, and returns per operator the objects
+    it replaced, the objects it created (in insertion order) and the ids it deleted.
+    Those are applied in operator order. No operator in a wave reads or writes an
+    id another one writes, so that is what running the wave in order produces. The
+    first failure in operator order is raised.
+
+    Waves can run an operator before an earlier, unrelated one; the map is then
+    reordered to the insertion order running the list in order gives.
+    """
+    global _WAVE
+    waves = plan_operator_waves(operators, dispatch)
+    in_order = [index for wave in waves for index in wave] == list(range(len(operators)))
+    initial = list(objects)
+    effects: dict = {}  # operator index -> (created ids, deleted ids), when reordering
+    workers = None
+    for wave in waves:
+        parallel = False
+        if len(wave) >= PARALLEL_MIN_OPERATORS:
+            touched = 0
+            for index in wave:
+                reads, writes = dispatch[operators[index].get("op")][2](operators[index])
+                touched += len(reads) + len(writes)
+            if touched >= PARALLEL_MIN_OBJECTS:
+                workers = _wave_workers() if workers is None else workers
+                parallel = workers > 1
+        if not parallel:
+            for index in wave:
+                if in_order:
+                    handlers[index](objects, templates, operators[index], resolve_fn)
+                else:
+                    _changed, created, deleted = _apply_tracked(
+                        handlers[index], dispatch, objects, templates, operators[index], resolve_fn
+                    )
+                    effects[index] = ([oid for oid, _obj in created], deleted)
+            continue
 
-    return {"anchor_id": scene["anchor_id"], "objects": objects}
+        import gc
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        size = -(-len(wave) // workers)
+        chunks = [wave[i:i + size] for i in range(0, len(wave), size)]
+        # The workers are short-lived and the results only add objects, so skip
+        # collection while the wave runs: a collection would walk the whole heap in
+        # every worker (copying its pages) and again for each batch of results.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        _WAVE = (operators, handlers, dispatch, objects, templates, resolve_fn)
+        try:
+            with ProcessPoolExecutor(len(chunks), mp_context=multiprocessing.get_context("fork")) as pool:
+                futures = [pool.submit(_run_operator_chunk, chunk) for chunk in chunks]
+                results = [result for future in futures for result in future.result()]
+            for index, (changed, created, deleted) in zip(wave, results):
+                for oid in deleted:
+                    del objects[oid]
+                for oid, obj in changed:
+                    objects[oid] = obj
+                for oid, obj in created:
+                    objects[oid] = obj
+                effects[index] = ([oid for oid, _obj in created], deleted)
+        finally:
+            _WAVE = None
+            if gc_enabled:
+                gc.enable()
+
+    if in_order:
+        return objects
+    order = dict.fromkeys(initial)
+    for index in range(len(operators)):
+        created, deleted = effects[index]
+        for oid in deleted:
+            order.pop(oid, None)
+        order.update(dict.fromkeys(created))
+    return {oid: objects[oid] for oid in order}
+
+
+def _apply_tracked(apply, dispatch, objects, templates, op, resolve_fn) -> tuple:
+    """Run one operator; return (replaced, created, deleted) among the ids it writes.
+
+    `replaced` and `created` are (id, object) pairs, `created` in insertion order.
+    For an operator without `access`, every object counts as written.
+    """
+    access = dispatch[op.get("op")][2]
+    before = dict(objects) if access is None else {oid: objects.get(oid) for oid in access(op)[1]}
+    count = len(objects)
+    apply(objects, templates, op, resolve_fn)
+    deleted = [oid for oid, old in before.items() if old is not None and oid not in objects]
+    replaced = [(oid, objects[oid]) for oid, old in before.items()
+                if old is not None and oid in objects and objects[oid] is not old]
+    # New ids are the last ones inserted.
+    added = len(objects) - count + len(deleted)
+    created = [(oid, objects[oid]) for oid in list(islice(reversed(objects), added))[::-1]] if added else []
+    return replaced, created, deleted
+
+
+def _run_operator_chunk(indices: list) -> list:
+    """Worker side of _run_waves: run operators[indices] in order on the inherited objects.
+
+    Returns _apply_tracked's (replaced, created, deleted) per operator.
+    """
+    operators, handlers, dispatch, objects, templates, resolve_fn = _WAVE
+    return [
+        _apply_tracked(handlers[index], dispatch, objects, templates, operators[index], resolve_fn)
+        for index in indices
+    ]
+
+
+@lru_cache(maxsize=128)
+def _dispatch_entry(name: str, handler: str | None) -> tuple:
+    """Return (apply, validate, access) for one operator, importing its handler module.
+
+    `validate(op, known_ids, templates)` is an optional function next to the handler that
+    checks the operator's object references and returns the ids the operator creates.
+    `access(op)` is an optional function returning the (reads, writes) object ids, used
+    by plan_operator_waves; operators without it always run in the main process.
+    """
+    if not handler:
+        raise ValueError(f"Operator '{name}' is missing 'handler' in registry/operators.json")
+    apply = _import_attr(handler)
+    module = importlib.import_module(handler.rsplit(".", 1)[0])
+    return apply, getattr(module, "validate", None), getattr(module, "access", None)
+
+
+def _operator_dispatch(registries: dict, names=None) -> dict:
+    """{op name: (apply, validate, access)} for the registered operators in `names` (all if None).
+
+    Only those handler modules are imported, so a scene loads just the operators it uses.
+    """
+    ops = (registries or {}).get("operators", {})
+    return {
+        name: _dispatch_entry(name, entry.get("handler"))
+        for name, entry in ops.items()
+        if names is None or name in names
+    }
+
+
+def _bind_operators(operators: list, dispatch: dict, objects: dict, templates: dict) -> list:
+    """Return the handler for each operator, validating references in execution order."""
+    known_ids = set(objects)
+    handlers = []
+    for op in operators:
+        entry = dispatch.get(op.get("op"))
+        if entry is None:
+            raise ValueError(f"Unknown operator: {op.get('op')}")
+        apply, validate, _access = entry
+        if validate is not None:
+            known_ids.update(validate(op, known_ids, templates) or ())
+        handlers.append(apply)
+    return handlers
@@ -0,0 +1,296 @@
+"""Long-lived local pipeline server.
+
+Keeps registries, prototype resolvers and operator handlers resident so an authoring
+loop can run compile -> build -> emit many times without a cold `python -m engine.run`
+start per iteration.
+
+HTTP on localhost only:
+
+  POST /run     body: scene JSON (constraints or internal)
+                200 -> {"ok": true, "scad": "...", "resolved": {...}, "elapsed_ms": ...}
+                422 -> {"ok": false, "error": "..."}   (pipeline error)
+                400 invalid JSON or Content-Length, 503 server busy or worker died,
+                504 timed out
+  GET  /health  -> {"status": "ok", "workers": N, "uptime_s": ..., "stats": {...}}
+  GET  /stats   -> same as /health
+
+Scenes run in single-process ProcessPoolExecutor lanes, one per worker, warmed by
+the same initializer as engine.batch. A request waits (untimed) for an idle lane;
+the timeout counts from when its scene starts running. A request that exceeds it
+gets a 504, and its worker process is killed and replaced by a fresh warm one
+before the request stops counting as in flight. A worker that dies mid-scene is
+replaced the same way and the request gets a 503. If a replacement cannot be
+started, the lane is queued empty and the next request to take it retries.
+
+The server refuses to bind to non-loopback addresses.
+
+Usage:
+  python -m engine.server [--host 127.0.0.1] [--port 8765] [--workers N] [--timeout 30]
+"""
+from __future__ import annotations
+
+import argparse
+import ipaddress
+import json
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as wait_futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from engine import batch
+
+
+def _run_scene_in_worker(scene: dict) -> Tuple[str, dict]:
+    from engine.run import run_scene
+
+    return run_scene(scene, batch._WORKER_REGISTRIES)
+
+
+class PipelineServer(ThreadingHTTPServer):
+    """HTTP server owning a warm worker pool and request statistics."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        workers: int = 0,
+        timeout_s: float = 30.0,
+        max_pending: int = 0,
+        bundle_root: str | Path | None = None,
+        verbose: bool = False,
+    ):
+        super().__init__(address, PipelineRequestHandler)
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.timeout_s = float(timeout_s)
+        self.max_pending = max_pending if max_pending > 0 else self.workers * 4
+        self.verbose = verbose
+        self._root = str(Path(bundle_root) if bundle_root is not None else batch._bundle_root())
+        self._lock = threading.Lock()
+        self._pools: set = set()
+        # Idle lanes: (pool, worker pid). Every worker starts now so the first
+        # request does not pay the warm-up cost.
+        self._idle: queue.Queue = queue.Queue()
+        pools = [self._new_pool() for _ in range(self.workers)]
+        for pool, f in [(pool, pool.submit(os.getpid)) for pool in pools]:
+            self._idle.put((pool, f.result()))
+
+        self.started = time.monotonic()
+        self._in_flight = 0
+        self._stats: Dict[str, Any] = {
+            "requests": 0,
+            "ok": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        pool = ProcessPoolExecutor(max_workers=1, initializer=batch._init_pool_worker, initargs=(self._root,))
+        with self._lock:
+            self._pools.add(pool)
+        return pool
+
+    def _new_lane(self) -> Tuple[ProcessPoolExecutor, int]:
+        pool = self._new_pool()
+        try:
+            return pool, pool.submit(os.getpid).result()
+        except BaseException:
+            self._drop_pool(pool)
+            raise
+
+    def _drop_pool(self, pool: ProcessPoolExecutor) -> None:
+        pool.shutdown(wait=True)
+        with self._lock:
+            self._pools.discard(pool)
+
+    def _recycle_lane(self, lane, future) -> Tuple[Optional[ProcessPoolExecutor], Optional[int]]:
+        """Kill the lane's worker, wait for its job to end and return a fresh warm lane.
+
+        Returns (None, None) if no replacement could be started; the next request
+        that takes that lane retries.
+        """
+        pool, pid = lane
+        try:
+            os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        except OSError:
+            pass  # Already gone.
+        try:
+            if future is not None:
+                wait_futures([future])
+            self._drop_pool(pool)
+            return self._new_lane()
+        except Exception:
+            return None, None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["in_flight"] = self._in_flight
+        done = out["ok"] + out["errors"]
+        out["mean_ms"] = (out["total_ms"] / done) if done else 0.0
+        return out
+
+    def run_scene(self, scene: dict) -> Tuple[int, Dict[str, Any]]:
+        """Run one scene through the pool; return (http_status, response_body)."""
+        with self._lock:
+            self._stats["requests"] += 1
+            if self._in_flight >= self.max_pending:
+                self._stats["rejected"] += 1
+                return 503, {"ok": False, "error": "server busy"}
+            self._in_flight += 1
+
+        try:
+            # A lane is (pool, pid), or (None, None) when its replacement failed.
+            lane = self._idle.get()
+            try:
+                if lane[0] is None:
+                    lane = self._new_lane()
+            except Exception as e:
+                self._idle.put(lane)
+                self._record(0.0, ok=False)
+                return 503, {"ok": False, "error": f"worker unavailable: {type(e).__name__}: {e}"}
+            try:
+                t0 = time.perf_counter()
+                future = None
+                try:
+                    future = lane[0].submit(_run_scene_in_worker, scene)
+                    scad, resolved = future.result(timeout=self.timeout_s)
+                except FutureTimeoutError:
+                    lane = self._recycle_lane(lane, future)
+                    with self._lock:
+                        self._stats["timeouts"] += 1
+                    return 504, {"ok": False, "error": f"timed out after {self.timeout_s}s"}
+                except BrokenExecutor as e:
+                    # The worker died (e.g. killed by the OS); replace it.
+                    lane = self._recycle_lane(lane, future)
+                    elapsed = (time.perf_counter() - t0) * 1000.0
+                    self._record(elapsed, ok=False)
+                    return 503, {"ok": False, "error": f"worker died: {type(e).__name__}: {e}"}
+                except Exception as e:
+                    elapsed = (time.perf_counter() - t0) * 1000.0
+                    self._record(elapsed, ok=False)
+                    return 422, {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            finally:
+                self._idle.put(lane)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        elapsed = (time.perf_counter() - t0) * 1000.0
+        self._record(elapsed, ok=True)
+        return 200, {"ok": True, "scad": scad, "resolved": resolved, "elapsed_ms": elapsed}
+
+    def _record(self, elapsed_ms: float, ok: bool) -> None:
+        with self._lock:
+            self._stats["ok" if ok else "errors"] += 1
+            self._stats["total_ms"] += elapsed_ms
+            self._stats["max_ms"] = max(self._stats["max_ms"], elapsed_ms)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._lock:
+            pools = list(self._pools)
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class PipelineRequestHandler(BaseHTTPRequestHandler):
+    server: PipelineServer
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path in ("/health", "/stats"):
+            self._send_json(200, {
+                "status": "ok",
+                "workers": self.server.workers,
+                "timeout_s": self.server.timeout_s,
+                "uptime_s": time.monotonic() - self.server.started,
+                "stats": self.server.stats(),
+            })
+            return
+        self._send_json(404, {"ok": False, "error": f"unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/run":
+            self._send_json(404, {"ok": False, "error": f"unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self._send_json(400, {"ok": False, "error": "invalid Content-Length"})
+            return
+        try:
+            scene = json.loads(self.rfile.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            self._send_json(400, {"ok": False, "error": f"invalid JSON: {e}"})
+            return
+        if not isinstance(scene, dict):
+            self._send_json(400, {"ok": False, "error": "scene payload must be a JSON object"})
+            return
+        status, body = self.server.run_scene(scene)
+        self._send_json(status, body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m engine.server", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1", help="Loopback bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds (default: 30)")
+    parser.add_argument("--max-pending", type=int, default=0, help="Max in-flight requests before 503 (default: 4 x workers)")
+    parser.add_argument("--verbose", action="store_true", help="Log each HTTP request to stderr")
+    args = parser.parse_args(argv)
+    if not _is_loopback(args.host):
+        parser.error(f"--host must be a loopback address (the server is for local use only): {args.host}")
+
+    server = PipelineServer(
+        (args.host, args.port),
+        workers=args.workers,
+        timeout_s=args.timeout,
+        max_pending=args.max_pending,
+        verbose=args.verbose,
+    )
+    host, port = server.server_address[:2]
+    print(f"engine.server listening on http://{host}:{port} ({server.workers} workers)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+"""Cached per-object footprint data, and a uniform grid over it, for a scene's objects map.
+
+build_scene hands operators an engine.scene.IndexedObjects map (a dict). Its
+`spatial` attribute is a SpatialIndex, created on first use:
+
+    from engine.spatial import index_of
+    index = index_of(objects)
+    index.bbox("M12")                                  # cached (min_x, min_y, max_x, max_y)
+    index.polygon("Octagon")                           # cached engine.geom.Polygon of the footprint
+    index.query_bbox((0, 0, 40, 40))                   # ids whose bbox overlaps, in map order
+    index.nearest_ray_hit((0, 0), (1, 0), ids={"W"})   # (id, t, point) of the nearest hit
+
+The grid behind the two queries is built on the first query (cell = median
+object size; objects covering too many cells go on a list every query scans).
+
+Operators replace objects rather than mutate them (see engine.operators), so the
+index stays current by watching item assignment and deletion on the map: a
+replaced or removed id is dropped, recomputed on next use and moved in the grid
+on the next query. Other dict mutators (update, pop, setdefault) are not tracked.
+"""
+from __future__ import annotations
+
+import math
+
+from engine.geom import EPS, Polygon, first_ray_polygon_hit
+
+Bbox = tuple[float, float, float, float]
+
+# An object covering more cells than this goes on a list scanned by every query
+# instead (boundaries like the octagon would otherwise fill the grid).
+_MAX_CELLS_PER_OBJECT = 256
+
+
+def footprint_bbox(footprint) -> Bbox | None:
+    if not footprint:
+        return None
+    xs = [float(p[0]) for p in footprint]
+    ys = [float(p[1]) for p in footprint]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class SpatialIndex:
+    """Footprint bbox and Polygon per object id, cached until replaced, and a grid of ids; see the module docstring."""
+
+    def __init__(self, objects: dict, cell_size: float | None = None):
+        self._objects = objects
+        self._cell_size = cell_size
+        self._bboxes: dict[str, Bbox | None] = {}
+        self._polygons: dict[str, Polygon | None] = {}
+        self._order: dict[str, int] = {}            # id -> first-seen sequence number
+        self._cells: dict[tuple[int, int], list[str]] | None = None
+        self._large: list[str] = []
+        self._placed: dict[str, tuple] = {}         # id -> (cell keys) or ("large",)
+        self._dirty: set[str] = set()
+
+    def invalidate(self, oid: str) -> None:
+        """Forget what is cached for `oid`; it is recomputed (and re-gridded) on next use."""
+        self._bboxes.pop(oid, None)
+        self._polygons.pop(oid, None)
+        if self._cells is not None:
+            self._dirty.add(oid)
+            if oid not in self._objects:
+                # Deleted: if it comes back, it comes back at the end of the map.
+                self._order.pop(oid, None)
+
+    def bbox(self, oid: str) -> Bbox | None:
+        """The footprint bbox of object `oid` (None if it has no footprint), cached until it is replaced."""
+        try:
+            return self._bboxes[oid]
+        except KeyError:
+            obj = self._objects.get(oid)
+            box = footprint_bbox(obj.get("geom", {}).get("footprint")) if obj is not None else None
+            self._bboxes[oid] = box
+            return box
+
+    def polygon(self, oid: str) -> Polygon | None:
+        """Object `oid`'s footprint as a Polygon (None if it has none), cached until it is replaced.
+
+        Operators that use the same object repeatedly (a boundary several clips
+        share) get its convexity, orientation and bbox computed once.
+        """
+        try:
+            return self._polygons[oid]
+        except KeyError:
+            obj = self._objects.get(oid)
+            fp = obj.get("geom", {}).get("footprint") if obj is not None else None
+            poly = self._polygons[oid] = Polygon(fp) if fp else None
+            return poly
+
+
+    # -- grid -----------------------------------------------------------------
+
+    def _refresh(self) -> None:
+        if self._cells is None:
+            self._build()
+            return
+        for oid in sorted(self._dirty, key=lambda o: self._order.get(o, math.inf)):
+            self._unplace(oid)
+            if oid in self._objects:
+                self._place(oid)
+        self._dirty.clear()
+
+    def _build(self) -> None:
+        if self._cell_size is None:
+            sides = sorted(
+                max(b[2] - b[0], b[3] - b[1]) for b in (self.bbox(oid) for oid in self._objects) if b is not None
+            )
+            median = sides[len(sides) // 2] if sides else 1.0
+            self._cell_size = median if median > EPS else 1.0
+        self._cells = {}
+        for oid in self._objects:
+            self._place(oid)
+
+    def _place(self, oid: str) -> None:
+        self._order.setdefault(oid, len(self._order))
+        box = self.bbox(oid)
+        if box is None:
+            return
+        x0, y0, x1, y1 = self._cell_range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > _MAX_CELLS_PER_OBJECT:
+            self._large.append(oid)
+            self._placed[oid] = ("large",)
+            return
+        keys = tuple((ix, iy) for ix in range(x0, x1 + 1) for iy in range(y0, y1 + 1))
+        for key in keys:
+            self._cells.setdefault(key, []).append(oid)
+        self._placed[oid] = keys
+
+    def _unplace(self, oid: str) -> None:
+        keys = self._placed.pop(oid, ())
+        if keys == ("large",):
+            self._large.remove(oid)
+            return
+        for key in keys:
+            bucket = self._cells[key]
+            bucket.remove(oid)
+            if not bucket:
+                del self._cells[key]
+
+    def _cell_range(self, box: Bbox) -> tuple[int, int, int, int]:
+        s = self._cell_size
+        return (math.floor(box[0] / s), math.floor(box[1] / s), math.floor(box[2] / s), math.floor(box[3] / s))
+
+    def _sorted(self, ids) -> list[str]:
+        return sorted(ids, key=self._order.__getitem__)
+
+    # -- queries --------------------------------------------------------------
+
+    def query_bbox(self, box: Bbox) -> list[str]:
+        """Ids of objects whose footprint bbox overlaps `box` (touching counts), in map order."""
+        self._refresh()
+        qx0, qy0, qx1, qy1 = box
+        x0, y0, x1, y1 = self._cell_range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            candidates = {oid for bucket in self._cells.values() for oid in bucket}
+        else:
+            candidates = set()
+            for ix in range(x0, x1 + 1):
+                for iy in range(y0, y1 + 1):
+                    candidates.update(self._cells.get((ix, iy), ()))
+        candidates.update(self._large)
+        hits = []
+        for oid in candidates:
+            b = self._bboxes[oid]
+            if b[0] <= qx1 and qx0 <= b[2] and b[1] <= qy1 and qy0 <= b[3]:
+                hits.append(oid)
+        return self._sorted(hits)
+
+    def nearest_ray_hit(self, origin, direction, ids=None, exclude=()):
+        """Nearest footprint boundary hit by the ray origin + t*direction (t > EPS).
+
+        Only objects in `ids` (if given) and not in `exclude` are considered. Returns
+        (id, t, point) or None. Each footprint is tested with
+        engine.geom.first_ray_polygon_hit, so t and point match a direct call; among
+        equal t the first id in map order wins. The grid cells along the ray are
+        walked in order and the walk stops once a hit is nearer than the next cell.
+        """
+        self._refresh()
+        ox, oy = float(origin[0]), float(origin[1])
+        dx, dy = float(direction[0]), float(direction[1])
+        seen: set[str] = set()
+        best = None
+
+        def consider(oids) -> None:
+            nonlocal best
+            for oid in self._sorted(o for o in oids if o not in seen):
+                seen.add(oid)
+                if (ids is not None and oid not in ids) or oid in exclude:
+                    continue
+                hit, t, p = first_ray_polygon_hit((ox, oy), (dx, dy), list(self.polygon(oid)))
+                if hit and (best is None or t < best[1] or (t == best[1] and self._order[oid] < self._order[best[0]])):
+                    best = (oid, t, p)
+
+        consider(self._large)
+        for t_exit, key in self._cells_along(ox, oy, dx, dy):
+            consider(self._cells.get(key, ()))
+            # A nearer hit would lie in a cell already scanned.
+            if best is not None and best[1] + EPS < t_exit:
+                break
+        return best
+
+    def _cells_along(self, ox: float, oy: float, dx: float, dy: float):
+        """Yield (t at which the ray leaves the cell, cell key) for grid cells the ray crosses, in order."""
+        if not self._cells:
+            return
+        s = self._cell_size
+        keys = self._cells.keys()
+        gx0 = min(k[0] for k in keys)
+        gx1 = max(k[0] for k in keys)
+        gy0 = min(k[1] for k in keys)
+        gy1 = max(k[1] for k in keys)
+        # Advance to where the ray enters the occupied grid.
+        t0, t1 = 0.0, math.inf
+        for o, d, lo, hi in ((ox, dx, gx0 * s, (gx1 + 1) * s), (oy, dy, gy0 * s, (gy1 + 1) * s)):
+            if d == 0.0:
+                if o < lo or o > hi:
+                    return
+                continue
+            ta, tb = (lo - o) / d, (hi - o) / d
+            if ta > tb:
+                ta, tb = tb, ta
+            t0, t1 = max(t0, ta), min(t1, tb)
+        if t0 > t1:
+            return
+        ix = min(max(math.floor((ox + t0 * dx) / s), gx0), gx1)
+        iy = min(max(math.floor((oy + t0 * dy) / s), gy0), gy1)
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        next_x = ((ix + (step_x > 0)) * s - ox) / dx if dx != 0.0 else math.inf
+        next_y = ((iy + (step_y > 0)) * s - oy) / dy if dy != 0.0 else math.inf
+        delta_x = s / abs(dx) if dx != 0.0 else math.inf
+        delta_y = s / abs(dy) if dy != 0.0 else math.inf
+        while gx0 <= ix <= gx1 and gy0 <= iy <= gy1:
+            t_exit = min(next_x, next_y)
+            yield t_exit, (ix, iy)
+            if next_x < next_y:
+                ix += step_x
+                next_x += delta_x
+            else:
+                iy += step_y
+                next_y += delta_y
+
+
+def index_of(objects: dict) -> SpatialIndex:
+    """The spatial index for an objects map (a fresh one if it is a plain dict)."""
+    spatial = getattr(objects, "spatial", None)
+    return spatial if spatial is not None else SpatialIndex(objects)
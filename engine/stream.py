@@ -0,0 +1,85 @@
+"""JSON-lines streaming mode for engine.run.
+
+Lets a supervising process drive the engine as a coprocessor over a pipe:
+
+  python -m engine.run --jsonl < scenes.jsonl > results.jsonl
+
+Each non-blank input line is one scene document. Each produces exactly one output
+line (flushed immediately), in input order:
+
+  {"index": 0, "ok": true,  "scad": "...", "resolved": {...}, "timings_ms": {...}}
+  {"index": 1, "ok": false, "error": "...", "timings_ms": {...}}
+
+`index` counts non-blank input lines from 0. `timings_ms` has parse/compile/build/emit
+(the stages that ran; "cache" instead on an artifact-cache hit) and total. Registries
+load once; the process exits at EOF.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import Any, Dict, IO, Optional
+
+from engine.registry import load_registries
+from engine.scene import warm_registries
+
+
+def _run_line(line: str, index: int, registries: dict, cache=None) -> Dict[str, Any]:
+    from engine.run import run_scene
+
+    timings: Dict[str, float] = {}
+    t0 = time.perf_counter()
+    record: Dict[str, Any] = {"index": index}
+    try:
+        scene = json.loads(line)
+        timings["parse"] = (time.perf_counter() - t0) * 1000.0
+        if not isinstance(scene, dict):
+            raise ValueError("scene document must be a JSON object")
+        scad, resolved = run_scene(scene, registries, timings, cache=cache)
+    except Exception as e:
+        record["ok"] = False
+        record["error"] = f"{type(e).__name__}: {e}"
+    else:
+        record["ok"] = True
+        record["scad"] = scad
+        record["resolved"] = resolved
+    timings["total"] = (time.perf_counter() - t0) * 1000.0
+    record["timings_ms"] = timings
+    return record
+
+
+def run_stream(in_stream: IO[str], out_stream: IO[str], registries: Optional[dict] = None, cache=None) -> int:
+    """Process scene documents from `in_stream` until EOF. Returns the number of failed records.
+
+    `cache` is an optional engine.cache.ArtifactCache; a hit reports timings_ms.cache instead of stages.
+    """
+    if registries is None:
+        from engine.run import _bundle_root
+
+        registries = load_registries(_bundle_root())
+    warm_registries(registries)
+
+    index = 0
+    failed = 0
+    for line in in_stream:
+        if not line.strip():
+            continue
+        record = _run_line(line, index, registries, cache)
+        if not record["ok"]:
+            failed += 1
+        out_stream.write(json.dumps(record) + "\n")
+        out_stream.flush()
+        index += 1
+    return failed
+
+
+def main_stream(args) -> int:
+    """CLI entry for `python -m engine.run --jsonl`.
+
+    Per-record errors are reported in-band; the exit code is 0 unless the stream itself fails.
+    """
+    from engine.run import _cache_from_args
+
+    run_stream(sys.stdin, sys.stdout, cache=_cache_from_args(args))
+    return 0
@@ -0,0 +1,149 @@
+"""Watch mode for engine.run.
+
+  python -m engine.run scene.json out.scad --watch [--interval 0.25] [--debounce 0.3]
+
+Builds once, then polls the scene file and registry/*.json by mtime. When a file's
+mtime changes, waits until saves have been quiet for the debounce period, then
+compares content hashes and rebuilds only if some content actually changed.
+Registries are reloaded only when a registry file changed; imports, resolvers and
+handlers stay warm for the life of the process. Each build prints per-stage timings.
+A failing build is reported and watching continues.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from engine.registry import load_registries
+from engine.scene import warm_registries
+
+
+def _watched_files(scene_path: Path, bundle_root: Path) -> List[Path]:
+    return [scene_path] + sorted((bundle_root / "registry").glob("*.json"))
+
+
+def _stat(paths: List[Path]) -> Dict[Path, Optional[Tuple[int, int]]]:
+    out: Dict[Path, Optional[Tuple[int, int]]] = {}
+    for p in paths:
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            out[p] = None
+        else:
+            out[p] = (st.st_mtime_ns, st.st_size)
+    return out
+
+
+def _digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _format_timings(timings: Dict[str, float]) -> str:
+    parts = [f"{stage} {timings[stage]:.1f}ms" for stage in ("compile", "build", "emit", "write") if stage in timings]
+    return ", ".join(parts) + f" | total {sum(timings.values()):.1f}ms"
+
+
+def watch(
+    scene_path: str | Path,
+    out_path: str | Path,
+    out_scene_json_path: str | Path | None = None,
+    bundle_root: str | Path | None = None,
+    interval: float = 0.25,
+    debounce: float = 0.3,
+    max_builds: Optional[int] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    log: Callable[[str], None] = print,
+) -> int:
+    """Build `scene_path` into `out_path` and rebuild on content changes.
+
+    Runs until interrupted, `should_stop()` returns True, or `max_builds` builds
+    (including the initial one) have run. Returns the number of builds.
+    """
+    from engine.run import _bundle_root, run_scene
+
+    scene_path = Path(scene_path)
+    out_path = Path(out_path)
+    out_scene_json_path = Path(out_scene_json_path) if out_scene_json_path else None
+    root = Path(bundle_root) if bundle_root is not None else _bundle_root()
+
+    files = _watched_files(scene_path, root)
+    registry_files = set(files[1:])
+    stats = _stat(files)
+    digests = {p: _digest(p) for p in files}
+    registries = load_registries(root)
+    warm_registries(registries)
+
+    def build(reason: str) -> None:
+        timings: Dict[str, float] = {}
+        try:
+            scene = json.loads(scene_path.read_text(encoding="utf-8"))
+            scad, resolved = run_scene(scene, registries, timings)
+            t0 = time.perf_counter()
+            out_path.write_text(scad, encoding="utf-8")
+            if out_scene_json_path is not None:
+                out_scene_json_path.parent.mkdir(parents=True, exist_ok=True)
+                out_scene_json_path.write_text(json.dumps(resolved, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            timings["write"] = (time.perf_counter() - t0) * 1000.0
+        except Exception as e:
+            log(f"[FAIL] {reason}: {type(e).__name__}: {e}")
+        else:
+            log(f"[BUILD] {reason} -> {out_path} ({_format_timings(timings)})")
+
+    build("initial build")
+    builds = 1
+
+    def stopping() -> bool:
+        return (max_builds is not None and builds >= max_builds) or (should_stop is not None and should_stop())
+
+    try:
+        while not stopping():
+            time.sleep(interval)
+            current = _stat(files)
+            if current == stats:
+                continue
+
+            # Debounce: wait for a quiet period with no further mtime changes.
+            quiet_since = time.monotonic()
+            while time.monotonic() - quiet_since < debounce and not stopping():
+                time.sleep(min(interval, debounce))
+                latest = _stat(files)
+                if latest != current:
+                    current = latest
+                    quiet_since = time.monotonic()
+            stats = current
+
+            changed = []
+            for p in files:
+                d = _digest(p)
+                if d != digests[p]:
+                    digests[p] = d
+                    changed.append(p)
+            if not changed:
+                continue
+
+            if registry_files.intersection(changed):
+                try:
+                    registries = load_registries(root)
+                    warm_registries(registries)
+                except Exception as e:
+                    log(f"[FAIL] reloading registries: {type(e).__name__}: {e}")
+                    continue
+            build("changed: " + ", ".join(p.name for p in changed))
+            builds += 1
+    except KeyboardInterrupt:
+        pass
+    return builds
+
+
+def main_watch(args) -> int:
+    """CLI entry for `python -m engine.run scene.json out.scad --watch`."""
+    log = lambda msg: print(msg, flush=True)  # noqa: E731
+    log(f"Watching {args.scene} and registry/*.json (Ctrl-C to stop)")
+    watch(args.scene, args.out, interval=args.interval, debounce=args.debounce, log=log)
+    return 0
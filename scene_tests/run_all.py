@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import argparse
 import glob
+import json
 import os
-import shutil
 import sys
 import importlib
+import time
 from pathlib import Path
 
+from engine.batch import scene_name
+
 
 def _repo_root() -> Path:
     # scene_tests/... -> repo root
@@ -42,6 +45,65 @@ def _maybe_run_scene_assertions(case_name: str, resolved_scene: dict) -> None:
     fn(resolved_scene)
 
 
+# Registries for the current process (the main process when --jobs 1, else each pool worker).
+_REGISTRIES: dict | None = None
+
+
+def _init_worker() -> None:
+    """Parse registries and import resolvers/handlers once per process."""
+    global _REGISTRIES
+    from engine.registry import load_registries
+    from engine.scene import warm_registries
+
+    _REGISTRIES = load_registries(_repo_root())
+    warm_registries(_REGISTRIES)
+
+
+def _run_case(path: str) -> dict:
+    """Run one case fully in memory.
+
+    Returns {"scad", "resolved", "error", "ms"}; "resolved" is the resolved scene
+    serialized exactly as engine.run writes *.resolved.json. If the scene's own
+    assertions fail, "error" is set and "scad"/"resolved" are kept.
+    """
+    from engine.run import run_scene
+
+    t0 = time.perf_counter()
+    result = {"scad": None, "resolved": None, "error": None}
+    try:
+        scene = json.loads(_read_text(path))
+        scad, resolved = run_scene(scene, _REGISTRIES)
+        result["scad"] = scad
+        result["resolved"] = json.dumps(resolved, indent=2, sort_keys=True) + "\n"
+        _maybe_run_scene_assertions(scene_name(path), resolved)
+    except Exception as e:
+        result["error"] = str(e)
+    result["ms"] = (time.perf_counter() - t0) * 1000.0
+    return result
+
+
+def _run_cases(case_files: list[str], jobs: int):
+    """Yield (path, result) in case_files order, running up to `jobs` cases at once."""
+    if jobs == 1 or len(case_files) == 1:
+        _init_worker()
+        for path in case_files:
+            yield path, _run_case(path)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(case_files)), initializer=_init_worker) as pool:
+        # map() yields in submission order, so output is identical for any --jobs value.
+        yield from zip(case_files, pool.map(_run_case, case_files))
+
+
+def _write_outputs(outdir: Path, name: str, result: dict) -> Path:
+    out_path = outdir / f"{name}.scad"
+    out_path.write_text(result["scad"], encoding="utf-8")
+    (outdir / f"{name}.resolved.json").write_text(result["resolved"], encoding="utf-8")
+    return out_path
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -78,6 +140,23 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Update golden files from generated outputs (overwrites scene_tests/golden/*.scad).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run cases in a pool of N worker processes; 0 = one per CPU (default: 1, in-process)",
+    )
+    parser.add_argument(
+        "--write-all",
+        action="store_true",
+        help="Write .scad/.resolved.json for every case, not just failing or missing-golden ones.",
+    )
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=5,
+        help="Report the N slowest cases at the end (default: 5; 0 disables)",
+    )
     args = parser.parse_args(argv)
 
     cases_dir = Path(os.path.abspath(args.cases))
@@ -92,51 +171,61 @@ def main(argv: list[str] | None = None) -> int:
         print(f"No scene cases found at: {pattern}")
         return 2
 
-    from engine.run import run_file_with_resolved
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    write_all = args.write_all or args.no_compare
 
     failures: list[str] = []
     missing_golden: list[str] = []
+    timings: list[tuple[float, str]] = []
 
-    for path in case_files:
+    for path, result in _run_cases(case_files, jobs):
         base = os.path.basename(path)
-        name = base
-        for suf in (".scene.json", ".json"):
-            if name.endswith(suf):
-                name = name[: -len(suf)]
-                break
-
-        out_path = outdir / f"{name}.scad"
-        out_scene_path = outdir / f"{name}.resolved.json"
+        name = scene_name(path)
         golden_path = golden_dir / f"{name}.scad"
-
-        try:
-            _scad_path, resolved = run_file_with_resolved(path, str(out_path), str(out_scene_path))
-            _maybe_run_scene_assertions(name, resolved)
-        except Exception as e:
-            failures.append(f"[FAIL] {base}: {e}")
+        ms = result["ms"]
+        timings.append((ms, base))
+
+        if result["error"] is not None:
+            if result["scad"] is not None:
+                # The pipeline ran but the scene's own assertions failed; keep its outputs.
+                out_path = _write_outputs(outdir, name, result)
+                failures.append(f"[FAIL] {base}: {result['error']} (wrote {out_path})")
+            else:
+                failures.append(f"[FAIL] {base}: {result['error']}")
             continue
 
         if args.update_golden:
-            shutil.copyfile(out_path, golden_path)
+            golden_path.write_text(result["scad"], encoding="utf-8")
+            if write_all:
+                _write_outputs(outdir, name, result)
             print(f"[GOLDEN] {base} -> {golden_path}")
             continue
 
         if args.no_compare:
-            print(f"[OK] {base} -> {out_path}")
+            out_path = _write_outputs(outdir, name, result)
+            print(f"[OK] {base} -> {out_path} ({ms:.1f} ms)")
             continue
 
         if not golden_path.exists():
             missing_golden.append(base)
-            print(f"[MISSING GOLDEN] {base} (expected {golden_path})")
+            out_path = _write_outputs(outdir, name, result)
+            print(f"[MISSING GOLDEN] {base} (expected {golden_path}; wrote {out_path})")
             continue
 
-        got = _read_text(str(out_path))
-        exp = _read_text(str(golden_path))
-        if got != exp:
-            failures.append(f"[DIFF] {base}: output does not match golden ({golden_path})")
-            print(f"[FAIL] {base}")
+        if result["scad"] != _read_text(str(golden_path)):
+            out_path = _write_outputs(outdir, name, result)
+            failures.append(f"[DIFF] {base}: output does not match golden ({golden_path}); got {out_path}")
+            print(f"[FAIL] {base} ({ms:.1f} ms)")
         else:
-            print(f"[PASS] {base}")
+            if write_all:
+                _write_outputs(outdir, name, result)
+            print(f"[PASS] {base} ({ms:.1f} ms)")
+
+    if args.slowest > 0 and len(timings) > 1:
+        slowest = sorted(timings, key=lambda t: (-t[0], t[1]))[: args.slowest]
+        print(f"\nSlowest {len(slowest)} of {len(timings)} cases (total {sum(ms for ms, _b in timings):.1f} ms):")
+        for ms, base in slowest:
+            print(f"  {ms:8.1f} ms  {base}")
 
     if args.update_golden:
         return 0
@@ -0,0 +1,21 @@
+"""Scene and polygon factories shared by the tests."""
+import math
+
+
+def post(obj_id, x):
+    """A 2 x 2 poly_extrude post at (x, 0)."""
+    return {"id": obj_id, "prototype": "poly_extrude",
+            "params": {"footprint": [[x, 0], [x + 2, 0], [x + 2, 2], [x, 2]], "extrusion": {"z_base": 0, "height": 1}}}
+
+
+def octagon(r=83.5, cx=0.0, cy=0.0):
+    """A regular octagon with inradius `r` around (cx, cy), counter-clockwise."""
+    c = r / math.cos(math.pi / 8)
+    return [(cx + c * math.cos(math.pi / 8 + k * math.pi / 4), cy + c * math.sin(math.pi / 8 + k * math.pi / 4))
+            for k in range(8)]
+
+
+def random_convex(rng, n, r, cx, cy):
+    """`n` random points on the circle of radius `r` around (cx, cy), counter-clockwise."""
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(n))
+    return [(cx + r * math.cos(a), cy + r * math.sin(a)) for a in angles]
@@ -0,0 +1,59 @@
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from engine.batch import collect_scene_paths, run_batch
+
+REPO = Path(__file__).resolve().parents[1]
+CASES = REPO / "scene_tests" / "cases"
+GOLDEN = REPO / "scene_tests" / "golden"
+
+
+class TestBatchMode(unittest.TestCase):
+    def test_directory_batch_matches_golden_in_order(self):
+        with tempfile.TemporaryDirectory() as td:
+            results = run_batch([str(CASES)], td, jobs=2)
+
+            expected = sorted(str(p) for p in CASES.glob("*.json"))
+            self.assertEqual([r["scene"] for r in results], expected)
+            for r in results:
+                self.assertTrue(r["ok"], r["error"])
+                name = Path(r["out"]).name
+                got = Path(r["out"]).read_text(encoding="utf-8")
+                self.assertEqual(got, (GOLDEN / name).read_text(encoding="utf-8"), name)
+
+    def test_failure_is_reported_per_file_without_aborting(self):
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            bad = td / "bad.scene.json"
+            bad.write_text(json.dumps({"anchor_id": "x", "objects": [{"id": "x", "prototype": "nope"}]}), encoding="utf-8")
+            good = CASES / "rect_solid_constraints.scene.json"
+            manifest = td / "scenes.txt"
+            manifest.write_text(f"# batch manifest\nbad.scene.json\n{good}\n", encoding="utf-8")
+
+            results = run_batch([str(manifest)], td / "out", jobs=1, write_resolved=True)
+
+            self.assertEqual([r["ok"] for r in results], [False, True])
+            self.assertIn("Unknown prototype", results[0]["error"])
+            self.assertFalse(Path(results[0]["out"]).exists())
+            self.assertTrue(Path(results[1]["out"]).exists())
+            self.assertTrue(Path(results[1]["resolved"]).exists())
+
+    def test_glob_input_and_deduplication(self):
+        pattern = str(CASES / "rect_*.scene.json")
+        paths = collect_scene_paths([pattern, str(CASES / "rect_solid_constraints.scene.json")])
+        self.assertEqual(paths, [str(CASES / "rect_solid_constraints.scene.json")])
+
+    def test_cli_batch_exit_code(self):
+        with tempfile.TemporaryDirectory() as td:
+            cmd = [sys.executable, "-m", "engine.run", "--batch", str(CASES), "--outdir", td, "--jobs", "2"]
+            proc = subprocess.run(cmd, cwd=str(REPO), capture_output=True, text=True)
+            self.assertEqual(proc.returncode, 0, proc.stdout + proc.stderr)
+            self.assertIn("scenes succeeded", proc.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
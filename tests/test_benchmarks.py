@@ -0,0 +1,64 @@
+import unittest
+from pathlib import Path
+
+from benchmarks.convex_clip import measure as measure_convex_clip
+from benchmarks.generate import generate_scene
+from benchmarks.scaling import fit_exponent, run_ladder
+from engine.registry import load_registries
+from engine.run import run_scene
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+class TestSceneGenerator(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+
+    def test_seeded_and_proportional(self):
+        a = generate_scene(100, seed=3)
+        self.assertEqual(a, generate_scene(100, seed=3))
+        self.assertNotEqual(a, generate_scene(100, seed=4))
+
+        ops = [o["op"] for o in a["operators"]]
+        self.assertEqual(ops.count("distribute_evenly_between"), 2)
+        self.assertEqual(ops.count("clip_to_object"), 5)
+        self.assertEqual(ops.count("extend_and_trim_to_object"), 2)
+        members = [o for o in a["objects"] if o["id"].startswith("M")]
+        self.assertEqual(len(members), 100)
+
+    def test_generated_scenes_run(self):
+        for kind in ("internal", "constraints"):
+            scene = generate_scene(60, kind=kind, seed=1)
+            _scad, resolved = run_scene(scene, self.regs)
+            objects = resolved["objects"]
+            # 60 members + octagon + 1 array (2 posts, 10 instances) + 1 trim (member, post)
+            self.assertEqual(len(objects), 60 + 1 + 12 + 2, kind)
+            # Each trim cuts its member at the post.
+            src = objects["TrimSrc0"]
+            post_x = min(p[0] for p in objects["TrimPost0"]["geom"]["footprint"])
+            self.assertAlmostEqual(max(p[0] for p in src["geom"]["footprint"]), post_x, places=6)
+
+
+class TestScalingRunner(unittest.TestCase):
+    def test_fit_exponent(self):
+        self.assertAlmostEqual(fit_exponent([10, 100, 1000], [3.0, 30.0, 300.0]), 1.0)
+        self.assertAlmostEqual(fit_exponent([10, 100, 1000], [1.0, 100.0, 10000.0]), 2.0)
+        self.assertIsNone(fit_exponent([10], [1.0]))
+
+    def test_run_ladder_reports_every_stage(self):
+        result = run_ladder([20, 40], repeat=1)
+        self.assertEqual([r["n"] for r in result["rows"]], [20, 40])
+        self.assertEqual(set(result["exponents"]), {"compile", "build", "emit", "total"})
+        self.assertIsNotNone(result["exponents"]["build"])
+
+
+class TestConvexClipBenchmark(unittest.TestCase):
+    def test_measure_reports_both_kernels(self):
+        m = measure_convex_clip(16, repeat=2)
+        self.assertEqual(m["product"], 256)
+        self.assertGreater(m["sutherland_hodgman_us"], 0)
+        self.assertGreater(m["convex_intersection_us"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from engine.cache import ArtifactCache
+from engine.registry import load_registries
+from engine.run import run_scene
+
+REPO = Path(__file__).resolve().parents[1]
+CASES = REPO / "scene_tests" / "cases"
+
+
+class TestArtifactCache(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._td.name)
+        self.regs = load_registries(REPO)
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def test_key_is_canonical_and_content_addressed(self):
+        cache = ArtifactCache(self.cache_dir)
+        a = {"anchor_id": "r", "objects": [], "operators": []}
+        b = {"operators": [], "objects": [], "anchor_id": "r"}
+        self.assertEqual(cache.key_for(a, self.regs), cache.key_for(b, self.regs))
+        self.assertNotEqual(cache.key_for(a, self.regs), cache.key_for(dict(a, anchor_id="x"), self.regs))
+
+        regs2 = json.loads(json.dumps(self.regs))
+        regs2["lumber_profiles"]["S4S:2x4"]["actual"] = [1.5, 3.6]
+        self.assertNotEqual(cache.key_for(a, self.regs), cache.key_for(a, regs2))
+
+    def test_hit_returns_same_artifacts(self):
+        cache = ArtifactCache(self.cache_dir)
+        scene = json.loads((CASES / "hearth_sleeper_constraints.scene.json").read_text(encoding="utf-8"))
+
+        cold = {}
+        scad1, resolved1 = run_scene(scene, self.regs, cold, cache=cache)
+        warm = {}
+        scad2, resolved2 = run_scene(scene, self.regs, warm, cache=cache)
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIn("build", cold)
+        self.assertIn("cache", warm)
+        self.assertNotIn("build", warm)
+        self.assertEqual(scad1, scad2)
+        self.assertEqual(json.loads(json.dumps(resolved1)), resolved2)
+
+        entry = cache.get(cache.key_for(scene, self.regs))
+        self.assertEqual(set(entry), {"compiled", "resolved", "scad"})
+        self.assertEqual(entry["compiled"]["scene_type"], "internal")
+
+    def test_lru_eviction_respects_size_bound(self):
+        cache = ArtifactCache(self.cache_dir, max_bytes=2500)
+        blob = "x" * 1000
+        cache.put("aa" + "0" * 62, {"scad": blob})
+        time.sleep(0.01)
+        cache.put("bb" + "0" * 62, {"scad": blob})
+        time.sleep(0.01)
+        # Touch the older entry so the other one becomes least-recently-used.
+        self.assertIsNotNone(cache.get("aa" + "0" * 62))
+        time.sleep(0.01)
+        cache.put("cc" + "0" * 62, {"scad": blob})
+
+        self.assertIsNotNone(cache.get("aa" + "0" * 62))
+        self.assertIsNone(cache.get("bb" + "0" * 62))
+        self.assertIsNotNone(cache.get("cc" + "0" * 62))
+
+    def test_single_flight_computes_once(self):
+        cache = ArtifactCache(self.cache_dir)
+        calls = []
+        gate = threading.Event()
+
+        def compute():
+            calls.append(1)
+            gate.wait(1.0)
+            return {"scad": "ok"}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("ab" + "1" * 62, compute)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(hit for _entry, hit in results), [False] + [True] * 7)
+        self.assertTrue(all(entry == {"scad": "ok"} for entry, _hit in results))
+
+    def test_key_locks_do_not_accumulate(self):
+        cache = ArtifactCache(self.cache_dir)
+        cache.get_or_compute("ef" + "3" * 62, lambda: {"scad": "ok"})
+
+        def boom():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_compute("ef" + "4" * 62, boom)
+        # The inner lookup hits: another caller stored the entry after the first check.
+        key = "ef" + "5" * 62
+        real_get = cache.get
+        misses = iter([None])
+        cache.get = lambda k: next(misses, None) or real_get(k)
+        cache.put(key, {"scad": "stored"})
+        self.assertEqual(cache.get_or_compute(key, boom), ({"scad": "stored"}, True))
+        self.assertEqual(cache._key_locks, {})
+
+    def test_waits_for_other_process_lock(self):
+        cache = ArtifactCache(self.cache_dir)
+        key = "cd" + "2" * 62
+        lock_path = cache._entry_path(key).with_suffix(".lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path.write_text(str(os.getpid()))
+
+        def other_process_finishes():
+            time.sleep(0.05)
+            cache.put(key, {"scad": "from-other"})
+            lock_path.unlink()
+
+        t = threading.Thread(target=other_process_finishes)
+        t.start()
+        entry, hit = cache.get_or_compute(key, lambda: {"scad": "recomputed"})
+        t.join()
+        self.assertTrue(hit)
+        self.assertEqual(entry, {"scad": "from-other"})
+
+    def test_unwritable_cache_dir_runs_uncached(self):
+        # A regular file where the cache directory should be: every mkdir fails.
+        blocker = self.cache_dir / "not-a-dir"
+        blocker.write_text("")
+        cache = ArtifactCache(blocker / "cache")
+        scene = json.loads((CASES / "hearth_sleeper_constraints.scene.json").read_text(encoding="utf-8"))
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            scad1, _resolved = run_scene(scene, self.regs, cache=cache)
+            scad2, _resolved = run_scene(scene, self.regs, cache=cache)
+        self.assertEqual(scad1, run_scene(scene, self.regs)[0])
+        self.assertEqual(scad2, scad1)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(stderr.getvalue().count("artifact cache unavailable"), 1)
+        self.assertEqual(cache._key_locks, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
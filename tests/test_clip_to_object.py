@@ -1,4 +1,5 @@
 import json
+import tempfile
 import unittest
 from pathlib import Path
 from engine.scene import build_scene
@@ -24,5 +25,30 @@ class TestClipToObject(unittest.TestCase):
         for x,y in block_fp:
             self.assertTrue(point_in_convex((float(x), float(y)), room_poly))
 
+    def test_target_inside_clipper_is_untouched(self):
+        from engine.operators.clip_to_object import apply
+
+        inner = {"id": "in", "geom": {"kind": "solid", "footprint": [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0]]}}
+        ints = {"id": "ints", "geom": {"kind": "solid", "footprint": [[1, 1], [2, 1], [2, 2]]}}
+        crossing = {"id": "x", "geom": {"kind": "solid", "footprint": [[5, 5], [20, 5], [20, 6]]}}
+        room = {"id": "room", "geom": {"kind": "boundary", "footprint": [[0, 0], [10, 0], [10, 10], [0, 10]]}}
+        objects = {"room": room, "in": inner, "ints": ints, "x": crossing}
+        apply(objects, {}, {"op": "clip_to_object", "clip_object_id": "room", "target_ids": ["in", "ints", "x"]}, None)
+        self.assertIs(objects["in"], inner)
+        self.assertIsNot(objects["x"], crossing)
+        # Clipped footprints are written as floats, including ones the clipper leaves unchanged.
+        self.assertEqual(json.dumps(objects["ints"]["geom"]["footprint"]), "[[1.0, 1.0], [2.0, 1.0], [2.0, 2.0]]")
+
+    def test_example_resolved_json_writes_float_footprints(self):
+        from engine.run import run_file_with_resolved
+
+        with tempfile.TemporaryDirectory() as td:
+            resolved = Path(td) / "scene_example.resolved.json"
+            run_file_with_resolved(REPO / "examples" / "scene_example.json", Path(td) / "out.scad", resolved)
+            written = json.loads(resolved.read_text(encoding="utf-8"), parse_int=lambda s: f"int {s}")
+        block = written["objects"]["block"]
+        self.assertEqual(block["geom"]["footprint"], [[-10.0, -10.0], [10.0, -10.0], [10.0, 10.0], [-10.0, 10.0]])
+        self.assertEqual(block["params"]["footprint"][0], ["int -10", "int -10"])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,40 @@
+import json
+import unittest
+from pathlib import Path
+
+from benchmarks.distribution import distribution_scene
+from benchmarks.generate import generate_scene
+from engine.registry import load_registries
+from engine.scene import build_scene
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+class TestCopyOnWriteScene(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+
+    def test_build_does_not_mutate_input_scene(self):
+        # Clips and trims replace footprints; distribute creates instances from a template.
+        scene = generate_scene(120, seed=5)
+        before = json.dumps(scene)
+        build_scene(scene, self.regs)
+        build_scene(scene, self.regs)
+        self.assertEqual(json.dumps(scene), before)
+
+    def test_instances_share_template_parts(self):
+        scene = distribution_scene(3)
+        template = scene["objects"][2]
+        objects = build_scene(scene, self.regs)["objects"]
+        s1, s2 = objects["S1"], objects["S2"]
+
+        self.assertNotIn("role", s1)
+        self.assertEqual(template["role"], "template")
+        self.assertNotIn("start", template["params"]["placement"])
+        self.assertNotEqual(s1["params"]["placement"]["start"], s2["params"]["placement"]["start"])
+        self.assertIs(s1["params"]["profile"], template["params"]["profile"])
+        self.assertIs(s1["params"]["profile"], s2["params"]["profile"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import importlib.util
+import math
+import os
+import random
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from engine.geom import GeometryBackend, get_backend, prepare_convex_clipper, set_backend
+from engine.registry import load_registries
+from engine.scene import build_scene
+from helpers import random_convex
+
+REPO = Path(__file__).resolve().parents[1]
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+BACKENDS = ["python", "auto"] + (["numpy"] if HAVE_NUMPY else [])
+
+
+def random_polygons(rng, count):
+    polys = []
+    for _ in range(count):
+        poly = random_convex(rng, rng.randint(3, 10), rng.uniform(1, 60), rng.uniform(-80, 80), rng.uniform(-80, 80))
+        if rng.random() < 0.5:
+            poly.reverse()
+        polys.append(poly)
+    # Edge cases: empty, a point, a segment, a vertex on the axes, integer input.
+    polys += [[], [(1.0, 1.0)], [(0.0, 0.0), (5.0, 0.0)], [(0.0, 0.0), (40.0, 0.0), (40.0, 40.0)], [(0, 0), (7, 0), (7, 3)]]
+    return polys
+
+
+class TestBackendConformance(unittest.TestCase):
+    """Every backend returns exactly what the pure-Python one does, on the same random inputs."""
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.polys = random_polygons(rng, 300)
+        self.clippers = [random_convex(rng, 8, 70, 0, 0), [(0.0, 0.0), (50.0, 0.0), (50.0, 30.0), (0.0, 30.0)]]
+        self.halfplanes = [((rng.uniform(-50, 50), rng.uniform(-50, 50)),
+                            (math.cos(a), math.sin(a))) for a in (rng.uniform(0, 2 * math.pi) for _ in range(6))]
+        self.halfplanes += [((0.0, 0.0), (1.0, 0.0)), ((40.0, 0.0), (0.0, 1.0))]
+        self.points = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(800)] + [(0.0, 0.0), (50.0, 30.0)]
+        self.origins = [p for p in self.points[:400]]
+        self.directions = [(math.cos(a), math.sin(a)) for a in (rng.uniform(0, 2 * math.pi) for _ in range(400))]
+        self.reference = GeometryBackend("python")
+
+    def _check(self, call):
+        expected = call(self.reference)
+        for name in BACKENDS:
+            with self.subTest(backend=name):
+                self.assertEqual(call(GeometryBackend(name)), expected)
+
+    def test_clip(self):
+        for clipper in self.clippers:
+            prepared = prepare_convex_clipper(clipper)
+            self._check(lambda geo: geo.clip(self.polys, prepared))
+
+    def test_clip_halfplane(self):
+        for p0, n in self.halfplanes:
+            for keep_leq in (True, False):
+                self._check(lambda geo: geo.clip_halfplane(self.polys, p0, n, keep_leq))
+
+    def test_ray_hits(self):
+        self._check(lambda geo: geo.ray_hits(self.origins, self.directions, self.polys[:20]))
+        self._check(lambda geo: geo.ray_hits(self.origins, self.directions, self.clippers[:1]))
+
+    def test_points_in_convex(self):
+        for poly in self.clippers + self.polys[:5] + [[]]:
+            self._check(lambda geo: geo.points_in_convex(self.points, poly))
+
+    def test_areas_and_bboxes(self):
+        self._check(lambda geo: geo.areas(self.polys))
+        self._check(lambda geo: geo.bboxes(self.polys))
+        self._check(lambda geo: geo.areas([]))
+        self._check(lambda geo: geo.bboxes([[], []]))
+
+
+class TestBackendSelection(unittest.TestCase):
+    def tearDown(self):
+        set_backend(None)
+
+    def test_environment_and_api(self):
+        with mock.patch.dict(os.environ, {"AICADDIE_GEOM_BACKEND": "python"}):
+            set_backend(None)
+            self.assertEqual(get_backend().name, "python")
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("AICADDIE_GEOM_BACKEND", None)
+            set_backend(None)
+            self.assertEqual(get_backend().name, "auto")
+            self.assertEqual(set_backend("python").name, "python")
+            self.assertIs(get_backend(), get_backend())
+        with self.assertRaisesRegex(ValueError, "Unknown geometry backend"):
+            set_backend("gpu")
+
+    @unittest.skipIf(HAVE_NUMPY, "NumPy installed")
+    def test_numpy_backend_needs_numpy(self):
+        with self.assertRaisesRegex(ValueError, "NumPy is not installed"):
+            set_backend("numpy")
+
+    def test_feature_ray_hits_go_through_backend(self):
+        from engine.features import ray_polygon_first_hit
+
+        geo = set_backend("python")
+        with mock.patch.object(geo, "ray_hits", wraps=geo.ray_hits) as ray_hits:
+            hit = ray_polygon_first_hit((0.0, 0.0), (1.0, 0.0), [(5, -1), (6, -1), (6, 1), (5, 1)])
+        self.assertEqual(hit, (5.0, 0.0))
+        ray_hits.assert_called_once()
+
+    def test_scene_output_does_not_depend_on_backend(self):
+        from benchmarks.generate import generate_scene
+
+        regs = load_registries(REPO)
+        scene = generate_scene(80, seed=2)
+        results = []
+        for name in BACKENDS:
+            set_backend(name)
+            results.append(build_scene(scene, regs))
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
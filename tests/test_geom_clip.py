@@ -0,0 +1,184 @@
+import importlib.util
+import math
+import random
+import unittest
+
+from engine.geom import (
+    CONVEX_KERNEL_MIN_PRODUCT,
+    _inside,
+    _line_intersection,
+    classify_against_clipper,
+    clip_convex,
+    clip_convex_many,
+    convex_intersection,
+    counting,
+    is_ccw,
+    prepare_convex_clipper,
+)
+from helpers import octagon, random_convex
+
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def reference_clip(subject, clipper):
+    """clip_convex as written before clippers were prepared."""
+    keep_left = is_ccw(clipper)
+    out = list(subject)
+    m = len(clipper)
+    for i in range(m):
+        a, b = clipper[i], clipper[(i + 1) % m]
+        if not out:
+            return []
+        inp, out = out, []
+        prev = inp[-1]
+        prev_in = _inside(prev, a, b, keep_left)
+        for cur in inp:
+            cur_in = _inside(cur, a, b, keep_left)
+            if cur_in != prev_in:
+                out.append(_line_intersection(prev, cur, a, b))
+            if cur_in:
+                out.append(cur)
+            prev, prev_in = cur, cur_in
+    return out
+
+
+def random_subjects(n, seed=0):
+    rng = random.Random(seed)
+    subjects = []
+    for _ in range(n):
+        x, y, a, length = rng.uniform(-100, 100), rng.uniform(-100, 100), rng.uniform(0, 6.3), rng.uniform(20, 120)
+        ux, uy = math.cos(a), math.sin(a)
+        vx, vy = -uy * 1.75, ux * 1.75
+        subjects.append([(x + vx, y + vy), (x - vx, y - vy), (x - vx + length * ux, y - vy + length * uy),
+                         (x + vx + length * ux, y + vy + length * uy)])
+    # Edge cases: fully outside, a vertex on the boundary, a sliver, empty.
+    subjects += [[(200, 200), (210, 200), (210, 210)], [(83.5, 0), (90, 0), (90, 5)], [(0, 0), (1, 1e-12), (2, 0)], []]
+    return subjects
+
+
+def assert_same_polygon(test, got, expected, tol=1e-6):
+    """Equal up to the starting vertex, coordinates within `tol`."""
+    test.assertEqual(len(got), len(expected))
+    if not expected:
+        return
+    for k in range(len(got)):
+        if all(math.dist(got[(i + k) % len(got)], p) <= tol for i, p in enumerate(expected)):
+            return
+    test.fail(f"{got} is not a rotation of {expected}")
+
+
+class TestConvexIntersection(unittest.TestCase):
+    def test_matches_sutherland_hodgman(self):
+        rng = random.Random(5)
+        for trial in range(400):
+            subject = random_convex(rng, rng.randint(3, 40), rng.uniform(1, 50), rng.uniform(-40, 40), rng.uniform(-40, 40))
+            clipper = random_convex(rng, rng.randint(3, 40), rng.uniform(1, 50), rng.uniform(-40, 40), rng.uniform(-40, 40))
+            if trial % 2:
+                subject.reverse()
+            if trial % 3 == 0:
+                clipper.reverse()
+            got = convex_intersection(subject, clipper)
+            self.assertIsNotNone(got)
+            expected = reference_clip(subject, clipper)
+            assert_same_polygon(self, got, expected)
+            if got:
+                self.assertEqual(is_ccw(got), is_ccw(subject))
+
+    def test_containment_and_disjoint(self):
+        big, small = octagon(), octagon(10)
+        self.assertEqual(convex_intersection(small, big), small)
+        self.assertEqual(convex_intersection(big, small), small)
+        self.assertEqual(convex_intersection(list(reversed(big)), small), list(reversed(small)))
+        far = [(x + 500, y) for x, y in small]
+        self.assertEqual(convex_intersection(far, big), [])
+
+    def test_touching_contacts_are_left_to_sutherland_hodgman(self):
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        self.assertIsNone(convex_intersection(square, square))
+        self.assertIsNone(convex_intersection([(10, 0), (20, 0), (20, 10), (10, 10)], square))
+        self.assertIsNone(convex_intersection([(5, 5), (15, -5), (15, 15)], [(5, -20), (30, -20), (30, 20), (5, 20)]))
+
+    def test_clip_convex_uses_kernel_for_large_convex_subjects(self):
+        rng = random.Random(6)
+        clipper = random_convex(rng, 24, 40, 0, 0)
+        for _ in range(50):
+            subject = random_convex(rng, 24, 40, rng.uniform(-30, 30), rng.uniform(-30, 30))
+            self.assertGreaterEqual(len(subject) * len(clipper), CONVEX_KERNEL_MIN_PRODUCT)
+            got = clip_convex(subject, clipper)
+            self.assertEqual(got, convex_intersection(subject, clipper))
+            assert_same_polygon(self, got, reference_clip(subject, clipper))
+            self.assertEqual(clip_convex_many([subject], prepare_convex_clipper(clipper), use_numpy=False), [got])
+        # Shared edges fall back to Sutherland-Hodgman.
+        self.assertEqual(clip_convex(clipper, clipper), reference_clip(clipper, clipper))
+
+
+class TestPreparedClip(unittest.TestCase):
+    def test_matches_unprepared_algorithm(self):
+        for clipper in (octagon(), list(reversed(octagon())), [(0, 0), (50, 0), (50, 30), (0, 30)]):
+            for subject in random_subjects(200):
+                self.assertEqual(clip_convex(subject, clipper), reference_clip(subject, clipper))
+
+    def test_many_matches_one_at_a_time(self):
+        subjects = random_subjects(300, seed=1)
+        prepared = prepare_convex_clipper(octagon())
+        expected = [clip_convex(s, octagon()) for s in subjects]
+        self.assertEqual(clip_convex_many(subjects, prepared, use_numpy=False), expected)
+
+    def test_prefilter_matches_clipping(self):
+        # Subjects hugging the clipper: just inside, on and just outside its bbox and edges.
+        rng = random.Random(3)
+        clippers = (octagon(), [(0, 0), (50, 0), (50, 30), (0, 30)], [(0, 0), (40, 3), (7, 25)])
+        for clipper in clippers:
+            prepared = prepare_convex_clipper(clipper)
+            subjects = random_subjects(100, seed=4)
+            for x, y in clipper:
+                for d in (-1e-7, 0.0, 1e-7, 0.5, -0.5):
+                    subjects.append([(x + d, y + d), (x + d + 1e-3, y + d), (x + d, y + d + 1e-3)])
+                    subjects.append([(x * (1 + d), y * (1 + d)), (x * 0.5, y * 0.5), (x * 0.5 + d, y * 0.6)])
+            for _ in range(200):
+                cx, cy = rng.choice(clipper)
+                subjects.append([(cx + rng.uniform(-2, 2), cy + rng.uniform(-2, 2)) for _ in range(4)])
+            expected = [reference_clip(s, clipper) if s else [] for s in subjects]
+            self.assertEqual(clip_convex_many(subjects, prepared, use_numpy=False), expected)
+            for s, exp in zip(subjects, expected):
+                where = classify_against_clipper(s, prepared)
+                if where > 0:
+                    self.assertEqual(exp, list(s))
+                elif where < 0:
+                    self.assertEqual(exp, [])
+
+    def test_counts_paths(self):
+        prepared = prepare_convex_clipper(octagon())
+        inside = [(0, 0), (10, 0), (10, 10)]
+        outside = [(200, 200), (210, 200), (210, 210)]
+        straddling = [(80, 0), (100, 0), (100, 10)]
+        with counting() as counts:
+            clip_convex_many([inside, outside, straddling, inside], prepared, use_numpy=False)
+            with counting() as inner:
+                clip_convex_many([inside], prepared, use_numpy=False)
+        clip_convex_many([inside], prepared, use_numpy=False)
+        self.assertEqual(counts["clip_paths"], {"inside": 2, "outside": 1, "clipped": 1})
+        self.assertEqual(inner["clip_paths"], {"inside": 1, "outside": 0, "clipped": 0})
+
+    def test_non_convex_clipper_rejected(self):
+        with self.assertRaisesRegex(ValueError, "clipper polygon must be convex"):
+            prepare_convex_clipper([(0, 0), (4, 0), (1, 1), (0, 4)])
+
+    @unittest.skipUnless(HAVE_NUMPY, "NumPy not installed")
+    def test_numpy_path_is_bit_identical(self):
+        for clipper in (octagon(), list(reversed(octagon()))):
+            prepared = prepare_convex_clipper(clipper)
+            subjects = random_subjects(500, seed=2)
+            self.assertEqual(
+                clip_convex_many(subjects, prepared, use_numpy=True),
+                clip_convex_many(subjects, prepared, use_numpy=False),
+            )
+
+    @unittest.skipIf(HAVE_NUMPY, "NumPy installed")
+    def test_forcing_numpy_without_numpy_fails(self):
+        with self.assertRaisesRegex(ValueError, "NumPy is not installed"):
+            clip_convex_many(random_subjects(2), prepare_convex_clipper(octagon()), use_numpy=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import importlib.util
+import math
+import random
+import unittest
+
+from engine.geom import cast_rays, first_ray_polygon_hit
+from helpers import octagon
+
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def random_rays(n, seed=0):
+    rng = random.Random(seed)
+    origins, directions = [], []
+    for _ in range(n):
+        a = rng.uniform(0, 2 * math.pi)
+        origins.append((rng.uniform(-150, 150), rng.uniform(-150, 150)))
+        directions.append((math.cos(a), math.sin(a)))
+    # Axis-aligned rays: through a vertex, along an edge, from a vertex outward.
+    origins += [(0.0, 0.0), (-200.0, 0.0), (83.5, -200.0), (83.5, 0.0)]
+    directions += [(1.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 0.0)]
+    return origins, directions
+
+
+class TestCastRays(unittest.TestCase):
+    def setUp(self):
+        self.square = [(-40.0, -40.0), (40.0, -40.0), (40.0, 40.0), (-40.0, 40.0)]
+        self.origins, self.directions = random_rays(300)
+
+    def test_single_polygon_matches_first_ray_polygon_hit(self):
+        for poly in (octagon(), self.square):
+            hits = cast_rays(self.origins, self.directions, [poly], use_numpy=False)
+            for o, d, hit in zip(self.origins, self.directions, hits):
+                found, t, p = first_ray_polygon_hit(o, d, poly)
+                if not found:
+                    self.assertIsNone(hit)
+                    continue
+                self.assertEqual(hit[:2], (t, p))
+                self.assertEqual(hit[2], 0)
+                i = hit[3]
+                a, b = poly[i], poly[(i + 1) % len(poly)]
+                self.assertTrue(first_ray_polygon_hit(o, d, [a, b])[0])
+
+    def test_nearest_polygon_wins(self):
+        polys = [octagon(), self.square, [], octagon(10, 60, 60)]
+        hits = cast_rays(self.origins, self.directions, polys, use_numpy=False)
+        for o, d, hit in zip(self.origins, self.directions, hits):
+            best = None
+            for pi, poly in enumerate(polys):
+                found, t, p = first_ray_polygon_hit(o, d, poly)
+                if found and (best is None or t < best[0]):
+                    best = (t, p, pi)
+            self.assertEqual(hit and hit[:3], best)
+
+    def test_empty_inputs(self):
+        self.assertEqual(cast_rays([], [], [self.square]), [])
+        self.assertEqual(cast_rays([(0, 0)], [(1, 0)], [[], [(1, 1)]]), [None])
+        with self.assertRaises(ValueError):
+            cast_rays([(0, 0)], [], [self.square])
+
+    @unittest.skipUnless(HAVE_NUMPY, "NumPy not installed")
+    def test_numpy_path_is_bit_identical(self):
+        polys = [octagon(), self.square, octagon(10, 60, 60)]
+        self.assertEqual(
+            cast_rays(self.origins, self.directions, polys, use_numpy=True),
+            cast_rays(self.origins, self.directions, polys, use_numpy=False),
+        )
+
+    @unittest.skipIf(HAVE_NUMPY, "NumPy installed")
+    def test_forcing_numpy_without_numpy_fails(self):
+        with self.assertRaises(ValueError):
+            cast_rays(self.origins, self.directions, [self.square], use_numpy=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import contextlib
+import io
+import json
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from benchmarks.distribution import distribution_scene
+from engine.cache import ArtifactCache
+from engine.instances import LazyObjects
+from engine.registry import load_registries
+from engine.run import main as run_main, plain_resolved, run_file, run_file_with_resolved, run_scene
+from engine.scad import emit_scad
+from engine.scene import build_scene
+from helpers import post
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+class TestLazyInstances(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+        self.scene = {
+            "anchor_id": "A",
+            "objects": [
+                post("A", 0), post("B", 100), post("Cut", 30),
+                {"id": "T", "role": "template", "prototype": "dim_lumber_member",
+                 "params": {"profile": {"id": "2x4"}, "placement": {"direction": "north", "length": 10}}},
+            ],
+            "operators": [
+                {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["A", "B"],
+                 "count": 9, "id_prefix": "S"},
+                {"op": "clip_to_object", "clip_object_id": "A", "target_ids": ["S2"]},
+                {"op": "extend_and_trim_to_object", "source_object_id": "S3", "target_object_id": "Cut",
+                 "source_edge": [0, 1], "direction": [0, 1]},
+                {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["S4", "B"],
+                 "count": 3, "id_prefix": "R"},
+            ],
+        }
+
+    def _assert_same(self, scene):
+        eager = build_scene(scene, self.regs)
+        lazy = build_scene(scene, self.regs, lazy_arrays=True)
+        self.assertIsInstance(lazy["objects"], LazyObjects)
+        self.assertEqual(list(lazy["objects"]), list(eager["objects"]))
+        self.assertEqual(len(lazy["objects"]), len(eager["objects"]))
+        self.assertEqual(json.dumps(dict(lazy["objects"])), json.dumps(eager["objects"]))
+        self.assertEqual(emit_scad(lazy), emit_scad(eager))
+        return lazy["objects"]
+
+    def test_matches_eager_build(self):
+        objects = self._assert_same(self.scene)
+        self.assertIn("S2", objects._objects)          # replaced by the clip
+        self.assertNotIn("S5", objects._objects)       # never materialized
+        self.assertEqual(len(objects._arrays), 2)
+
+    def test_colliding_ids_fall_back_to_eager(self):
+        scene = json.loads(json.dumps(self.scene))
+        scene["operators"][3]["id_prefix"] = "S"       # re-creates S1..S3 in place
+        objects = self._assert_same(scene)
+        self.assertEqual(len(objects._arrays), 1)
+
+    def test_mapping_edits(self):
+        objects = build_scene(self.scene, self.regs, lazy_arrays=True)["objects"]
+        order = list(objects)
+        self.assertIn("S9", objects)
+        self.assertNotIn("S10", objects)
+        self.assertNotIn("S01", objects)
+        objects["S5"] = {"id": "S5", "geom": {}}
+        self.assertEqual(list(objects), order)
+        del objects["S6"]
+        self.assertNotIn("S6", objects)
+        self.assertEqual(list(objects), [oid for oid in order if oid != "S6"])
+        objects["S6"] = {"id": "S6", "geom": {}}
+        self.assertEqual(list(objects)[-1], "S6")
+        self.assertEqual(len(objects), len(order))
+        with self.assertRaises(KeyError):
+            objects["nope"]
+
+    def test_large_array_memory_stays_flat(self):
+        scene = distribution_scene(10000)
+        build_scene(scene, self.regs, lazy_arrays=True)  # warm caches
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            resolved = build_scene(scene, self.regs, lazy_arrays=True)
+            retained = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(resolved["objects"]), 10002)
+        self.assertLess(retained, 64 * 1024)
+
+
+class TestRunLazyArrays(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+        self.td = tempfile.TemporaryDirectory()
+        self.addCleanup(self.td.cleanup)
+        self.tmp = Path(self.td.name)
+        self.scene_path = self.tmp / "dist.json"
+        self.scene_path.write_text(json.dumps(distribution_scene(50)), encoding="utf-8")
+
+    def test_run_scene_option(self):
+        scene = distribution_scene(50)
+        scad, resolved = run_scene(scene, self.regs)
+        lazy_scad, lazy = run_scene(scene, self.regs, lazy_arrays=True)
+        self.assertIsInstance(lazy["objects"], LazyObjects)
+        self.assertEqual(lazy_scad, scad)
+        self.assertEqual(json.dumps(plain_resolved(lazy)), json.dumps(resolved))
+
+        cache = ArtifactCache(self.tmp / "cache")
+        self.assertNotEqual(cache.key_for(scene, self.regs, {"lazy_arrays": True}), cache.key_for(scene, self.regs))
+        self.assertEqual(cache.key_for(scene, self.regs, {"lazy_arrays": False}), cache.key_for(scene, self.regs))
+        for _ in range(2):  # miss, then hit
+            cached_scad, cached = run_scene(scene, self.regs, cache=cache, lazy_arrays=True)
+            self.assertEqual(cached_scad, scad)
+            self.assertEqual(cached, resolved)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_resolved_json_is_materialized(self):
+        for lazy in (False, True):
+            run_file_with_resolved(self.scene_path, self.tmp / f"{lazy}.scad", self.tmp / f"{lazy}.json",
+                                   registries=self.regs, lazy_arrays=lazy)
+        self.assertEqual((self.tmp / "True.json").read_text(), (self.tmp / "False.json").read_text())
+        self.assertEqual((self.tmp / "True.scad").read_text(), (self.tmp / "False.scad").read_text())
+
+    def test_cli_flag(self):
+        out = self.tmp / "out.scad"
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_main([str(self.scene_path), str(out), "--lazy-arrays", "--no-cache"])
+        run_file(self.scene_path, self.tmp / "eager.scad")
+        self.assertEqual(out.read_text(), (self.tmp / "eager.scad").read_text())
+        with contextlib.redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit):
+            run_main(["--batch", str(self.scene_path), "--outdir", str(self.tmp), "--lazy-arrays"])
+        self.assertIn("--lazy-arrays", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
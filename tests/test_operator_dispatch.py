@@ -0,0 +1,72 @@
+import copy
+import json
+import unittest
+from pathlib import Path
+
+from engine.registry import load_registries
+from engine.scene import build_scene
+from helpers import post
+
+REPO = Path(__file__).resolve().parents[1]
+CALLS = []
+
+
+def recording_handler(objects, templates, op, resolve_fn):
+    CALLS.append(op["op"])
+    return objects
+
+
+class TestOperatorDispatch(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+        self.scene = {
+            "anchor_id": "A",
+            "objects": [
+                post("A", 0), post("B", 100),
+                {"id": "T", "role": "template", "prototype": "dim_lumber_member",
+                 "params": {"profile": {"actual": [1.5, 3.5]}, "placement": {"direction": "north", "length": 10}}},
+            ],
+            "operators": [
+                {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["A", "B"],
+                 "count": 2, "id_prefix": "S"},
+                {"op": "clip_to_object", "clip_object_id": "A", "target_ids": ["S2"]},
+            ],
+        }
+
+    def test_handlers_come_from_registry(self):
+        regs = copy.deepcopy(self.regs)
+        for name in regs["operators"]:
+            regs["operators"][name]["handler"] = f"{__name__}.recording_handler"
+        CALLS.clear()
+        build_scene(self.scene, regs)
+        self.assertEqual(CALLS, ["distribute_evenly_between", "clip_to_object"])
+
+    def test_ids_created_by_earlier_operators_validate(self):
+        built = build_scene(self.scene, self.regs)
+        self.assertEqual(sorted(built["objects"]), ["A", "B", "S1", "S2"])
+
+    def test_dangling_reference_fails_before_any_operator_runs(self):
+        scene = json.loads(json.dumps(self.scene))
+        scene["operators"][1]["target_ids"] = ["S3"]
+        regs = copy.deepcopy(self.regs)
+        regs["operators"]["distribute_evenly_between"]["handler"] = f"{__name__}.recording_handler"
+        CALLS.clear()
+        with self.assertRaisesRegex(ValueError, "^target_id not found: S3$"):
+            build_scene(scene, regs)
+        self.assertEqual(CALLS, [])
+
+    def test_only_used_operators_are_bound(self):
+        regs = copy.deepcopy(self.regs)
+        # Importing this handler would fail; the scene does not use the operator.
+        regs["operators"]["extend_and_trim_to_object"]["handler"] = "engine.operators.no_such_module.apply"
+        built = build_scene(self.scene, regs)
+        self.assertEqual(sorted(built["objects"]), ["A", "B", "S1", "S2"])
+
+    def test_unknown_operator(self):
+        scene = dict(self.scene, operators=[{"op": "explode"}])
+        with self.assertRaisesRegex(ValueError, "^Unknown operator: explode$"):
+            build_scene(scene, self.regs)
+
+
+if __name__ == "__main__":
+    unittest.main()
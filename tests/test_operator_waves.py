@@ -0,0 +1,162 @@
+import contextlib
+import copy
+import json
+import multiprocessing
+import os
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from benchmarks.generate import generate_scene
+from engine import scene as scene_mod
+# access/validate next to the handlers below, so they are planned like the real clip_to_object.
+from engine.operators.clip_to_object import access, validate  # noqa: F401
+from engine.registry import load_registries
+from engine.scene import _operator_dispatch, build_scene, operator_serial, plan_operator_waves
+from helpers import post
+
+REPO = Path(__file__).resolve().parents[1]
+HAVE_FORK = "fork" in multiprocessing.get_all_start_methods()
+
+
+def opaque_handler(objects, templates, op, resolve_fn):
+    return objects
+
+
+def pid_handler(objects, templates, op, resolve_fn):
+    for tid in op["target_ids"]:
+        objects[tid] = dict(objects[tid], pid=os.getpid())
+    return objects
+
+
+def failing_handler(objects, templates, op, resolve_fn):
+    if op["fail"]:
+        if op["target_ids"] == ["West"]:
+            time.sleep(0.05)  # fails after the later operator does
+        raise ValueError(f"failed: {op['target_ids'][0]}")
+    return objects
+
+
+def forced_parallel():
+    """Send every wave of 2+ operators to 3 forked workers, whatever the machine."""
+    patches = [
+        mock.patch.object(scene_mod, "PARALLEL_MIN_OPERATORS", 2),
+        mock.patch.object(scene_mod, "PARALLEL_MIN_OBJECTS", 1),
+        mock.patch.object(scene_mod, "_wave_workers", lambda: 3),
+        mock.patch.dict(os.environ, {"AICADDIE_OPERATOR_SERIAL": ""}),
+    ]
+    stack = contextlib.ExitStack()
+    for patch in patches:
+        stack.enter_context(patch)
+    return stack
+
+
+def _member(obj_id, x, y):
+    return {"id": obj_id, "prototype": "dim_lumber_member",
+            "params": {"profile": {"id": "2x4"},
+                       "placement": {"start": [x, y], "direction": "east", "length": 40}}}
+
+
+class TestOperatorWaves(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+        self.dispatch = _operator_dispatch(self.regs)
+        self.scene = {
+            "anchor_id": "A",
+            "objects": [
+                post("A", 0), post("B", 100), post("C", 20), post("D", 200),
+                _member("East", 0, 50), _member("West", -60, 50),
+                {"id": "T", "role": "template", "prototype": "dim_lumber_member",
+                 "params": {"profile": {"id": "2x4"}, "placement": {"direction": "north", "length": 10}}},
+            ],
+            "operators": [
+                {"op": "clip_to_object", "clip_object_id": "B", "target_ids": ["East"]},
+                {"op": "extend_and_trim_to_object", "source_object_id": "West", "target_object_id": "C",
+                 "source_edge": [0, 1], "direction": [1, 0]},
+                {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["A", "B"],
+                 "count": 3, "id_prefix": "S"},
+                {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["C", "D"],
+                 "count": 3, "id_prefix": "R"},
+                {"op": "clip_to_object", "clip_object_id": "A", "target_ids": ["S2", "R1"]},
+            ],
+        }
+
+    def test_independent_operators_share_a_wave(self):
+        waves = plan_operator_waves(self.scene["operators"], self.dispatch)
+        self.assertEqual(waves, [[0, 1, 2, 3], [4]])
+
+    def test_read_after_write_and_write_after_read_are_ordered(self):
+        ops = [
+            {"op": "clip_to_object", "clip_object_id": "A", "target_ids": ["East"]},
+            {"op": "clip_to_object", "clip_object_id": "East", "target_ids": ["West"]},  # reads East
+            {"op": "clip_to_object", "clip_object_id": "B", "target_ids": ["East"]},    # rewrites East
+        ]
+        self.assertEqual(plan_operator_waves(ops, self.dispatch), [[0], [1], [2]])
+
+    def test_operator_without_access_is_a_barrier(self):
+        dispatch = dict(self.dispatch)
+        dispatch["opaque"] = (opaque_handler, None, None)
+        ops = list(self.scene["operators"][:2]) + [{"op": "opaque"}] + list(self.scene["operators"][2:4])
+        self.assertEqual(plan_operator_waves(ops, dispatch), [[0, 1], [2], [3, 4]])
+
+    def test_waves_out_of_list_order_keep_serial_object_order(self):
+        ops = [
+            {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["A", "B"],
+             "count": 3, "id_prefix": "S"},
+            {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["S1", "S3"],
+             "count": 2, "id_prefix": "Q"},
+            {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["C", "D"],
+             "count": 2, "id_prefix": "R"},
+            {"op": "clip_to_object", "clip_object_id": "A", "target_ids": ["East"]},
+        ]
+        scene = dict(self.scene, operators=ops)
+        self.assertEqual(plan_operator_waves(ops, self.dispatch), [[0, 2, 3], [1]])
+        serial = build_scene(scene, self.regs, serial=True)
+        self.assertEqual(list(serial["objects"])[-7:], ["S1", "S2", "S3", "Q1", "Q2", "R1", "R2"])
+        builds = [build_scene(scene, self.regs)]
+        if HAVE_FORK:
+            with forced_parallel():
+                builds.append(build_scene(scene, self.regs))
+        for built in builds:
+            self.assertEqual(json.dumps(built), json.dumps(serial))
+
+    @unittest.skipUnless(HAVE_FORK, "parallel waves need fork")
+    def test_parallel_matches_serial(self):
+        for scene in (self.scene, generate_scene(300, seed=3)):
+            for simplify in (False, True):
+                serial = build_scene(scene, self.regs, simplify=simplify, serial=True)
+                with forced_parallel():
+                    parallel = build_scene(scene, self.regs, simplify=simplify)
+                self.assertEqual(list(parallel["objects"]), list(serial["objects"]))
+                self.assertEqual(json.dumps(parallel), json.dumps(serial))
+
+    @unittest.skipUnless(HAVE_FORK, "parallel waves need fork")
+    def test_waves_run_in_worker_processes_unless_serial(self):
+        regs = copy.deepcopy(self.regs)
+        regs["operators"]["clip_to_object"]["handler"] = f"{__name__}.pid_handler"
+        ops = [{"op": "clip_to_object", "clip_object_id": "A", "target_ids": [t]} for t in ("East", "West", "C", "D")]
+        scene = dict(self.scene, operators=ops)
+        with forced_parallel():
+            parallel = build_scene(scene, regs)["objects"]
+            serial = build_scene(scene, regs, serial=True)["objects"]
+            with mock.patch.dict(os.environ, {"AICADDIE_OPERATOR_SERIAL": "1"}):
+                self.assertTrue(operator_serial())
+                from_env = build_scene(scene, regs)["objects"]
+        self.assertNotIn(os.getpid(), {parallel[t]["pid"] for t in ("East", "West", "C", "D")})
+        self.assertEqual({serial[t]["pid"] for t in ("East", "West", "C", "D")}, {os.getpid()})
+        self.assertEqual({from_env[t]["pid"] for t in ("East", "West", "C", "D")}, {os.getpid()})
+
+    @unittest.skipUnless(HAVE_FORK, "parallel waves need fork")
+    def test_parallel_raises_first_failure_in_operator_order(self):
+        regs = copy.deepcopy(self.regs)
+        regs["operators"]["clip_to_object"]["handler"] = f"{__name__}.failing_handler"
+        ops = [{"op": "clip_to_object", "clip_object_id": "A", "target_ids": [t], "fail": fail}
+               for t, fail in (("East", False), ("West", True), ("C", False), ("D", True))]
+        self.assertEqual(plan_operator_waves(ops, _operator_dispatch(regs)), [[0, 1, 2, 3]])
+        with forced_parallel(), self.assertRaisesRegex(ValueError, "^failed: West$"):
+            build_scene(dict(self.scene, operators=ops), regs)
+
+
+if __name__ == "__main__":
+    unittest.main()
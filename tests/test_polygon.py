@@ -0,0 +1,108 @@
+import math
+import random
+import unittest
+
+from engine.features import _bbox, resolve_feature_segment
+from engine.geom import (
+    Polygon,
+    _is_convex_polygon,
+    cast_rays,
+    clip_convex,
+    convex_intersection,
+    is_ccw,
+    point_in_convex,
+    prepare_convex_clipper,
+    signed_area,
+)
+from helpers import octagon
+
+
+class TestPolygon(unittest.TestCase):
+    def setUp(self):
+        self.pts = [(0.0, 0.0), (4.0, 0.0), (4.0, 3.0), (0.0, 3.0)]
+
+    def test_sequence_of_points(self):
+        poly = Polygon(self.pts)
+        self.assertEqual(len(poly), 4)
+        self.assertEqual(list(poly), self.pts)
+        self.assertEqual(poly[-1], (0.0, 3.0))
+        self.assertEqual(list(poly[::-1]), self.pts[::-1])
+        self.assertIsInstance(poly[1:3], Polygon)
+        with self.assertRaises(IndexError):
+            poly[4]
+        self.assertEqual(Polygon([[1, 2], [3, 4]])[1], (3.0, 4.0))
+        self.assertEqual(Polygon(self.pts), poly)
+        self.assertEqual(len(Polygon()), 0)
+
+    def test_derived_values_match_list_functions(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            pts = [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(rng.randint(3, 12))]
+            poly = Polygon(pts)
+            self.assertEqual(poly.area, signed_area(pts))
+            self.assertEqual(signed_area(poly), signed_area(pts))
+            self.assertEqual(is_ccw(poly), is_ccw(pts))
+            self.assertEqual(_is_convex_polygon(poly), _is_convex_polygon(pts))
+            self.assertEqual(_bbox(poly), _bbox(pts))
+
+    def test_normals_point_outward(self):
+        for pts in (self.pts, self.pts[::-1]):
+            normals = Polygon(pts).normals
+            self.assertEqual(len(normals), 4)
+            cx, cy = 2.0, 1.5
+            for (x, y), (nx, ny) in zip(pts, normals):
+                self.assertAlmostEqual(math.hypot(nx, ny), 1.0)
+                self.assertGreater((x - cx) * nx + (y - cy) * ny, 0.0)
+        self.assertEqual(Polygon([(0, 0), (0, 0), (1, 0), (0, 1)]).normals[0], (0.0, 0.0))
+
+    def test_values_are_cached_until_mutated(self):
+        poly = Polygon(self.pts)
+        self.assertIs(poly.bbox, poly.bbox)
+        self.assertIs(poly.normals, poly.normals)
+        self.assertTrue(poly.is_convex)
+
+        poly[2] = (4.0, 5.0)
+        self.assertEqual(poly.bbox, (0.0, 0.0, 4.0, 5.0))
+        self.assertEqual(poly.area, signed_area(list(poly)))
+
+        poly.append((-1.0, 1.0))
+        self.assertEqual(poly.bbox[0], -1.0)
+        poly.insert(1, (2.0, 1.0))  # a reflex vertex
+        self.assertFalse(poly.is_convex)
+        del poly[1]
+        self.assertTrue(poly.is_convex)
+
+        area = poly.area
+        poly.reverse()
+        self.assertEqual(poly.area, signed_area(list(poly)))
+        self.assertAlmostEqual(poly.area, -area)
+        self.assertFalse(poly.is_ccw)
+
+        poly.extend([(10.0, 10.0)])
+        self.assertEqual(poly.bbox[2:], (10.0, 10.0))
+
+    def test_prepared_clipper_is_cached(self):
+        poly = Polygon(self.pts)
+        prepared = prepare_convex_clipper(poly)
+        self.assertEqual(prepared, prepare_convex_clipper(self.pts))
+        self.assertIs(prepare_convex_clipper(poly), prepared)
+        poly.insert(1, (2.0, 1.0))  # a reflex vertex
+        with self.assertRaisesRegex(ValueError, "must be convex"):
+            prepare_convex_clipper(poly)
+
+    def test_geom_and_features_accept_polygon(self):
+        clipper = octagon()
+        poly_clipper = Polygon(clipper)
+        subject = [(70.0, -10.0), (100.0, -10.0), (100.0, 10.0), (70.0, 10.0)]
+        self.assertEqual(clip_convex(Polygon(subject), poly_clipper), clip_convex(subject, clipper))
+        self.assertEqual(prepare_convex_clipper(poly_clipper), prepare_convex_clipper(clipper))
+        self.assertEqual(convex_intersection(Polygon(subject), poly_clipper), convex_intersection(subject, clipper))
+        self.assertEqual(point_in_convex((0.0, 0.0), poly_clipper), True)
+        self.assertEqual(cast_rays([(0.0, 0.0)], [(1.0, 0.0)], [poly_clipper]), cast_rays([(0.0, 0.0)], [(1.0, 0.0)], [clipper]))
+
+        obj = {"id": "H", "prototype": "poly_extrude", "geom": {"kind": "solid", "footprint": Polygon(subject)}}
+        self.assertEqual(resolve_feature_segment(obj, "face:front"), ((70.0, -10.0), (100.0, -10.0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
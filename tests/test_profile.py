@@ -0,0 +1,112 @@
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from engine.profile import Profiler
+from engine.registry import load_registries
+from engine.run import run_scene
+
+REPO = Path(__file__).resolve().parents[1]
+CASES = REPO / "scene_tests" / "cases"
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+
+    def _scene(self, name):
+        return json.loads((CASES / name).read_text(encoding="utf-8"))
+
+    def test_report_covers_stages_operators_and_resolvers(self):
+        scene = self._scene("distribute_evenly_between_constraints.scene.json")
+        plain_scad, _ = run_scene(scene, self.regs)
+
+        profiler = Profiler()
+        timings = {}
+        scad, resolved = run_scene(scene, self.regs, timings, profiler=profiler)
+        self.assertEqual(scad, plain_scad)
+        self.assertEqual(set(timings), {"compile", "build", "emit"})
+
+        report = profiler.report(top_n=2)
+        json.dumps(report)
+        self.assertEqual(set(report["stages"]), {"compile", "build", "emit"})
+        for stage in report["stages"].values():
+            self.assertGreaterEqual(stage["wall_ms"], 0.0)
+            self.assertGreaterEqual(stage["cpu_ms"], 0.0)
+
+        self.assertEqual([(r["index"], r["id"], r["op"]) for r in report["operators"]],
+                         [(0, "op#0", "distribute_evenly_between")])
+        self.assertEqual(report["operators_by_type"]["distribute_evenly_between"]["calls"], 1)
+        self.assertEqual(sum(r["calls"] for r in report["resolvers"].values()), len(resolved["objects"]))
+        self.assertEqual(len(report["top_objects"]), 2)
+        walls = [o["wall_ms"] for o in report["top_objects"]]
+        self.assertEqual(walls, sorted(walls, reverse=True))
+
+    def test_reports_clip_paths(self):
+        scene = json.loads((REPO / "examples" / "scene_example.json").read_text(encoding="utf-8"))
+        profiler = Profiler()
+        run_scene(scene, self.regs, profiler=profiler)
+        paths = profiler.report()["counters"]["clip_paths"]
+        self.assertEqual(set(paths), {"inside", "outside", "clipped"})
+        clips = sum(len(op.get("target_ids", [])) for op in scene["operators"] if op["op"] == "clip_to_object")
+        self.assertEqual(sum(paths.values()), clips)
+
+    def test_profiling_bypasses_cache(self):
+        from engine.cache import ArtifactCache
+
+        scene = self._scene("rect_solid_constraints.scene.json")
+        with tempfile.TemporaryDirectory() as td:
+            cache = ArtifactCache(td)
+            run_scene(scene, self.regs, cache=cache)
+            profiler = Profiler()
+            run_scene(scene, self.regs, cache=cache, profiler=profiler)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            self.assertIn("build", profiler.report()["stages"])
+
+    def test_memory_mode_reports_peaks_and_sites(self):
+        import tracemalloc
+
+        from benchmarks.generate import generate_scene
+
+        scene = generate_scene(40, seed=2)
+        profiler = Profiler(memory=True, top_sites=3)
+        _scad, resolved = run_scene(scene, self.regs, profiler=profiler)
+        report = profiler.report(top_n=2)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        mem = report["memory"]
+        self.assertEqual(set(mem["stages"]), {"compile", "build", "emit"})
+        build = mem["stages"]["build"]
+        # The resolved objects are still alive, so build retains memory and peaks at least as high.
+        self.assertGreater(build["retained_kb"], 0)
+        self.assertGreaterEqual(build["peak_kb"], build["retained_kb"])
+        self.assertEqual(mem["peak_kb"], max(s["peak_kb"] for s in mem["stages"].values()))
+        # Operators nest inside build, so none can exceed its peak.
+        self.assertTrue(all(r["peak_kb"] <= build["peak_kb"] for r in report["operators"]))
+        self.assertEqual(len(mem["top_operators"]), 2)
+        self.assertEqual(len(mem["top_allocation_sites"]), 3)
+        self.assertTrue(all("engine" in s["site"] for s in mem["top_allocation_sites"]))
+        del resolved
+
+    def test_cli_writes_report(self):
+        with tempfile.TemporaryDirectory() as td:
+            out = Path(td) / "out.scad"
+            report_path = Path(td) / "profile.json"
+            subprocess.run(
+                [sys.executable, "-m", "engine.run", str(CASES / "clip_to_object_constraints.scene.json"), str(out),
+                 "--profile", str(report_path), "--profile-top", "1", "--profile-memory"],
+                cwd=str(REPO), check=True, capture_output=True,
+            )
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+            self.assertTrue(out.exists())
+            self.assertEqual(report["operators"][0]["op"], "clip_to_object")
+            self.assertEqual(len(report["top_objects"]), 1)
+            self.assertIn("peak_kb", report["operators"][0])
+            self.assertEqual(len(report["memory"]["top_allocation_sites"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from engine.registry import SNAPSHOT_RELPATH, load_registries, lumber_profile_aliases
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+class TestRegistrySnapshot(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.root = Path(self._td.name)
+        shutil.copytree(REPO / "registry", self.root / "registry")
+        self.snapshot = self.root / SNAPSHOT_RELPATH
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def test_snapshot_matches_json_and_is_reused(self):
+        direct = load_registries(self.root, use_snapshot=False)
+        first = load_registries(self.root)
+        self.assertTrue(self.snapshot.exists())
+        self.assertEqual(first, direct)
+
+        # A valid snapshot is served without re-parsing the JSON files.
+        import engine.registry as registry_mod
+
+        orig = registry_mod._compile_registries
+        registry_mod._compile_registries = lambda reg_dir: self.fail("snapshot was not reused")
+        try:
+            self.assertEqual(load_registries(self.root), direct)
+            # Touching a file without changing content is resolved by the hash check.
+            os.utime(self.root / "registry" / "operators.json", ns=(1, 1))
+            self.assertEqual(load_registries(self.root), direct)
+        finally:
+            registry_mod._compile_registries = orig
+
+    def test_content_change_invalidates(self):
+        load_registries(self.root)
+        path = self.root / "registry" / "lumber_profiles.json"
+        table = json.loads(path.read_text(encoding="utf-8"))
+        table["S4S:2x8"] = {"actual": [1.5, 7.25]}
+        path.write_text(json.dumps(table), encoding="utf-8")
+
+        regs = load_registries(self.root)
+        self.assertEqual(regs["lumber_profiles"]["S4S:2x8"]["actual"], [1.5, 7.25])
+        self.assertEqual(regs["lumber_profile_aliases"]["2x8"], "S4S:2x8")
+
+    def test_unreadable_snapshot_falls_back(self):
+        self.snapshot.parent.mkdir(parents=True, exist_ok=True)
+        self.snapshot.write_bytes(b"not a snapshot")
+        self.assertEqual(load_registries(self.root), load_registries(self.root, use_snapshot=False))
+
+    def test_resolver_signature_change_is_picked_up(self):
+        # Only registry JSON is fingerprinted, so nothing derived from resolver
+        # sources may be stored in the snapshot.
+        path = self.root / "registry" / "prototypes.json"
+        table = json.loads(path.read_text(encoding="utf-8"))
+        table.append({"name": "probe", "resolver": "probe_resolver.resolve"})
+        path.write_text(json.dumps(table), encoding="utf-8")
+        module = self.root / "probe_resolver.py"
+        code = (
+            "from pathlib import Path; from engine.registry import load_registries; "
+            "from engine.scene import _call_resolver, _import_attr; "
+            f"regs = load_registries(Path({str(self.root)!r})); "
+            "print(_call_resolver(_import_attr(regs['prototypes']['probe']['resolver']), {}, regs))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(self.root), str(REPO)]), PYTHONDONTWRITEBYTECODE="1")
+
+        def run():
+            out = subprocess.run([sys.executable, "-c", code], cwd=str(REPO), env=env,
+                                 capture_output=True, text=True, check=True)
+            return out.stdout.strip()
+
+        module.write_text("def resolve(params):\n    return 'one'\n", encoding="utf-8")
+        self.assertEqual(run(), "one")
+        module.write_text("def resolve(params, registries):\n    return sorted(registries)[0]\n", encoding="utf-8")
+        self.assertEqual(run(), "lumber_profile_aliases")
+        self.assertTrue(self.snapshot.exists())
+        self.assertNotIn("resolver_arity", load_registries(self.root)["prototypes"]["probe"])
+
+    def test_building_snapshot_does_not_import_prototypes(self):
+        code = (
+            "import sys; from pathlib import Path; from engine.registry import load_registries; "
+            f"load_registries(Path({str(self.root)!r})); "
+            "print(sorted(m for m in sys.modules if m.startswith('engine.prototypes.')))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], cwd=str(REPO), capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "[]")
+        self.assertTrue(self.snapshot.exists())
+
+    def test_lumber_profile_aliases(self):
+        table = {"S4S:2x6": {}, "joist:2x10": {}, "2x4": {}, "S4S:2x4": {}}
+        self.assertEqual(
+            lumber_profile_aliases(table),
+            {"S4S:2x6": "S4S:2x6", "2x6": "S4S:2x6", "joist:2x10": "joist:2x10", "2x4": "2x4", "S4S:2x4": "S4S:2x4"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import contextlib
+import io
+import json
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.distribution import distribution_scene
+from engine.cache import ArtifactCache
+from engine.registry import load_registries
+from engine.run import main as run_main, run_scene
+from engine.scad import emit_scad
+from engine.scene import build_scene
+from helpers import post
+
+REPO = Path(__file__).resolve().parents[1]
+
+_LITERAL = re.compile(r"^  translate\(\[0,0,(\S+)\]\) linear_extrude\(height=(\S+)\) polygon\(points=\[(.*)\]\);$")
+_MODULE = re.compile(r"^module (\w+)\(\) translate\(\[0,0,(\S+)\]\) linear_extrude\(height=(\S+)\) polygon\(points=\[(.*)\]\);$")
+_USE = re.compile(r"^  translate\(\[(\S+), (\S+), 0\]\) (\w+)\(\);$")
+_POINT = re.compile(r"\[(-?\d+\.\d{6}), (-?\d+\.\d{6})\]")
+
+
+def _micros(s):
+    return int(s.replace(".", ""))
+
+
+def _solids(scad):
+    """Solid lines of an emitted file as (z_base, height, [(x, y) in millionths]), modules expanded."""
+    modules = {}
+    out = []
+    for line in scad.splitlines():
+        m = _MODULE.match(line)
+        if m:
+            pts = [(_micros(x), _micros(y)) for x, y in _POINT.findall(m.group(4))]
+            modules[m.group(1)] = (m.group(2), m.group(3), pts)
+            continue
+        m = _LITERAL.match(line)
+        if m:
+            out.append((m.group(1), m.group(2), [(_micros(x), _micros(y)) for x, y in _POINT.findall(m.group(3))]))
+            continue
+        m = _USE.match(line)
+        if m:
+            z0, h, pts = modules[m.group(3)]
+            dx, dy = _micros(m.group(1)), _micros(m.group(2))
+            out.append((z0, h, [(x + dx, y + dy) for x, y in pts]))
+    return out
+
+
+class TestScadInstancing(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+
+    def test_default_output_is_literal(self):
+        resolved = build_scene(distribution_scene(20), self.regs)
+        scad = emit_scad(resolved)
+        self.assertEqual(scad, emit_scad(resolved, instancing=False))
+        self.assertNotIn("module ", scad)
+
+    def test_instances_share_one_module_with_identical_vertices(self):
+        resolved = build_scene(distribution_scene(200), self.regs)
+        literal = emit_scad(resolved)
+        instanced = emit_scad(resolved, instancing=True)
+        # One module for the members, one for the two anchor posts.
+        self.assertEqual(instanced.count("module "), 2)
+        self.assertLess(len(instanced), len(literal) // 2)
+        self.assertEqual(_solids(instanced), _solids(literal))
+
+    def test_changed_instances_fall_back_to_literal(self):
+        scene = {
+            "anchor_id": "A",
+            "objects": [
+                post("A", 0), post("B", 100), post("Cut", 30),
+                {"id": "T", "role": "template", "prototype": "dim_lumber_member",
+                 "params": {"profile": {"id": "2x4"}, "placement": {"direction": "north", "length": 10}}},
+            ],
+            "operators": [
+                {"op": "distribute_evenly_between", "template_object_id": "T", "between_object_ids": ["A", "B"],
+                 "count": 9, "id_prefix": "S"},
+                {"op": "clip_to_object", "clip_object_id": "A", "target_ids": ["S2"]},
+                {"op": "extend_and_trim_to_object", "source_object_id": "S3", "target_object_id": "Cut",
+                 "source_edge": [0, 1], "direction": [0, 1]},
+            ],
+        }
+        resolved = build_scene(scene, self.regs)
+        instanced = emit_scad(resolved, instancing=True)
+        self.assertEqual(_solids(instanced), _solids(emit_scad(resolved)))
+        # The three posts share one module, the untouched members another.
+        self.assertEqual(instanced.count("module "), 2)
+        uses = [line for line in instanced.splitlines() if _USE.match(line)]
+        self.assertEqual(len(uses), 3 + 7)
+
+    def test_lazy_objects(self):
+        scene = distribution_scene(50)
+        eager = build_scene(scene, self.regs)
+        lazy = build_scene(scene, self.regs, lazy_arrays=True)
+        self.assertEqual(emit_scad(lazy, instancing=True), emit_scad(eager, instancing=True))
+
+
+class TestRunInstancedScad(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+        self.scene = distribution_scene(20)
+        self.instanced = emit_scad(build_scene(self.scene, self.regs), instancing=True)
+
+    def test_run_scene_option(self):
+        scad, _resolved = run_scene(self.scene, self.regs, instancing=True)
+        self.assertEqual(scad, self.instanced)
+        with tempfile.TemporaryDirectory() as td:
+            cache = ArtifactCache(td)
+            self.assertNotEqual(cache.key_for(self.scene, self.regs, {"instancing": True}),
+                                cache.key_for(self.scene, self.regs))
+            # The same scene through one cache yields each run's own output.
+            literal, _ = run_scene(self.scene, self.regs, cache=cache)
+            cached, _ = run_scene(self.scene, self.regs, cache=cache, instancing=True)
+            self.assertEqual(cached, self.instanced)
+            self.assertNotEqual(literal, self.instanced)
+
+    def test_cli_flag(self):
+        with tempfile.TemporaryDirectory() as td:
+            scene_path = Path(td) / "dist.json"
+            scene_path.write_text(json.dumps(self.scene), encoding="utf-8")
+            out = Path(td) / "out.scad"
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_main([str(scene_path), str(out), "--instanced-scad", "--cache-dir", str(Path(td) / "cache")])
+            self.assertEqual(out.read_text(encoding="utf-8"), self.instanced)
+
+
+if __name__ == "__main__":
+    unittest.main()
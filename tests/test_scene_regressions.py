@@ -1,19 +1,67 @@
+import contextlib
+import io
+import re
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parents[1]
 
 
 class TestSceneRegressions(unittest.TestCase):
     def test_scene_cases_match_golden_and_assertions(self):
         # This wraps the existing scene_tests runner so it is enforced in CI.
         # The runner:
-        #   - generates SCAD outputs into ./tmp/scene_tests_out
-        #   - compares against scene_tests/golden/*.scad
-        #   - writes resolved scene JSON alongside the SCAD
+        #   - generates SCAD outputs in memory and compares against scene_tests/golden/*.scad
+        #   - writes outputs (SCAD + resolved scene JSON) to ./tmp/scene_tests_out for failures
         #   - runs per-scene assertions from scene_tests/assertions/*.py
         from scene_tests.run_all import main as run_all
 
         rc = run_all([])
         self.assertEqual(rc, 0, "scene_tests.run_all reported failures")
 
+    def test_parallel_run_is_deterministic_and_writes_only_failures(self):
+        from scene_tests.run_all import main as run_all
+
+        with tempfile.TemporaryDirectory() as td:
+            golden = Path(td) / "golden"
+            outdir = Path(td) / "out"
+            shutil.copytree(REPO / "scene_tests" / "golden", golden)
+            (golden / "rect_solid_constraints.scad").write_text("// stale\n", encoding="utf-8")
+
+            outputs = []
+            for jobs in ("1", "3"):
+                buf = io.StringIO()
+                with contextlib.redirect_stdout(buf):
+                    rc = run_all(["--golden", str(golden), "--outdir", str(outdir), "--jobs", jobs, "--slowest", "0"])
+                self.assertEqual(rc, 1)
+                outputs.append(re.sub(r" \([0-9.]+ ms\)", "", buf.getvalue()))
+
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertIn("[FAIL] rect_solid_constraints.scene.json", outputs[0])
+            self.assertEqual(
+                sorted(p.name for p in outdir.iterdir()),
+                ["rect_solid_constraints.resolved.json", "rect_solid_constraints.scad"],
+            )
+
+    def test_failed_scene_assertion_writes_outputs(self):
+        from scene_tests import run_all as run_all_mod
+
+        with tempfile.TemporaryDirectory() as td:
+            outdir = Path(td) / "out"
+            buf = io.StringIO()
+            with mock.patch.object(run_all_mod, "_maybe_run_scene_assertions", side_effect=AssertionError("bad sleeper")), \
+                    contextlib.redirect_stdout(buf):
+                rc = run_all_mod.main(["--outdir", str(outdir), "--pattern", "rect_solid_constraints.scene.json"])
+            self.assertEqual(rc, 1)
+            self.assertIn("[FAIL] rect_solid_constraints.scene.json: bad sleeper", buf.getvalue())
+            self.assertEqual(
+                sorted(p.name for p in outdir.iterdir()),
+                ["rect_solid_constraints.resolved.json", "rect_solid_constraints.scad"],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
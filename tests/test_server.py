@@ -0,0 +1,129 @@
+import http.client
+import json
+import os
+import signal
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from engine.registry import load_registries
+from engine.run import run_scene
+from engine.server import PipelineServer, main
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+class TestPipelineServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = PipelineServer(("127.0.0.1", 0), workers=1, timeout_s=30.0)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        host, port = cls.server.server_address[:2]
+        cls.base = f"http://{host}:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _post(self, path: str, body: bytes):
+        req = urllib.request.Request(self.base + path, data=body, method="POST")
+        try:
+            with urllib.request.urlopen(req) as resp:
+                return resp.status, json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_run_returns_scad_and_resolved(self):
+        scene = json.loads((REPO / "scene_tests" / "cases" / "rect_solid_constraints.scene.json").read_text(encoding="utf-8"))
+        status, body = self._post("/run", json.dumps(scene).encode("utf-8"))
+        self.assertEqual(status, 200, body)
+
+        scad, resolved = run_scene(scene, load_registries(REPO))
+        self.assertEqual(body["scad"], scad)
+        self.assertEqual(body["resolved"], json.loads(json.dumps(resolved)))
+
+    def test_pipeline_error_and_bad_json(self):
+        bad_scene = {"anchor_id": "x", "objects": [{"id": "x", "prototype": "nope"}]}
+        status, body = self._post("/run", json.dumps(bad_scene).encode("utf-8"))
+        self.assertEqual(status, 422)
+        self.assertIn("Unknown prototype", body["error"])
+
+        status, body = self._post("/run", b"{not json")
+        self.assertEqual(status, 400)
+
+    def test_bad_content_length_returns_400(self):
+        host, port = self.server.server_address[:2]
+        conn = http.client.HTTPConnection(host, port)
+        try:
+            conn.putrequest("POST", "/run")
+            conn.putheader("Content-Length", "lots")
+            conn.endheaders()
+            resp = conn.getresponse()
+            self.assertEqual(resp.status, 400)
+            self.assertIn("Content-Length", json.loads(resp.read())["error"])
+        finally:
+            conn.close()
+
+    def test_dead_worker_returns_503_and_is_replaced(self):
+        pid = self.server._idle.queue[0][1]
+        os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        example = (REPO / "examples" / "scene_example.json").read_bytes()
+        status, body = self._post("/run", example)
+        self.assertEqual(status, 503, body)
+        self.assertIn("worker died", body["error"])
+
+        self.assertNotEqual(self.server._idle.queue[0][1], pid)
+        status, body = self._post("/run", example)
+        self.assertEqual(status, 200, body)
+
+    def test_refuses_non_loopback_host(self):
+        with self.assertRaises(SystemExit):
+            main(["--host", "0.0.0.0"])
+
+    def test_health_reports_stats(self):
+        with urllib.request.urlopen(self.base + "/health") as resp:
+            body = json.loads(resp.read())
+        self.assertEqual(body["status"], "ok")
+        self.assertEqual(body["workers"], 1)
+        for key in ("requests", "ok", "errors", "timeouts", "rejected", "in_flight", "mean_ms"):
+            self.assertIn(key, body["stats"])
+
+    def test_timeout_returns_504(self):
+        # A large distribution keeps the worker busy well past the (tiny) timeout.
+        scene = {
+            "anchor_id": "a",
+            "objects": [
+                {"id": "a", "prototype": "poly_extrude",
+                 "params": {"footprint": [[0, 0], [1, 0], [1, 1], [0, 1]], "extrusion": {"z_base": 0, "height": 1}}},
+                {"id": "b", "prototype": "poly_extrude",
+                 "params": {"footprint": [[0, 999], [1, 999], [1, 1000], [0, 1000]], "extrusion": {"z_base": 0, "height": 1}}},
+                {"id": "t", "role": "template", "prototype": "dim_lumber_member",
+                 "params": {"profile": {"actual": [1.5, 3.5]}, "placement": {"direction": "east", "length": 10}}},
+            ],
+            "operators": [
+                {"op": "distribute_evenly_between", "template_object_id": "t",
+                 "between_object_ids": ["a", "b"], "count": 5000},
+            ],
+        }
+        timeout = self.server.timeout_s
+        self.server.timeout_s = 0.01
+        try:
+            status, body = self._post("/run", json.dumps(scene).encode("utf-8"))
+        finally:
+            self.server.timeout_s = timeout
+        self.assertEqual(status, 504)
+        self.assertFalse(body["ok"])
+
+        # The slow job's worker was replaced, so the single lane serves the next request.
+        self.assertEqual(self.server.stats()["in_flight"], 0)
+        example = (REPO / "examples" / "scene_example.json").read_bytes()
+        status, body = self._post("/run", example)
+        self.assertEqual(status, 200, body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import unittest
+from pathlib import Path
+
+from benchmarks.distribution import distribution_scene
+from engine.profile import Profiler
+from engine.prototypes import dim_lumber_member
+from engine.registry import load_registries
+from engine.scene import ShapeCache, _resolve_object, build_scene
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+class TestShapeCache(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+
+    def test_instances_match_direct_resolve(self):
+        objects = build_scene(distribution_scene(7), self.regs)["objects"]
+        for i in range(1, 8):
+            inst = objects[f"S{i}"]
+            direct = dim_lumber_member.resolve(inst["params"], self.regs)
+            self.assertEqual(json.dumps(inst["geom"]), json.dumps(direct))
+
+    def test_place_shape_is_bit_identical(self):
+        for direction in ("east", "northwest", "south", "southeast"):
+            for wide_face in ("down", "side"):
+                params = {
+                    "profile": {"id": "2x6"},
+                    "orientation": {"wide_face": wide_face},
+                    "placement": {"start": [0.1, -7.3], "direction": direction, "length": 33.3},
+                }
+                shape = dim_lumber_member.resolve_shape(params, self.regs)
+                for start in ([0.1, -7.3], [1e3 / 3, 2.0 / 7], [-55.5, 0.0]):
+                    p = dict(params, placement=dict(params["placement"], start=start))
+                    self.assertEqual(
+                        json.dumps(dim_lumber_member.place_shape(shape, p)),
+                        json.dumps(dim_lumber_member.resolve(p, self.regs)),
+                    )
+
+    def test_counts_hits_and_misses(self):
+        scene = distribution_scene(3)
+        template = scene["objects"][2]
+        cache = ShapeCache()
+        for x in (1.0, 2.0, 3.0):
+            inst = {**template, "params": {**template["params"],
+                    "placement": {**template["params"]["placement"], "start": [x, 0.0]}}}
+            _resolve_object(inst, self.regs, shapes=cache)
+        self.assertEqual((cache.misses, cache.hits, len(cache)), (1, 2, 1))
+
+    def test_bounded(self):
+        cache = ShapeCache(max_entries=2)
+        for length in (10, 20, 30, 10):
+            params = {"profile": {"id": "2x4"}, "placement": {"start": [0, 0], "direction": "east", "length": length}}
+            _resolve_object({"id": "X", "prototype": "dim_lumber_member", "params": params}, self.regs, shapes=cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.misses, cache.hits), (4, 0))
+
+    def test_profiler_reports_cache(self):
+        profiler = Profiler()
+        build_scene(distribution_scene(5), self.regs, profiler)
+        stats = profiler.report()["caches"]["resolver_shapes"]
+        self.assertEqual(stats, {"hits": 4, "misses": 1, "entries": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
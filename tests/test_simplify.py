@@ -0,0 +1,158 @@
+import contextlib
+import io
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from engine.cache import ArtifactCache
+from engine.geom import clip_convex, counting, signed_area, simplify_polygon
+from engine.profile import Profiler
+from engine.registry import load_registries
+from engine.run import main as run_main, run_scene
+from engine.scad import emit_scad
+from engine.scene import build_scene
+
+REPO = Path(__file__).resolve().parents[1]
+
+SQUARE = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+# Its edge runs through two of the square's vertices, so clipping repeats them.
+DIAGONAL = [(-20.0, -20.0), (30.0, -20.0), (-20.0, 30.0)]
+
+
+def _solid(obj_id, footprint):
+    return {"id": obj_id, "prototype": "poly_extrude",
+            "params": {"footprint": [list(p) for p in footprint], "extrusion": {"z_base": 0, "height": 1}}}
+
+
+def _scene():
+    return {
+        "anchor_id": "T",
+        "objects": [
+            _solid("T", SQUARE),
+            _solid("D", DIAGONAL),
+            _solid("H", [(-20.0, -20.0), (5.0, -20.0), (5.0, 30.0), (-20.0, 30.0)]),
+            _solid("Thin", [(0.0, 0.0), (40.0, 0.0), (40.0, 20.0), (0.0, 20.0)]),
+            _solid("Edge", [(-1.0, -1.0), (41.0, -1.0), (41.0, 1e-8), (-1.0, 1e-8)]),
+        ],
+        "operators": [
+            {"op": "clip_to_object", "clip_object_id": "D", "target_ids": ["T"]},
+            {"op": "clip_to_object", "clip_object_id": "H", "target_ids": ["T"]},
+            {"op": "clip_to_object", "clip_object_id": "Edge", "target_ids": ["Thin"]},
+        ],
+    }
+
+
+class TestSimplifyPolygon(unittest.TestCase):
+    def test_removes_duplicates_and_collinear_points(self):
+        self.assertEqual(simplify_polygon(clip_convex(SQUARE, DIAGONAL)), [(0.0, 0.0), (10.0, 0.0), (0.0, 10.0)])
+        self.assertEqual(
+            simplify_polygon([(0, 0), (5, 0), (10, 0), (10, 5), (10, 10), (0, 10), (0, 10 + 1e-9)]),
+            [(0, 0), (10, 0), (10, 10), (0, 10.000000001)],
+        )
+
+    def test_removes_spikes_and_slivers(self):
+        spiked = [(0, 0), (10, 0), (20, 0), (10, 0), (10, 10), (0, 10)]
+        self.assertEqual(len(simplify_polygon(spiked)), 4)
+        self.assertEqual(simplify_polygon([(0, 0), (10, 0), (10, 1e-8)]), [])
+        self.assertEqual(simplify_polygon([(0, 0), (10, 0), (20, 0), (5, 0)]), [])
+
+    def test_clean_polygons_are_unchanged(self):
+        for poly in (SQUARE, SQUARE[::-1], [(0, 0), (1, 0), (1, 1)], [], [(1, 1), (2, 2)]):
+            self.assertEqual(simplify_polygon(poly), list(poly))
+        tiny = [(0.0, 0.0), (1e-3, 0.0), (1e-3, 1e-3)]
+        self.assertEqual(simplify_polygon(tiny), tiny)
+
+    def test_counts_removals(self):
+        with counting() as counts:
+            simplify_polygon(clip_convex(SQUARE, DIAGONAL))
+            simplify_polygon([(0, 0), (10, 0), (10, 1e-8)])
+        simplify_polygon([(0, 0), (10, 0), (10, 1e-8)])
+        self.assertEqual(counts["simplify"], {"vertices_removed": 2 + 3, "slivers_removed": 1})
+
+    def test_counts_stay_with_their_thread(self):
+        def simplify_in_thread():
+            with counting() as counts:
+                started.set()
+                done.wait(5)
+                simplify_polygon([(0, 0), (10, 0), (10, 1e-8)])
+            results.append(counts["simplify"])
+
+        started, done, results = threading.Event(), threading.Event(), []
+        worker = threading.Thread(target=simplify_in_thread)
+        with counting() as counts:
+            worker.start()
+            started.wait(5)
+            simplify_polygon(clip_convex(SQUARE, DIAGONAL))
+            done.set()
+            worker.join()
+        self.assertEqual(counts["simplify"], {"vertices_removed": 2, "slivers_removed": 0})
+        self.assertEqual(results, [{"vertices_removed": 3, "slivers_removed": 1}])
+
+
+class TestBuildSceneSimplify(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+        self.scene = _scene()
+
+    def test_default_keeps_clip_output(self):
+        objects = build_scene(self.scene, self.regs)["objects"]
+        self.assertEqual(len(objects["T"]["geom"]["footprint"]), 5)
+
+    def test_chained_clips_stay_simplified(self):
+        plain = build_scene(self.scene, self.regs)["objects"]
+        objects = build_scene(self.scene, self.regs, simplify=True)["objects"]
+        self.assertEqual(objects["T"]["geom"]["footprint"], [[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 10.0]])
+        self.assertAlmostEqual(signed_area(objects["T"]["geom"]["footprint"]),
+                               signed_area(plain["T"]["geom"]["footprint"]))
+        # A clip leaving a 1e-8 wide strip becomes an empty footprint.
+        self.assertEqual(objects["Thin"]["geom"]["footprint"], [])
+        # Clippers and untouched objects are the same objects either way.
+        self.assertEqual(objects["D"], plain["D"])
+        self.assertLess(len(emit_scad({"objects": objects})), len(emit_scad({"objects": plain})))
+
+    def test_profiler_reports_removals(self):
+        profiler = Profiler()
+        build_scene(self.scene, self.regs, profiler=profiler, simplify=True)
+        self.assertEqual(profiler.report()["counters"]["simplify"], {"vertices_removed": 2 + 4, "slivers_removed": 1})
+        profiler = Profiler()
+        build_scene(self.scene, self.regs, profiler=profiler)
+        self.assertNotIn("simplify", profiler.report()["counters"])
+
+
+class TestRunSimplify(unittest.TestCase):
+    def setUp(self):
+        self.regs = load_registries(REPO)
+        self.scene = _scene()
+
+    def test_run_scene_option(self):
+        expected = build_scene(self.scene, self.regs, simplify=True)
+        scad, resolved = run_scene(self.scene, self.regs, simplify=True)
+        self.assertEqual(resolved, expected)
+        self.assertEqual(scad, emit_scad(expected))
+        with tempfile.TemporaryDirectory() as td:
+            cache = ArtifactCache(td)
+            self.assertNotEqual(cache.key_for(self.scene, self.regs, {"simplify": True}),
+                                cache.key_for(self.scene, self.regs))
+            plain, _ = run_scene(self.scene, self.regs, cache=cache)
+            cached, _ = run_scene(self.scene, self.regs, cache=cache, simplify=True)
+            self.assertEqual(cached, scad)
+            self.assertNotEqual(plain, scad)
+
+    def test_cli_flag(self):
+        with tempfile.TemporaryDirectory() as td:
+            scene_path = Path(td) / "scene.json"
+            scene_path.write_text(json.dumps(self.scene), encoding="utf-8")
+            out = Path(td) / "out.scad"
+            profile = Path(td) / "profile.json"
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_main([str(scene_path), str(out), "--simplify", "--no-cache"])
+                self.assertEqual(out.read_text(encoding="utf-8"), emit_scad(build_scene(self.scene, self.regs, simplify=True)))
+                run_main([str(scene_path), str(out), "--simplify", "--profile", str(profile)])
+            counters = json.loads(profile.read_text(encoding="utf-8"))["counters"]
+            self.assertEqual(counters["simplify"], {"vertices_removed": 2 + 4, "slivers_removed": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import json
+import math
+import random
+import unittest
+from pathlib import Path
+
+from engine.geom import first_ray_polygon_hit
+from engine.operators import with_geom
+from engine.registry import load_registries
+from engine.scene import IndexedObjects, build_scene
+from engine.spatial import SpatialIndex, footprint_bbox, index_of
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _solid(oid, x, y, w, h):
+    return {"id": oid, "geom": {"kind": "solid", "footprint": [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]}}
+
+
+def _random_objects(n, seed=0):
+    rng = random.Random(seed)
+    objects = IndexedObjects()
+    for i in range(n):
+        objects[f"O{i}"] = _solid(f"O{i}", rng.uniform(-100, 100), rng.uniform(-100, 100),
+                                  rng.uniform(0.5, 20), rng.uniform(0.5, 20))
+    objects["Big"] = _solid("Big", -500, -500, 1000, 3)   # spans many cells
+    objects["Label"] = {"id": "Label", "geom": {"kind": "text"}}  # no footprint
+    return objects
+
+
+def _brute_query(objects, box):
+    out = []
+    for oid, obj in objects.items():
+        b = footprint_bbox(obj["geom"].get("footprint"))
+        if b and b[0] <= box[2] and box[0] <= b[2] and b[1] <= box[3] and box[1] <= b[3]:
+            out.append(oid)
+    return out
+
+
+def _brute_ray(objects, origin, direction):
+    best = None
+    for oid, obj in objects.items():
+        fp = obj["geom"].get("footprint")
+        if not fp:
+            continue
+        hit, t, p = first_ray_polygon_hit(origin, direction, [(float(x), float(y)) for x, y in fp])
+        if hit and (best is None or t < best[1]):
+            best = (oid, t, p)
+    return best
+
+
+def _random_ray(rng):
+    a = rng.uniform(0, 2 * math.pi)
+    return (rng.uniform(-150, 150), rng.uniform(-150, 150)), (math.cos(a), math.sin(a))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def test_bbox_matches_footprint(self):
+        objects = _random_objects(50)
+        for oid, obj in objects.items():
+            self.assertEqual(objects.spatial.bbox(oid), footprint_bbox(obj["geom"].get("footprint")))
+        self.assertIsNone(objects.spatial.bbox("Label"))
+        self.assertIsNone(objects.spatial.bbox("Missing"))
+
+    def test_query_bbox_matches_brute_force(self):
+        objects = _random_objects(300)
+        rng = random.Random(1)
+        for _ in range(100):
+            x, y = rng.uniform(-120, 120), rng.uniform(-120, 120)
+            box = (x, y, x + rng.uniform(0, 60), y + rng.uniform(0, 60))
+            self.assertEqual(objects.spatial.query_bbox(box), _brute_query(objects, box))
+        self.assertEqual(objects.spatial.query_bbox((-1e4, -1e4, 1e4, 1e4)), _brute_query(objects, (-1e4, -1e4, 1e4, 1e4)))
+
+    def test_nearest_ray_hit_matches_brute_force(self):
+        objects = _random_objects(200, seed=2)
+        rng = random.Random(3)
+        for _ in range(200):
+            origin, direction = _random_ray(rng)
+            self.assertEqual(objects.spatial.nearest_ray_hit(origin, direction), _brute_ray(objects, origin, direction))
+        for direction in ((1, 0), (0, -1)):  # axis-aligned rays
+            self.assertEqual(objects.spatial.nearest_ray_hit((-150, 1), direction),
+                             _brute_ray(objects, (-150, 1), direction))
+
+    def test_queries_follow_replacement_and_deletion(self):
+        objects = _random_objects(300, seed=4)
+        index = objects.spatial
+        rng = random.Random(5)
+        index.query_bbox((0, 0, 1, 1))  # builds the grid
+        for step in range(60):
+            oid = f"O{rng.randrange(300)}"
+            if step % 3 == 0 and oid in objects:
+                del objects[oid]
+            else:
+                objects[oid] = _solid(oid, rng.uniform(-100, 100), rng.uniform(-100, 100), rng.uniform(0.5, 20), 2)
+            x, y = rng.uniform(-120, 120), rng.uniform(-120, 120)
+            box = (x, y, x + 40, y + 40)
+            self.assertEqual(index.query_bbox(box), _brute_query(objects, box))
+            origin, direction = _random_ray(rng)
+            self.assertEqual(index.nearest_ray_hit(origin, direction), _brute_ray(objects, origin, direction))
+
+    def test_index_follows_replacement_and_deletion(self):
+        objects = _random_objects(50)
+        index = objects.spatial
+        self.assertIn("O3", index.query_bbox(index.bbox("O3")))
+        objects["O3"] = with_geom(objects["O3"], footprint=[[900, 900], [901, 900], [901, 901]])
+        self.assertEqual(index.bbox("O3"), (900.0, 900.0, 901.0, 901.0))
+        self.assertEqual(index.query_bbox((899, 899, 902, 902)), ["O3"])
+        del objects["O3"]
+        self.assertIsNone(index.bbox("O3"))
+        self.assertEqual(index.query_bbox((899, 899, 902, 902)), [])
+        objects["New"] = _solid("New", 0, 0, 1, 1)
+        self.assertEqual(index.bbox("New"), (0.0, 0.0, 1.0, 1.0))
+        self.assertIn("New", index.query_bbox((0.5, 0.5, 0.6, 0.6)))
+        objects["O3"] = _solid("O3", 0, 0, 1, 1)  # back, at the end of the map
+        self.assertEqual(index.query_bbox((0.5, 0.5, 0.6, 0.6))[-2:], ["New", "O3"])
+
+    def test_nearest_ray_hit_filters(self):
+        objects = IndexedObjects(A=_solid("A", 10, -1, 2, 2), B=_solid("B", 20, -1, 2, 2))
+        self.assertEqual(objects.spatial.nearest_ray_hit((0, 0), (1, 0))[0], "A")
+        self.assertEqual(objects.spatial.nearest_ray_hit((0, 0), (1, 0), exclude={"A"})[0], "B")
+        self.assertEqual(objects.spatial.nearest_ray_hit((0, 0), (1, 0), ids={"B"})[0], "B")
+        self.assertIsNone(objects.spatial.nearest_ray_hit((0, 0), (-1, 0)))
+
+    def test_polygon_cached_until_replaced(self):
+        objects = _random_objects(5)
+        index = objects.spatial
+        poly = index.polygon("O1")
+        self.assertIs(index.polygon("O1"), poly)
+        self.assertEqual(poly.bbox, index.bbox("O1"))
+        self.assertIs(poly.prepared, poly.prepared)
+        objects["O1"] = with_geom(objects["O1"], footprint=[[0, 0], [2, 0], [2, 2]])
+        self.assertEqual(list(index.polygon("O1")), [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0)])
+        self.assertIsNone(index.polygon("Label"))
+
+    def test_index_of_plain_dict(self):
+        objects = {"A": _solid("A", 0, 0, 1, 1)}
+        self.assertIsInstance(index_of(objects), SpatialIndex)
+        self.assertEqual(index_of(objects).bbox("A"), (0.0, 0.0, 1.0, 1.0))
+        self.assertEqual(index_of(objects).query_bbox((0, 0, 2, 2)), ["A"])
+
+    def test_build_scene_returns_plain_dict(self):
+        scene = json.loads((REPO / "examples" / "scene_example.json").read_text(encoding="utf-8"))
+        objects = build_scene(scene, load_registries(REPO))["objects"]
+        self.assertIs(type(objects), dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from benchmarks.startup import load_budget, measure
+
+
+class TestStartupBudget(unittest.TestCase):
+    def test_cli_loads_only_what_the_scene_needs(self):
+        # Timings are machine- and load-dependent; `python -m benchmarks.startup`
+        # checks them. Which modules load is deterministic.
+        budget = load_budget()
+        loaded = set(measure(budget["scene"], runs=1)["engine_modules"])
+        self.assertEqual(sorted(loaded & set(budget["forbidden_modules"])), [])
+        self.assertIn("engine.operators.clip_to_object", loaded)
+        for mod in ("engine.run", "engine.scene", "engine.scad"):
+            self.assertNotIn(mod, budget["forbidden_modules"])
+
+    def test_cli_time_to_first_output_within_budget(self):
+        # Best of several launches; the recorded budget already carries
+        # RECORD_HEADROOM over the machine it was recorded on.
+        budget = load_budget()
+        m = measure(budget["scene"], runs=5)
+        self.assertLessEqual(m["time_to_first_output_ms"], budget["time_to_first_output_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
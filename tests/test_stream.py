@@ -0,0 +1,53 @@
+import io
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from engine.registry import load_registries
+from engine.run import run_scene
+from engine.stream import run_stream
+
+REPO = Path(__file__).resolve().parents[1]
+CASES = REPO / "scene_tests" / "cases"
+
+
+class TestJsonlStream(unittest.TestCase):
+    def test_one_record_per_scene_in_order(self):
+        regs = load_registries(REPO)
+        good = json.loads((CASES / "hearth_sleeper_constraints.scene.json").read_text(encoding="utf-8"))
+        bad = {"anchor_id": "x", "objects": [{"id": "x", "prototype": "nope"}]}
+        lines = [json.dumps(good), "", json.dumps(bad), "not json", json.dumps(good)]
+
+        out = io.StringIO()
+        failed = run_stream(io.StringIO("\n".join(lines) + "\n"), out, registries=regs)
+        records = [json.loads(l) for l in out.getvalue().splitlines()]
+
+        self.assertEqual(failed, 2)
+        self.assertEqual([r["index"] for r in records], [0, 1, 2, 3])
+        self.assertEqual([r["ok"] for r in records], [True, False, False, True])
+        self.assertIn("Unknown prototype", records[1]["error"])
+
+        scad, _resolved = run_scene(good, regs)
+        self.assertEqual(records[0]["scad"], scad)
+        self.assertIn("objects", records[0]["resolved"])
+        for stage in ("parse", "compile", "build", "emit", "total"):
+            self.assertIn(stage, records[0]["timings_ms"])
+
+    def test_cli_pipe(self):
+        scene = (REPO / "examples" / "scene_example.json").read_text(encoding="utf-8")
+        payload = json.dumps(json.loads(scene)) + "\n"
+        proc = subprocess.run(
+            [sys.executable, "-m", "engine.run", "--jsonl"],
+            cwd=str(REPO), input=payload * 3, capture_output=True, text=True,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        records = [json.loads(l) for l in proc.stdout.splitlines()]
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all(r["ok"] for r in records))
+        self.assertIn("linear_extrude", records[2]["scad"])
+
+
+if __name__ == "__main__":
+    unittest.main()
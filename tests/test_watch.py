@@ -0,0 +1,91 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from engine.watch import watch
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+class TestWatchMode(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.root = Path(self._td.name)
+        shutil.copytree(REPO / "registry", self.root / "registry")
+        self.scene_path = self.root / "scene.json"
+        self.scene = json.loads((REPO / "examples" / "scene_example.json").read_text(encoding="utf-8"))
+        self.scene_path.write_text(json.dumps(self.scene), encoding="utf-8")
+        self.out_path = self.root / "out.scad"
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def _start(self, **kwargs):
+        self.logs = []
+        self.stop = threading.Event()
+        self.thread = threading.Thread(
+            target=watch,
+            args=(self.scene_path, self.out_path),
+            kwargs=dict(bundle_root=self.root, interval=0.01, debounce=0.05,
+                        should_stop=self.stop.is_set, log=self.logs.append, **kwargs),
+        )
+        self.thread.start()
+        self._wait_for(lambda: len(self.logs) >= 1)
+
+    def _wait_for(self, cond, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if cond():
+                return
+            time.sleep(0.01)
+        self.fail(f"timed out; logs={self.logs}")
+
+    def _finish(self):
+        self.stop.set()
+        self.thread.join(5.0)
+
+    def test_rebuilds_on_content_change_only(self):
+        self._start()
+        try:
+            self.assertIn("[BUILD] initial build", self.logs[0])
+            self.assertIn("build", self.logs[0])
+            before = self.out_path.read_text(encoding="utf-8")
+
+            # Touch without changing content: no rebuild.
+            os.utime(self.scene_path, None)
+            time.sleep(0.2)
+            self.assertEqual(len(self.logs), 1)
+
+            self.scene["objects"][1]["params"]["extrusion"]["height"] = 7
+            self.scene_path.write_text(json.dumps(self.scene), encoding="utf-8")
+            self._wait_for(lambda: len(self.logs) >= 2)
+            self.assertIn("changed: scene.json", self.logs[1])
+            self.assertNotEqual(self.out_path.read_text(encoding="utf-8"), before)
+            self.assertIn("height=7", self.out_path.read_text(encoding="utf-8"))
+        finally:
+            self._finish()
+
+    def test_registry_change_reloads_and_errors_keep_watching(self):
+        self._start()
+        try:
+            protos = self.root / "registry" / "prototypes.json"
+            original = protos.read_text(encoding="utf-8")
+            protos.write_text("[]", encoding="utf-8")
+            self._wait_for(lambda: len(self.logs) >= 2)
+            self.assertIn("[FAIL]", self.logs[1])
+            self.assertIn("Unknown prototype", self.logs[1])
+
+            protos.write_text(original, encoding="utf-8")
+            self._wait_for(lambda: len(self.logs) >= 3)
+            self.assertIn("[BUILD] changed: prototypes.json", self.logs[2])
+        finally:
+            self._finish()
+
+
+if __name__ == "__main__":
+    unittest.main()